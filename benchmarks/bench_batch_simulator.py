@@ -0,0 +1,30 @@
+"""Throughput of simulate_many for different worker counts.
+
+Usage: python benchmarks/bench_batch_simulator.py [n_battles]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.sample_teams import make_team, RED_TEAM
+from ai.batch_simulator import simulate_many
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        stats = simulate_many(RED_TEAM, RED_TEAM, n, workers=workers, team_builder=make_team)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers:2d}: {n / elapsed:8.1f} battles/s ({baseline / elapsed:.1f}x)  {stats}")
+
+
+if __name__ == "__main__":
+    main()
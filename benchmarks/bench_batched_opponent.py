@@ -0,0 +1,56 @@
+"""Self-play env steps per second: each PokemonEnv calling the PPO opponent itself vs BatchedOpponent.
+
+Usage: python benchmarks/bench_batched_opponent.py --envs 1 8 32 128 --steps 2000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from ai.batched_opponent import BatchedOpponent
+from benchmarks.bench_vec_env import SampleTeamEnv
+
+
+def steps_per_second(env, num_envs, steps):
+    rng = np.random.default_rng(0)
+    env.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        env.step(rng.integers(0, 4, size=num_envs))
+    return steps * num_envs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--steps", type=int, default=2000, help="env steps per measurement")
+    args = parser.parse_args()
+
+    random.seed(0)
+    opponent = PPO("MlpPolicy", SampleTeamEnv(), seed=0, device="cpu")
+    for num_envs in args.envs:
+        batches = max(1, args.steps // num_envs)
+        # BattleManager prints its debug trace; keep it out of the results
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            per_env = DummyVecEnv([SampleTeamEnv] * num_envs)
+            per_env.set_attr("opponent_model", opponent)
+            baseline = steps_per_second(per_env, num_envs, batches)
+
+            batched = BatchedOpponent(DummyVecEnv([SampleTeamEnv] * num_envs), opponent_model=opponent)
+            speed = steps_per_second(batched, num_envs, batches)
+        print(f"{num_envs:4d} envs: per-env predict {baseline:8,.0f} steps/s, "
+              f"batched predict {speed:8,.0f} steps/s ({speed / baseline:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
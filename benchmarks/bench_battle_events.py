@@ -0,0 +1,50 @@
+"""Battles per second for the headless engine with nobody listening to its events,
+with a subscriber, and with events rendered to a text log.
+
+Usage: python benchmarks/bench_battle_events.py [n_battles]
+"""
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from benchmarks.sample_teams import make_players
+from models.sim_battle import SimBattle
+
+
+def battles_per_second(n, setup):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for seed in range(n):
+            random.seed(seed)
+            battle = SimBattle(*make_players(), rng=random.Random(seed))
+            setup(battle)
+            battle.run()
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def subscribe(battle):
+    events = []
+    battle.subscribe(events.append)
+
+
+def text_log(battle):
+    battle.text_log = True      # what every battle paid before events
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    logging.disable(logging.INFO)   # measure formatting, not log handlers
+
+    for name, setup in (("no listeners", lambda battle: None), ("subscriber", subscribe), ("text log", text_log)):
+        print(f"{name:13s}: {battles_per_second(n, setup):8.1f} battles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Memory per battle when thousands of 6v6 battles are held at once, and the speed of
+the stat operations every turn goes through.
+
+Usage: python benchmarks/bench_battle_memory.py [n_battles]
+"""
+import gc
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from benchmarks.sample_teams import RED_TEAM, make_pokemon
+from models.battle_state import restore, snapshot
+from models.player import Player
+from models.pokemon import Pokemon
+from models.sim_battle import SimBattle
+
+
+def roster():
+    """One template per species: battles share species data and moves, like the game's loaders"""
+    return {name: make_pokemon(name) for name in RED_TEAM}
+
+
+def fresh(template):
+    return Pokemon(template.name, template.ability, template.base_stats, template.types, template.moves,
+                   template.level, Pokemon.generate_random_iv(), Pokemon.generate_default_ev())
+
+
+def make_battle(templates, seed):
+    return SimBattle(Player("Ash", True, [fresh(templates[n]) for n in RED_TEAM]),
+                     Player("Red", True, [fresh(templates[n]) for n in RED_TEAM]), rng=random.Random(seed))
+
+
+def bytes_per_battle(n):
+    random.seed(0)
+    templates = roster()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    battles = [make_battle(templates, seed) for seed in range(n)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del battles
+    return used / n
+
+
+def ops_per_second(fn, number=200_000):
+    return number / min(timeit.repeat(fn, number=number, repeat=5))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    per_battle = bytes_per_battle(n)
+    print(f"{n} battles held: {per_battle / 1024:6.1f} KiB/battle ({per_battle * n / 2 ** 20:.1f} MiB total)")
+
+    random.seed(1)
+    battle = make_battle(roster(), 1)
+    attacker, defender = battle.player.active_pokemon(), battle.opponent.active_pokemon()
+    stats = attacker.battle_stats
+    move = attacker.moves[0]
+    state = snapshot(battle)
+    cases = (
+        ("get_effective_stat", lambda: stats.get_effective_stat("speed")),
+        ("modify_stat", lambda: stats.modify_stat("attack", 0)),
+        ("has_pp + use_pp", lambda: stats.has_pp(move.name) and stats.use_pp(move.name) or stats.set_pp(move.name, 35)),
+        ("compute_damage", lambda: move.compute_damage(attacker, defender, False)),
+        ("snapshot + restore", lambda: restore(battle, snapshot(battle))),
+    )
+    for name, fn in cases:
+        number = 20_000 if name.startswith("snapshot") else 200_000
+        print(f"{name:>20}: {ops_per_second(fn, number):12,.0f} ops/s")
+    restore(battle, state)
+
+    templates = roster()
+    number = 200
+    elapsed = min(timeit.repeat(lambda: make_battle(templates, 2).run(), number=number, repeat=3))
+    print(f"{'6v6 battles':>20}: {number / elapsed:8.1f} battles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Cost of capturing/rewinding a 6v6 battle: snapshot/restore vs copying the players"""
+import copy
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_players
+from models.battle_state import snapshot, restore
+from models.sim_battle import SimBattle
+
+
+def main():
+    random.seed(0)
+    battle = SimBattle(*make_players())
+    state = snapshot(battle)
+    bare_state = snapshot(battle, rng=False)
+
+    cases = (
+        ("snapshot", lambda: snapshot(battle)),
+        ("snapshot (no rng)", lambda: snapshot(battle, rng=False)),
+        ("clone a snapshot", lambda: state),
+        ("restore", lambda: restore(battle, state)),
+        ("restore (no rng)", lambda: restore(battle, bare_state)),
+        ("Player.copy x2", lambda: (battle.player.copy(), battle.opponent.copy())),
+        ("copy.deepcopy x2", lambda: (copy.deepcopy(battle.player), copy.deepcopy(battle.opponent))),
+    )
+    for name, fn in cases:
+        n = 2000
+        elapsed = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        print(f"{name:>20}: {elapsed * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Compare the scalar damage formula over a team cross product against damage_calc"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_team, RED_TEAM
+from models.damage_calc import team_damage, damage_range, StatArrays, MoveTable, GEN4_DAMAGE_ROLLS
+
+
+def scalar_grid(attackers, defenders):
+    return [[[(move.compute_damage(a, d, False), move.compute_damage(a, d, True)) for d in defenders]
+             for move in a.moves if move.power is not None] for a in attackers]
+
+
+def main():
+    attackers, defenders = make_team(RED_TEAM), make_team(RED_TEAM)
+    stats_a, moves, stats_d = StatArrays(attackers), MoveTable(attackers), StatArrays(defenders)
+    pairs = sum(len(a.moves) for a in attackers) * len(defenders)
+
+    cases = (
+        ("scalar compute_damage", lambda: scalar_grid(attackers, defenders)),
+        ("team_damage", lambda: team_damage(attackers, defenders)),
+        ("damage_range (prebuilt)", lambda: damage_range(stats_a, moves, stats_d)),
+        ("damage_range, 16 rolls", lambda: damage_range(stats_a, moves, stats_d, GEN4_DAMAGE_ROLLS)),
+    )
+    for name, fn in cases:
+        n = 200
+        elapsed = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        print(f"{name:>24}: {elapsed * 1e6:8.1f} us for {pairs} move/defender pairs, crit and non-crit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Exact KO chances (cold and cached) against a Monte Carlo estimate of the same number"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_team, RED_TEAM
+from models import damage_distribution
+from models.damage_calc import GEN4_DAMAGE_ROLLS
+
+SAMPLES = 10000
+
+
+def monte_carlo_2hko(attacker, defender, move, rng):
+    hp = defender.battle_stats.current_hp
+    hit = damage_distribution.hit_chance(attacker, defender, move)
+    crit = move.critical_hit_chance()
+    kos = 0
+    for _ in range(SAMPLES):
+        total = 0
+        for _ in range(2):
+            if rng.random() < hit:
+                roll = rng.choice(GEN4_DAMAGE_ROLLS)
+                total += move.compute_damage(attacker, defender, rng.random() < crit, roll)
+        kos += total >= hp
+    return kos / SAMPLES
+
+
+def main():
+    attackers, defenders = make_team(RED_TEAM), make_team(RED_TEAM)
+    pairs = [(a, d, m) for a in attackers for d in defenders for m in a.moves if m.power is not None]
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    for a, d, m in pairs[:10]:
+        monte_carlo_2hko(a, d, m, rng)
+    mc = (time.perf_counter() - start) / 10
+
+    timings = []
+    for label in ("exact, cold cache", "exact, warm cache"):
+        start = time.perf_counter()
+        for a, d, m in pairs:
+            damage_distribution.ko_probabilities(a, d, m, turns=2, rolls=GEN4_DAMAGE_ROLLS)
+        timings.append((label, (time.perf_counter() - start) / len(pairs)))
+
+    print(f"{len(pairs)} attacker/move/defender triples, 16 damage rolls, 2HKO chance")
+    print(f"{'monte carlo (10k)':>20}: {mc * 1e3:8.2f} ms per triple")
+    for label, elapsed in timings:
+        print(f"{label:>20}: {elapsed * 1e3:8.3f} ms per triple")
+    print(damage_distribution.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""PokemonEnv.reset latency: reloading both species every episode (the old reset) vs
+resetting the loaded Pokemon in place.
+
+Without pokemon.json, pikachu and charmander are stood in by records with learnsets the
+size of the real ones (a few hundred version-group entries each).
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ai.pokemon_env import PokemonEnv
+from data import loaders
+
+
+def stand_in_records():
+    moves = sorted(loaders.get_move_lookup())
+    groups = ["red-blue", "gold-silver", "ruby-sapphire", "diamond-pearl", "heartgold-soulsilver", "black-white"]
+
+    def record(dex_id, name, types, offset):
+        learnset = [(moves[(offset + i * 7) % len(moves)], "level-up" if i % 3 else "machine", group, i % 60)
+                    for i in range(60) for group in groups]
+        return {
+            "id": dex_id, "name": name, "types": types,
+            "stats": {"hp": 35, "attack": 55, "defense": 40, "special-attack": 50, "special-defense": 50, "speed": 90},
+            "sprites": {"front_default": None, "back_default": None},
+            "abilities": ["static"], "learnset": learnset,
+        }
+    return [record(25, "pikachu", ["electric"], 0), record(4, "charmander", ["fire"], 3)]
+
+
+class ReloadingEnv(PokemonEnv):
+    """The old reset: load both species again every episode"""
+
+    def _reset_battle(self):
+        self._setup_battle()
+
+
+def main():
+    if not os.path.exists(loaders.POKEMON_PATH):
+        print("pokemon.json not found, using stand-in species records")
+        loaders._loaded["pokemon"] = stand_in_records()
+
+    for label, cls in (("reload species", ReloadingEnv), ("reset in place", PokemonEnv)):
+        env = cls(opponent_model=None)
+        n = 2000
+        elapsed = min(timeit.repeat(env.reset, number=n, repeat=5)) / n
+        print(f"{label:>15}: {elapsed * 1e6:8.1f} us per reset")
+
+
+if __name__ == "__main__":
+    main()
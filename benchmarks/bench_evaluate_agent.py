@@ -0,0 +1,65 @@
+"""Time to evaluate a checkpoint: test_agent.py's old serial 100-battle loop vs ai.evaluate_agent.
+
+Usage: python benchmarks/bench_evaluate_agent.py --workers 1 4 --precision 0.05
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stable_baselines3 import PPO
+
+from ai.evaluate_agent import evaluate
+from ai.train_selfplay import PolicySnapshot
+from benchmarks.bench_vec_env import SampleTeamEnv
+
+
+def serial_loop(model, battles):
+    """test_agent.py before: a fresh env per battle, the torch model on both sides"""
+    for _ in range(battles):
+        env = SampleTeamEnv()
+        env.opponent_model = model
+        obs, _ = env.reset()
+        done = False
+        while not done:
+            action, _ = model.predict(obs, deterministic=True)
+            obs, reward, terminated, truncated, _ = env.step(action)
+            done = terminated or truncated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--precision", type=float, default=0.05)
+    args = parser.parse_args()
+
+    random.seed(0)
+    # BattleManager prints its debug trace; keep it out of the results
+    devnull = open(os.devnull, "w")
+    with contextlib.redirect_stdout(devnull):
+        model = PPO("MlpPolicy", SampleTeamEnv(), seed=0, device="cpu")
+        snapshot = PolicySnapshot.from_model(model)
+
+        start = time.perf_counter()
+        serial_loop(model, 100)
+        baseline = time.perf_counter() - start
+    print(f"serial loop:          100 battles in {baseline:6.2f}s ({100 / baseline:7,.0f} battles/s)")
+
+    for workers in sorted(set(args.workers)):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(devnull):
+            stats, _ = evaluate(snapshot, opponent=snapshot, workers=workers, precision=args.precision,
+                                env_factory=SampleTeamEnv)
+        elapsed = time.perf_counter() - start
+        low, high = stats.confidence_interval()
+        print(f"evaluate_agent x{workers:<3d} {stats.battles:5d} battles in {elapsed:6.2f}s "
+              f"({stats.battles / elapsed:7,.0f} battles/s), win rate in [{low:.1%}, {high:.1%}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Greedy AI with and without the evaluation cache: make_ai_action on its own, and a
+tournament of 6v6 battles. Runs alternate and the best of --repeats is reported, since
+a single back-to-back pair is dominated by run-order noise.
+
+Usage: python benchmarks/bench_evaluation_cache.py [--games 500] [--repeats 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_players
+from models import evaluation_cache
+from models.sim_battle import SimBattle, play_out
+
+
+def tournament(games, use_cache):
+    evaluation_cache.clear_cache()
+    turns = 0
+    start = time.perf_counter()
+    for game in range(games):
+        random.seed(game)
+        battle = SimBattle(*make_players())
+        battle.use_evaluation_cache = use_cache
+        turns += play_out(battle).turns
+    return turns, time.perf_counter() - start
+
+
+def ai_action_time(use_cache, number=20000):
+    """Seconds per make_ai_action call on a warm cache (or with none)"""
+    random.seed(0)
+    battle = SimBattle(*make_players())
+    battle.use_evaluation_cache = use_cache
+    battle.make_ai_action(battle.player, battle.opponent)
+    return min(timeit.repeat(lambda: battle.make_ai_action(battle.player, battle.opponent),
+                             number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for use_cache in (False, True):
+        label = "cached" if use_cache else "uncached"
+        print(f"{label:>9}: make_ai_action {ai_action_time(use_cache) * 1e6:.2f}us")
+
+    best = {False: 0.0, True: 0.0}
+    for _ in range(args.repeats):
+        for use_cache in (False, True):
+            turns, elapsed = tournament(args.games, use_cache)
+            best[use_cache] = max(best[use_cache], turns / elapsed)
+    for use_cache in (False, True):
+        label = "cached" if use_cache else "uncached"
+        print(f"{label:>9}: {args.games} games, {turns} turns, best {best[use_cache]:,.0f} turns/s")
+    info = evaluation_cache.cache_info()
+    print(f"cache: {info['hits']} hits, {info['misses']} misses, {info['hit_rate']:.1%} hit rate, {info['size']} entries")
+
+
+if __name__ == "__main__":
+    main()
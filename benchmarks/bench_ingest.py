@@ -0,0 +1,45 @@
+"""Compare sequential and concurrent ingestion against a local server with simulated latency"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tests.integration.test_ingest import FakePokeAPI
+from data.api_client.ingest import ingest
+
+LATENCY = 0.05
+N = 100
+
+
+def main():
+    api = FakePokeAPI()
+    handler = api.server.RequestHandlerClass
+    do_get = handler.do_GET
+
+    def slow_get(self):
+        time.sleep(LATENCY)
+        do_get(self)
+
+    handler.do_GET = slow_get
+
+    for concurrency in (1, 16):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            stats = ingest("move", ids=range(1, N + 1), clean=lambda d: d, base_url=api.base_url,
+                           checkpoint_dir=tmp, concurrency=concurrency)
+            elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            ingest("move", ids=range(1, N + 1), clean=lambda d: d, base_url=api.base_url,
+                   checkpoint_dir=tmp, concurrency=concurrency)
+            resumed = time.perf_counter() - start
+        print(f"concurrency={concurrency:2d}: {N} records in {elapsed:.2f}s "
+              f"({stats.fetched} fetched), resume {resumed * 1000:.1f}ms")
+
+    api.server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
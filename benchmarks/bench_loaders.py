@@ -0,0 +1,60 @@
+"""Start-up cost of the game data: parsing the JSON (the old import-time path)
+vs loading the compiled cache. Each case runs in a fresh interpreter.
+
+Usage: python benchmarks/bench_loaders.py [repeats]
+"""
+import os
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+SETUP = "import models.move, models.pokemon, data.compiled_cache"
+
+# What `import data.loaders` used to do
+JSON_PATH = """
+import json, os
+from data import loaders
+if HAVE_POKEMON:
+    with open(loaders.POKEMON_PATH) as f: pokemon = json.load(f)
+with open(loaders.MOVES_PATH) as f: lookup = loaders.compile_moves(json.load(f))
+"""
+
+CACHED_PATH = """
+from data import loaders
+loaders.get_move_lookup()
+if HAVE_POKEMON: loaders.get_pokemon_data()
+"""
+
+
+def time_in_subprocess(body, repeats):
+    have_pokemon = os.path.exists(os.path.join(SRC, "data", "pokemon.json"))
+    script = (
+        f"import time\n{SETUP}\nHAVE_POKEMON = {have_pokemon}\n"
+        "start = time.perf_counter()\n" + body + "\nprint(time.perf_counter() - start)"
+    )
+    samples = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", script], cwd=SRC, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(samples)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    if not os.path.exists(os.path.join(SRC, "data", "pokemon.json")):
+        print("pokemon.json not found, timing moves.json only")
+
+    subprocess.run([sys.executable, "-m", "data.compiled_cache"], cwd=SRC, check=True, capture_output=True)
+
+    start = time.perf_counter()
+    json_time = time_in_subprocess(JSON_PATH, repeats)
+    cached_time = time_in_subprocess(CACHED_PATH, repeats)
+    print(f"parse JSON     : {json_time * 1000:8.1f} ms")
+    print(f"compiled cache : {cached_time * 1000:8.1f} ms  ({json_time / cached_time:.1f}x)")
+    print(f"(benchmark took {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
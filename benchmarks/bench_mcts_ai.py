@@ -0,0 +1,64 @@
+"""MCTS AI rollouts per second by worker count, and a head-to-head win rate against the greedy AI.
+
+Usage: python benchmarks/bench_mcts_ai.py --games 40 --budget 0.2 --workers 0 2 4
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_players
+from benchmarks.bench_search_ai import head_to_head
+from models.sim_battle import SimBattle
+from ai.mcts_ai import MCTSAI
+
+
+def rollouts_per_second(workers, budget, decisions=5):
+    random.seed(0)
+    battle = SimBattle(*make_players())
+    rollouts, elapsed = 0, 0.0
+    with MCTSAI(time_budget=budget, workers=workers, seed=0) as ai:
+        ai(battle, battle.opponent, battle.player)  # start the worker pool outside the timing
+        for _ in range(decisions):
+            battle.take_turn(battle.make_ai_action(battle.player, battle.opponent),
+                             battle.make_ai_action(battle.opponent, battle.player))
+            ai(battle, battle.opponent, battle.player)
+            rollouts += ai.rollouts
+            elapsed += ai.rollout_seconds
+    return rollouts / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds per decision")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs")
+    for workers in args.workers:
+        print(f"{workers} workers: {rollouts_per_second(workers, args.budget):8.0f} rollouts/s")
+
+    workers = max(args.workers) if (os.cpu_count() or 1) > 1 else 0
+    contenders = (
+        ("greedy", None),
+        (f"mcts ({workers} workers, {args.budget}s)", MCTSAI(time_budget=args.budget, workers=workers, seed=0)),
+    )
+    for label, ai in contenders:
+        start = time.perf_counter()
+        wins, losses, draws = head_to_head(args.games, ai)
+        rate = wins / args.games
+        margin = 1.96 * math.sqrt(rate * (1 - rate) / args.games)
+        print(f"{label} vs greedy over {args.games} games: {wins}W {losses}L {draws}D, "
+              f"win rate {rate:.0%} +- {margin:.0%} ({time.perf_counter() - start:.0f}s)")
+        if ai is not None:
+            ai.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Bytes per game: BattleManager's text battle_log vs a packed Replay (raw and in a zlib archive),
+plus recording overhead and how fast games are reconstructed.
+
+Usage: python benchmarks/bench_replay.py [n_battles]
+"""
+import contextlib
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from benchmarks.sample_teams import make_players, make_pokemon
+from models.battle_manager import BattleManager
+from models.replay import ReplayRecorder, Replayer, read_archive, write_archive
+from models.sim_battle import SimBattle, play_out
+
+
+def play(n, record):
+    replays = []
+    start = time.perf_counter()
+    for seed in range(n):
+        random.seed(seed)
+        battle = SimBattle(*make_players(), rng=random.Random(seed))   # the same games either way
+        if record:
+            recorder = ReplayRecorder(battle, seed)
+        battle.run()
+        if record:
+            replays.append(recorder.replay())
+    return time.perf_counter() - start, replays
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    # What the text log costs for the same games
+    log_bytes = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for seed in range(min(n, 200)):
+            random.seed(seed)
+            battle = BattleManager(*make_players())
+            play_out(battle)
+            log_bytes += len(pickle.dumps(battle.battle_log))
+    log_per_game = log_bytes / min(n, 200)
+
+    # Interleaved, best of five: a single back-to-back pair is dominated by run-order noise
+    plain_time = record_time = float("inf")
+    for _ in range(5):
+        plain_time = min(plain_time, play(n, record=False)[0])
+        elapsed, replays = play(n, record=True)
+        record_time = min(record_time, elapsed)
+    raw = sum(len(r.to_bytes()) for r in replays)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tournament.pkrp")
+        write_archive(path, replays)
+        archived = os.path.getsize(path)
+        start = time.perf_counter()
+        loaded = list(read_archive(path))
+        load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for replay in loaded:
+        Replayer(replay, make_pokemon).battle_at()
+    replay_time = time.perf_counter() - start
+
+    turns = sum(len(r.turns) for r in replays)
+    print(f"{n} games, {turns / n:.1f} turns each")
+    print(f"battle_log (pickled) : {log_per_game:8.0f} bytes/game")
+    print(f"Replay.to_bytes      : {raw / n:8.0f} bytes/game ({log_per_game * n / raw:.0f}x smaller)")
+    print(f"zlib archive         : {archived / n:8.0f} bytes/game ({log_per_game * n / archived:.0f}x smaller, "
+          f"{archived / 1e6:.2f} MB total)")
+    print(f"recording overhead   : {(record_time / plain_time - 1) * 100:7.1f}%")
+    print(f"archive read         : {n / load_time:8.0f} replays/s")
+    print(f"reconstruction       : {n / replay_time:8.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Draws and battles per second with each battle RNG: random.Random vs SimRNG.
+
+Usage: python benchmarks/bench_rng.py [n_battles]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from benchmarks.sample_teams import make_players
+from models.rng import SimRNG
+from models.sim_battle import SimBattle
+
+DRAWS = 1_000_000
+
+
+def draws_per_second(draw):
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        draw()
+    return DRAWS / (time.perf_counter() - start)
+
+
+def battles_per_second(rng_factory, n):
+    start = time.perf_counter()
+    for seed in range(n):
+        random.seed(seed)
+        player, opponent = make_players()
+        SimBattle(player, opponent, rng=rng_factory(seed)).run()
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    for name, factory in (("random.Random", random.Random), ("SimRNG", SimRNG)):
+        rng = factory(0)
+        floats = draws_per_second(rng.random)
+        ints = draws_per_second(lambda: rng.randint(1, 3))
+        battles = battles_per_second(factory, n)
+        print(f"{name:14s}: random() {floats / 1e6:6.2f}M/s, randint() {ints / 1e6:6.2f}M/s, "
+              f"SimBattle {battles:8.1f} battles/s")
+
+
+if __name__ == "__main__":
+    main()
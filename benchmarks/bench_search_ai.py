@@ -0,0 +1,82 @@
+"""Search AI throughput (nodes/s) and a head-to-head win rate against the greedy AI.
+
+Usage: python benchmarks/bench_search_ai.py --games 40 --depth 2 --budget 0.2
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from benchmarks.sample_teams import make_players, RED_TEAM
+from models.sim_battle import SimBattle, play_out
+from ai.search_ai import SearchAI
+
+BLUE_TEAM = ["pikachu", "lapras", "snorlax", "venusaur", "charizard", "blastoise"]
+
+
+def nodes_per_second(depth, decisions=5):
+    random.seed(0)
+    player, opponent = make_players()
+    battle = SimBattle(player, opponent)
+    ai = SearchAI(depth=depth, time_budget=None)
+    nodes, elapsed = 0, 0.0
+    for _ in range(decisions):
+        start = time.perf_counter()
+        ai(battle, battle.opponent, battle.player)
+        elapsed += time.perf_counter() - start
+        nodes += ai.nodes
+        battle.take_turn(battle.make_ai_action(battle.player, battle.opponent),
+                         battle.make_ai_action(battle.opponent, battle.player))
+    return nodes / elapsed, elapsed / decisions
+
+
+def head_to_head(games, ai):
+    """`ai` plays the opponent side against greedy (None: greedy itself, as a baseline).
+    Teams alternate between the sides."""
+    wins = losses = draws = 0
+    for game in range(games):
+        random.seed(game)
+        teams = (RED_TEAM, BLUE_TEAM) if game % 2 == 0 else (BLUE_TEAM, RED_TEAM)
+        battle = SimBattle(*make_players(*teams))
+        battle.opponent_ai = ai
+        result = play_out(battle)
+        if result.winner == "opponent":
+            wins += 1
+        elif result.winner == "player":
+            losses += 1
+        else:
+            draws += 1
+    return wins, losses, draws
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds per decision")
+    args = parser.parse_args()
+
+    for depth in (1, 2):
+        rate, per_decision = nodes_per_second(depth)
+        print(f"depth {depth}: {rate:8.0f} nodes/s, {per_decision * 1000:6.1f} ms per decision")
+
+    contenders = (
+        ("greedy", None),
+        (f"search (depth {args.depth}, {args.budget}s)", SearchAI(depth=args.depth, time_budget=args.budget)),
+    )
+    for label, ai in contenders:
+        start = time.perf_counter()
+        wins, losses, draws = head_to_head(args.games, ai)
+        rate = wins / args.games
+        margin = 1.96 * math.sqrt(rate * (1 - rate) / args.games)
+        print(f"{label} vs greedy over {args.games} games: {wins}W {losses}L {draws}D, "
+              f"win rate {rate:.0%} +- {margin:.0%} ({time.perf_counter() - start:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
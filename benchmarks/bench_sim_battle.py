@@ -0,0 +1,45 @@
+"""Battles per second: BattleManager (UI/logging path) vs the headless SimBattle.
+
+Usage: python benchmarks/bench_sim_battle.py [n_battles]
+"""
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.sample_teams import make_players
+from models.battle_manager import BattleManager
+from models.sim_battle import SimBattle, play_out
+
+
+def run(battle_cls, n):
+    results = []
+    start = time.perf_counter()
+    for seed in range(n):
+        random.seed(seed)
+        player, opponent = make_players()
+        battle = battle_cls(player, opponent)
+        results.append(play_out(battle))
+    return time.perf_counter() - start, results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    # Send the BattleManager's prints somewhere cheap so we measure the engine, not the terminal
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        legacy_time, legacy_results = run(BattleManager, n)
+    sim_time, sim_results = run(SimBattle, n)
+
+    assert sim_results == legacy_results, "SimBattle diverged from BattleManager"
+
+    print(f"{n} battles, identical outcomes: {sim_results == legacy_results}")
+    print(f"BattleManager : {n / legacy_time:10.1f} battles/s")
+    print(f"SimBattle     : {n / sim_time:10.1f} battles/s  ({legacy_time / sim_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
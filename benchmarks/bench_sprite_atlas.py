@@ -0,0 +1,86 @@
+"""Separate sprite Surfaces vs one sprite atlas: load time, pixel memory, and the
+per-frame cost of the select screen's team preview (which used to call load_sprite
+for each team member on every frame).
+
+Usage: python benchmarks/bench_sprite_atlas.py [n_species]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from graphics.sprite_atlas import build_atlas, SpriteAtlas
+
+
+class GeneratedSprites:
+    """Stands in for the sprite cache with distinct 80x80 PNGs"""
+    def __init__(self, urls):
+        self.data = {}
+        for i, url in enumerate(urls):
+            surface = pygame.Surface((80, 80), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (i % 256, (i * 7) % 256, 200, 255), (40, 40), 10 + i % 30)
+            buf = io.BytesIO()
+            pygame.image.save(surface, buf, "sprite.png")
+            self.data[url] = buf.getvalue()
+
+    def get(self, url):
+        return self.data.get(url)
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 493
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+
+    urls = [f"http://sprites/{kind}/{i}.png" for i in range(1, n + 1) for kind in ("front", "back")]
+    sprites = GeneratedSprites(urls)
+
+    start = time.perf_counter()
+    surfaces = [pygame.image.load(io.BytesIO(sprites.get(url))).convert_alpha() for url in urls]
+    separate_load = time.perf_counter() - start
+    separate_mem = sum(surface_bytes(s) for s in surfaces)
+
+    with tempfile.TemporaryDirectory() as atlas_dir:
+        start = time.perf_counter()
+        index = build_atlas(urls, output_dir=atlas_dir, sprite_cache=sprites)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        atlas = SpriteAtlas.load(atlas_dir)
+        atlas_load = time.perf_counter() - start
+        atlas_mem = sum(surface_bytes(page) for page in atlas.pages)
+
+    team = urls[0:12:2]
+    frames = 300
+    start = time.perf_counter()
+    for _ in range(frames):
+        for y, url in enumerate(team):
+            sprite = pygame.image.load(io.BytesIO(sprites.get(url))).convert_alpha()
+            screen.blit(sprite, sprite.get_rect(center=(1000, 150 + y * 80)))
+    per_frame_load = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for y, url in enumerate(team):
+            atlas.blit(screen, url, (1000, 150 + y * 80))
+    per_frame_atlas = (time.perf_counter() - start) / frames
+
+    print(f"{len(urls)} sprites")
+    print(f"separate : {len(surfaces):5d} surfaces, {separate_mem / 1e6:6.1f} MB, load {separate_load * 1000:7.1f} ms")
+    print(f"atlas    : {len(index['pages']):5d} pages,    {atlas_mem / 1e6:6.1f} MB, load {atlas_load * 1000:7.1f} ms"
+          f" (offline build {build_time * 1000:.0f} ms)")
+    print(f"team preview per frame: load_sprite {per_frame_load * 1e6:8.1f} us, atlas blit {per_frame_atlas * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
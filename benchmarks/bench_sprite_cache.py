@@ -0,0 +1,93 @@
+"""PokemonSelectScene sprite loading, cold (empty disk cache) vs warm.
+
+Sprites are served by a local HTTP server with an artificial per-request delay
+standing in for the real sprite host, so this runs without internet access.
+
+Usage: python benchmarks/bench_sprite_cache.py [n_pokemon] [latency_ms]
+"""
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from data.sprite_cache import SpriteCache, set_sprite_cache
+from scenes.pokemon_select_scene import PokemonSelectScene
+
+
+def make_png():
+    surface = pygame.Surface((80, 80), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (240, 200, 40), (40, 40), 30)
+    buf = io.BytesIO()
+    pygame.image.save(surface, buf, "sprite.png")
+    return buf.getvalue()
+
+
+def start_server(latency):
+    png = make_png()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(png)))
+            self.end_headers()
+            self.wfile.write(png)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class ForegroundSelectScene(PokemonSelectScene):
+    """Preload synchronously so we can time it"""
+    def start_background_sprite_loader(self):
+        pass
+
+
+def load_scene(screen, pokemon_data):
+    start = time.perf_counter()
+    scene = ForegroundSelectScene(screen, pokemon_data, lambda team: None)
+    first_page = time.perf_counter() - start
+    scene.preload_sprites()
+    return first_page, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    server = start_server(latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    pokemon_data = [
+        {"name": f"mon{i}", "sprites": {"front_default": f"{base_url}/front/{i}.png"}}
+        for i in range(1, n + 1)
+    ]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        set_sprite_cache(SpriteCache(cache_dir=cache_dir, offline=False))
+        cold = load_scene(screen, pokemon_data)
+        set_sprite_cache(SpriteCache(cache_dir=cache_dir, offline=True))
+        warm = load_scene(screen, pokemon_data)
+
+    server.shutdown()
+    print(f"{n} sprites, {latency * 1000:.0f} ms simulated latency")
+    print(f"cold: first page {cold[0] * 1000:8.1f} ms, all sprites {cold[1] * 1000:8.1f} ms")
+    print(f"warm: first page {warm[0] * 1000:8.1f} ms, all sprites {warm[1] * 1000:8.1f} ms  ({cold[1] / warm[1]:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare per-matchup dict lookups against the dense type matrix"""
+import os
+import sys
+import random
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.types import Type
+from models.type_chart import TYPE_EFFECTIVENESS, type_effectiveness, effectiveness_matrix
+
+TYPES = list(Type)
+
+
+def dict_effectiveness(attacking, defending_types):
+    multiplier = 1.0
+    for t in defending_types:
+        multiplier *= TYPE_EFFECTIVENESS.get(attacking, {}).get(t, 1.0)
+    return multiplier
+
+
+def main():
+    rng = random.Random(0)
+    moves = [rng.choice(TYPES) for _ in range(24)]
+    defenders = [rng.sample(TYPES, rng.choice((1, 2))) for _ in range(200)]
+
+    def dict_grid():
+        return [[dict_effectiveness(m, d) for d in defenders] for m in moves]
+
+    def scalar_grid():
+        return [[type_effectiveness(m, d) for d in defenders] for m in moves]
+
+    def matrix_grid():
+        return effectiveness_matrix(moves, defenders)
+
+    assert matrix_grid().tolist() == dict_grid()
+    cells = len(moves) * len(defenders)
+    for name, fn in (("dict loop", dict_grid), ("scalar table", scalar_grid), ("effectiveness_matrix", matrix_grid)):
+        n = 20
+        elapsed = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        print(f"{name:>20}: {elapsed * 1000:7.3f} ms per {cells} matchups "
+              f"({cells / elapsed / 1e6:.2f} M/s)")
+
+
+if __name__ == "__main__":
+    main()
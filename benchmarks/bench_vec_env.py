@@ -0,0 +1,69 @@
+"""Env steps per second: DummyVecEnv of PokemonEnv (as train_agent.py had it) vs VecPokemonEnv.
+
+Usage: python benchmarks/bench_vec_env.py --envs 1 16 64 256 --steps 2000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from benchmarks.sample_teams import make_pokemon
+from ai.pokemon_env import PokemonEnv
+from ai.vec_pokemon_env import VecPokemonEnv
+from models.battle_manager import BattleManager
+from models.player import Player
+
+PLAYER, OPPONENT = "pikachu", "charizard"
+
+
+class SampleTeamEnv(PokemonEnv):
+    """PokemonEnv on the self-contained sample species, so this runs without pokemon.json"""
+
+    def __init__(self):
+        super().__init__(opponent_model=None)
+
+    def _setup_battle(self):
+        self.player = Player("AI", is_ai=True, team=[make_pokemon(PLAYER)])
+        self.opponent = Player("Opponent AI", is_ai=True, team=[make_pokemon(OPPONENT)])
+        self.battle = BattleManager(self.player, self.opponent)
+
+
+def steps_per_second(env, num_envs, steps):
+    rng = np.random.default_rng(0)
+    env.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        env.step(rng.integers(0, 4, size=num_envs))
+    return steps * num_envs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--steps", type=int, default=2000, help="batched steps per measurement")
+    args = parser.parse_args()
+
+    random.seed(0)
+    for num_envs in args.envs:
+        # BattleManager prints its debug trace; keep it out of the results
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            dummy = DummyVecEnv([SampleTeamEnv] * num_envs)
+            baseline = steps_per_second(dummy, num_envs, max(1, args.steps // num_envs))
+        vectorized = steps_per_second(
+            VecPokemonEnv(num_envs, player=make_pokemon(PLAYER), opponent=make_pokemon(OPPONENT), seed=0),
+            num_envs, args.steps)
+        print(f"{num_envs:4d} envs: DummyVecEnv {baseline:9,.0f} steps/s, "
+              f"VecPokemonEnv {vectorized:11,.0f} steps/s ({vectorized / baseline:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
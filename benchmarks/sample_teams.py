@@ -0,0 +1,90 @@
+"""Self-contained teams for benchmarks, so they run without pokemon.json"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+from models.pokemon import Pokemon
+from models.base_stats import BaseStats
+from models.move import Move, MoveEffects, HitInfo
+from models.types import Type
+from models.abilities.static import Static
+from models.player import Player
+
+
+def make_move(name, power, move_type, damage_class="special", accuracy=100, pp=35, priority=0,
+              ailment="none", ailment_chance=0):
+    effects = MoveEffects(
+        effect_chance=ailment_chance, ailment=ailment, drain=0, healing=0,
+        ailment_chance=ailment_chance, flinch_chance=0, stat_chance=0,
+        stat_changes={}, is_badly_poisoning=False,
+    )
+    hit_info = HitInfo(min_hits=None, max_hits=None, min_turns=None, max_turns=None)
+    return Move(
+        name=name, accuracy=accuracy, pp=pp, priority=priority, power=power,
+        damage_class=damage_class, crit_rate=0, target="selected-pokemon",
+        category="damage", move_type=move_type, hit_info=hit_info, effects_info=effects,
+    )
+
+
+# name, (hp, atk, def, spa, spd, spe), types, moves
+SPECIES = {
+    "charizard": ((78, 84, 78, 109, 85, 100), [Type.FIRE, Type.FLYING], [
+        ("flamethrower", 95, Type.FIRE, "special", 100, "burn", 10),
+        ("wing-attack", 60, Type.FLYING, "physical", 100, "none", 0),
+        ("slash", 70, Type.NORMAL, "physical", 100, "none", 0),
+    ]),
+    "blastoise": ((79, 83, 100, 85, 105, 78), [Type.WATER], [
+        ("surf", 90, Type.WATER, "special", 100, "none", 0),
+        ("bite", 60, Type.DARK, "physical", 100, "none", 0),
+        ("ice-beam", 90, Type.ICE, "special", 100, "freeze", 10),
+    ]),
+    "venusaur": ((80, 82, 83, 100, 100, 80), [Type.GRASS, Type.POISON], [
+        ("razor-leaf", 55, Type.GRASS, "physical", 95, "none", 0),
+        ("sludge-bomb", 90, Type.POISON, "special", 100, "poison", 30),
+        ("sleep-powder", None, Type.GRASS, "status", 75, "sleep", 100),
+    ]),
+    "pikachu": ((35, 55, 40, 50, 50, 90), [Type.ELECTRIC], [
+        ("thunderbolt", 95, Type.ELECTRIC, "special", 100, "paralysis", 10),
+        ("quick-attack", 40, Type.NORMAL, "physical", 100, "none", 0),
+    ]),
+    "snorlax": ((160, 110, 65, 65, 110, 30), [Type.NORMAL], [
+        ("body-slam", 85, Type.NORMAL, "physical", 100, "paralysis", 30),
+        ("crunch", 80, Type.DARK, "physical", 100, "none", 0),
+    ]),
+    "lapras": ((130, 85, 80, 85, 95, 60), [Type.WATER, Type.ICE], [
+        ("surf", 90, Type.WATER, "special", 100, "none", 0),
+        ("ice-beam", 90, Type.ICE, "special", 100, "freeze", 10),
+        ("thunderbolt", 95, Type.ELECTRIC, "special", 100, "paralysis", 10),
+    ]),
+}
+
+RED_TEAM = ["charizard", "blastoise", "venusaur", "pikachu", "snorlax", "lapras"]
+
+
+def make_pokemon(name, level=50):
+    stats, types, move_rows = SPECIES[name]
+    moves = [
+        make_move(move_name, power, move_type, damage_class, accuracy, ailment=ailment, ailment_chance=chance)
+        for move_name, power, move_type, damage_class, accuracy, ailment, chance in move_rows
+    ]
+    return Pokemon(
+        name=name,
+        ability=Static(),
+        base_stats=BaseStats(*stats),
+        types=types,
+        moves=moves,
+        level=level,
+        iv=Pokemon.generate_random_iv(),
+        ev=Pokemon.generate_default_ev(),
+    )
+
+
+def make_team(names, level=50):
+    return [make_pokemon(n, level) for n in names]
+
+
+def make_players(team_a=RED_TEAM, team_b=RED_TEAM):
+    return (
+        Player("Ash", True, [make_pokemon(n) for n in team_a]),
+        Player("Red", True, [make_pokemon(n) for n in team_b]),
+    )
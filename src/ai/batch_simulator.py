@@ -0,0 +1,160 @@
+# batch_simulator.py
+# Runs many independent headless battles across a process pool and aggregates
+# win/loss/turn statistics, e.g. to size up a matchup against Red's team.
+#
+# Usage: python -m ai.batch_simulator pikachu,lapras charizard,blastoise -n 1000 --workers 8
+
+import argparse
+import copy
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from models.player import Player
+from models.sim_battle import SimBattle, DEFAULT_MAX_TURNS
+
+# Per-process state, filled in once by _init_worker
+_team_builder = None
+
+
+class BatchStats:
+    def __init__(self):
+        self.battles = 0
+        self.wins_a = 0
+        self.wins_b = 0
+        self.draws = 0
+        self.total_turns = 0
+        self.min_turns = None
+        self.max_turns = None
+
+    def add(self, result):
+        self.battles += 1
+        if result.winner == "player":
+            self.wins_a += 1
+        elif result.winner == "opponent":
+            self.wins_b += 1
+        else:
+            self.draws += 1
+        self.total_turns += result.turns
+        self.min_turns = result.turns if self.min_turns is None else min(self.min_turns, result.turns)
+        self.max_turns = result.turns if self.max_turns is None else max(self.max_turns, result.turns)
+
+    def merge(self, other: "BatchStats"):
+        self.battles += other.battles
+        self.wins_a += other.wins_a
+        self.wins_b += other.wins_b
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        for attr, pick in (("min_turns", min), ("max_turns", max)):
+            theirs = getattr(other, attr)
+            if theirs is not None:
+                ours = getattr(self, attr)
+                setattr(self, attr, theirs if ours is None else pick(ours, theirs))
+
+    @property
+    def win_rate_a(self):
+        return self.wins_a / self.battles if self.battles else 0.0
+
+    @property
+    def win_rate_b(self):
+        return self.wins_b / self.battles if self.battles else 0.0
+
+    @property
+    def avg_turns(self):
+        return self.total_turns / self.battles if self.battles else 0.0
+
+    def __repr__(self):
+        return (f"BatchStats(battles={self.battles}, wins_a={self.wins_a}, wins_b={self.wins_b}, "
+                f"draws={self.draws}, avg_turns={self.avg_turns:.2f})")
+
+
+def load_team(names, level=50):
+    """Default team builder: look the species up in pokemon.json/moves.json"""
+    from data.loaders import load_pokemon, get_move_lookup
+    move_lookup = get_move_lookup()
+    return [load_pokemon(name, move_lookup, level=level) for name in names]
+
+
+def _init_worker(team_builder):
+    global _team_builder
+    _team_builder = team_builder
+    if team_builder is load_team:
+        # Pay for loading the data once per worker rather than once per battle
+        from data.loaders import get_pokemon_data, get_move_lookup
+        get_move_lookup()
+        get_pokemon_data()
+
+
+def _run_chunk(team_a, team_b, seeds, level, max_turns):
+    stats = BatchStats()
+    for seed in seeds:
+        # Seeding per battle keeps results identical whatever the worker count. Team
+        # builders roll IVs from the random module; the battle gets its own stream
+        random.seed(seed)
+        player = Player("A", True, _team_builder(team_a, level))
+        opponent = Player("B", True, _team_builder(team_b, level))
+        stats.add(SimBattle(player, opponent, rng=random.Random(seed)).run(max_turns=max_turns))
+    return stats
+
+
+def iter_simulate_many(team_a, team_b, n, workers=None, seed=0, level=50,
+                       max_turns=DEFAULT_MAX_TURNS, chunk_size=None, team_builder=load_team):
+    """Yield the running BatchStats each time a chunk of battles finishes. Each value
+    is a snapshot, so keeping them gives the totals as they stood after each chunk."""
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker so progress streams back and stragglers balance out
+        chunk_size = max(1, min(250, n // (workers * 4) or 1))
+
+    seeds = range(seed, seed + n)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, n, chunk_size)]
+    totals = BatchStats()
+
+    if workers == 1:
+        _init_worker(team_builder)
+        for chunk in chunks:
+            totals.merge(_run_chunk(team_a, team_b, chunk, level, max_turns))
+            yield copy.copy(totals)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(team_builder,)) as pool:
+        futures = [pool.submit(_run_chunk, team_a, team_b, chunk, level, max_turns) for chunk in chunks]
+        for future in as_completed(futures):
+            totals.merge(future.result())
+            yield copy.copy(totals)
+
+
+def simulate_many(team_a, team_b, n, workers=None, **kwargs) -> BatchStats:
+    """Run n independent battles of team_a (player side) vs team_b (opponent side).
+
+    Teams are lists of species names; battle i is seeded with seed + i, so the
+    totals don't depend on how many workers were used.
+    """
+    totals = BatchStats()
+    for totals in iter_simulate_many(team_a, team_b, n, workers=workers, **kwargs):
+        pass
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many battles between two teams")
+    parser.add_argument("team_a", help="comma separated species, e.g. pikachu,lapras")
+    parser.add_argument("team_b", help="comma separated species")
+    parser.add_argument("-n", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", type=int, default=50)
+    args = parser.parse_args()
+
+    team_a = args.team_a.split(",")
+    team_b = args.team_b.split(",")
+    stats = BatchStats()
+    for stats in iter_simulate_many(team_a, team_b, args.n, workers=args.workers, seed=args.seed, level=args.level):
+        print(f"\r{stats.battles}/{args.n} battles, A wins {stats.win_rate_a:.1%}", end="", flush=True)
+    print()
+    print(f"A wins: {stats.wins_a}  B wins: {stats.wins_b}  draws: {stats.draws}")
+    print(f"Turns: avg {stats.avg_turns:.2f}, min {stats.min_turns}, max {stats.max_turns}")
+
+
+if __name__ == "__main__":
+    main()
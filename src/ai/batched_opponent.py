@@ -0,0 +1,57 @@
+# batched_opponent.py
+# Picks the opponent's moves for every env of a VecEnv in one batched predict() call.
+# Without it each PokemonEnv calls opponent_model.predict() on its own observation
+# every step: with a torch policy that is a full forward pass per env per step, and
+# under SubprocVecEnv every worker needs its own copy of the model. Here the wrapped
+# envs are switched to external opponent actions: each reports the opponent's
+# observation in its info dict, the wrapper stacks those into one batch, runs the
+# model once, and sends (player_action, opponent_action) pairs down to the envs.
+#
+# Usage: env = BatchedOpponent(SubprocVecEnv([make_env] * 8), opponent_model=model)
+
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnvWrapper
+
+from ai.pokemon_env import NO_OPPONENT_ACTION
+
+
+class BatchedOpponent(VecEnvWrapper):
+    """VecEnv of PokemonEnvs whose opponent moves come from one batched predict() per step.
+
+    opponent_model is anything with an SB3-style predict(obs, deterministic=...) that
+    accepts a batch of observations (a PPO model, a PolicySnapshot); it can be swapped
+    at any time by assigning the attribute. With no model the wrapper sends
+    NO_OPPONENT_ACTION and each env picks the opponent's move as it would unwrapped.
+    """
+
+    def __init__(self, venv, opponent_model=None, deterministic=True):
+        super().__init__(venv)
+        self.opponent_model = opponent_model
+        self.deterministic = deterministic
+        self.opponent_obs = None
+        self.predict_calls = 0
+        venv.env_method("use_external_opponent")
+
+    def reset(self):
+        obs = self.venv.reset()
+        self.opponent_obs = np.stack([info["opponent_obs"] for info in self.venv.reset_infos])
+        return obs
+
+    def opponent_actions(self):
+        if self.opponent_model is None:
+            return np.full(self.num_envs, NO_OPPONENT_ACTION)
+        self.predict_calls += 1
+        actions, _ = self.opponent_model.predict(self.opponent_obs, deterministic=self.deterministic)
+        return np.asarray(actions).reshape(self.num_envs)
+
+    def step_async(self, actions):
+        actions = np.asarray(actions).reshape(self.num_envs)
+        self.venv.step_async(np.stack([actions, self.opponent_actions()], axis=1))
+
+    def step_wait(self):
+        obs, rewards, dones, infos = self.venv.step_wait()
+        for i, done in enumerate(dones):
+            # A finished env has already been reset: its next turn starts from the reset info
+            info = self.venv.reset_infos[i] if done else infos[i]
+            self.opponent_obs[i] = info["opponent_obs"]
+        return obs, rewards, dones, infos
@@ -0,0 +1,297 @@
+# evaluate_agent.py
+# Evaluates a trained model by playing battles across a process pool until its win
+# rate is known precisely enough: after every chunk of battles the Wilson confidence
+# interval is checked and evaluation stops once its half-width is below --precision
+# (or --max-battles is reached). Battle i is seeded with seed + i and results are
+# consumed in battle order, so the rows, the stopping point and the totals are the
+# same whatever the worker count. Rows are streamed to CSV as they come in and the
+# plots are written to an image file, so it can run unattended.
+#
+# Usage: python -m ai.evaluate_agent src/ai/trained_model_selfplay --workers 8 --precision 0.03
+
+import argparse
+import csv
+import functools
+import logging
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+
+import numpy as np
+
+from ai.pokemon_env import PokemonEnv
+from ai.train_selfplay import PolicySnapshot
+from models.sim_battle import DEFAULT_MAX_TURNS
+
+CSV_HEADER = ["Battle", "Turns", "Reward", "Result"]
+
+# Per-process state, filled in once by _init_worker
+_env = None
+_agent = None
+
+
+class EvalStats:
+    def __init__(self):
+        self.battles = 0
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.total_turns = 0
+        self.total_reward = 0.0
+
+    def add(self, row):
+        _, turns, reward, result = row
+        self.battles += 1
+        if result == "Win":
+            self.wins += 1
+        elif result == "Loss":
+            self.losses += 1
+        else:
+            self.draws += 1
+        self.total_turns += turns
+        self.total_reward += reward
+
+    @property
+    def win_rate(self):
+        return self.wins / self.battles if self.battles else 0.0
+
+    @property
+    def avg_turns(self):
+        return self.total_turns / self.battles if self.battles else 0.0
+
+    @property
+    def avg_reward(self):
+        return self.total_reward / self.battles if self.battles else 0.0
+
+    def confidence_interval(self, confidence=0.95):
+        return wilson_interval(self.wins, self.battles, confidence)
+
+    def __repr__(self):
+        return (f"EvalStats(battles={self.battles}, wins={self.wins}, losses={self.losses}, "
+                f"draws={self.draws}, avg_turns={self.avg_turns:.2f})")
+
+
+def wilson_interval(successes, n, confidence=0.95):
+    """Wilson score interval for a proportion; stays sensible at 0 or n successes"""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def play_battle(env, agent, battle, seed, max_turns=DEFAULT_MAX_TURNS):
+    """One battle of agent (player side) in env; returns its CSV row"""
+    obs, _ = env.reset(seed=seed)   # reseeds the env's RNG: IVs, fallback moves and dice
+    turns = 0
+    total_reward = 0.0
+    done = False
+    while not done and turns < max_turns:
+        action, _ = agent.predict(obs, deterministic=True)
+        obs, reward, terminated, truncated, _ = env.step(int(action))
+        total_reward += reward
+        done = terminated or truncated
+        turns += 1
+
+    player_out = env.player.active_pokemon().is_fainted()
+    opponent_out = env.opponent.active_pokemon().is_fainted()
+    if opponent_out and not player_out:
+        result = "Win"
+    elif player_out and not opponent_out:
+        result = "Loss"
+    else:
+        result = "Draw"     # both fainted, or the turn cap was hit
+    return battle, turns, total_reward, result
+
+
+def _init_worker(env_factory, agent, opponent):
+    global _env, _agent
+    # One env per worker, reset between battles rather than rebuilt
+    _env = env_factory()
+    _env.opponent_model = opponent
+    _agent = agent
+
+
+def _run_chunk(battles, seed, max_turns):
+    return [play_battle(_env, _agent, battle, seed + battle - 1, max_turns) for battle in battles]
+
+
+def iter_evaluate(agent, opponent=None, workers=None, seed=0, precision=0.03, confidence=0.95,
+                  min_battles=100, max_battles=10_000, chunk_size=None, max_turns=DEFAULT_MAX_TURNS,
+                  env_factory=None):
+    """Yield (rows, running EvalStats) for each chunk of battles, in battle order.
+
+    agent and opponent are anything with an SB3-style predict() (a PolicySnapshot
+    pickles cheaply to the workers); opponent=None leaves PokemonEnv's greedy
+    fallback in charge. Stops once at least min_battles have been played and the
+    win-rate interval's half-width is <= precision, or after max_battles.
+    """
+    workers = workers or os.cpu_count() or 1
+    env_factory = env_factory or functools.partial(PokemonEnv, opponent_model=None)
+    if chunk_size is None:
+        # Small enough to stop soon after the interval is tight, big enough to amortise dispatch
+        chunk_size = max(1, min(50, min_battles // workers or 1))
+
+    starts = range(1, max_battles + 1, chunk_size)
+    chunks = [range(start, min(start + chunk_size, max_battles + 1)) for start in starts]
+    stats = EvalStats()
+
+    def done():
+        if stats.battles < min_battles:
+            return False
+        low, high = stats.confidence_interval(confidence)
+        return (high - low) / 2 <= precision
+
+    if workers == 1:
+        _init_worker(env_factory, agent, opponent)
+        for chunk in chunks:
+            rows = _run_chunk(chunk, seed, max_turns)
+            for row in rows:
+                stats.add(row)
+            yield rows, stats
+            if done():
+                return
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(env_factory, agent, opponent)) as pool:
+        # Keep a couple of chunks per worker in flight; finished chunks wait in
+        # `ready` until every earlier chunk is in, so stopping is decided in order
+        pending = {}
+        ready = {}
+        next_submit = next_yield = 0
+        try:
+            while next_yield < len(chunks):
+                while next_submit < len(chunks) and len(pending) + len(ready) < workers * 2:
+                    future = pool.submit(_run_chunk, chunks[next_submit], seed, max_turns)
+                    pending[future] = next_submit
+                    next_submit += 1
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    ready[pending.pop(future)] = future.result()
+                while next_yield in ready:
+                    rows = ready.pop(next_yield)
+                    next_yield += 1
+                    for row in rows:
+                        stats.add(row)
+                    yield rows, stats
+                    if done():
+                        return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def evaluate(agent, **kwargs):
+    """Run iter_evaluate to completion; returns (EvalStats, rows)"""
+    stats = EvalStats()
+    all_rows = []
+    for rows, stats in iter_evaluate(agent, **kwargs):
+        all_rows.extend(rows)
+    return stats, all_rows
+
+
+def write_plots(rows, path, confidence=0.95):
+    """Outcome pie, reward per battle and running win rate with its interval, saved to path"""
+    import matplotlib
+    matplotlib.use("Agg")   # no display needed
+    import matplotlib.pyplot as plt
+
+    battles = np.array([row[0] for row in rows])
+    rewards = np.array([row[2] for row in rows])
+    results = [row[3] for row in rows]
+    wins = np.cumsum([result == "Win" for result in results])
+    intervals = np.array([wilson_interval(w, n, confidence) for n, w in enumerate(wins, 1)])
+
+    fig, (pie, trend, rate) = plt.subplots(1, 3, figsize=(15, 5))
+    counts = [results.count(label) for label in ("Win", "Loss", "Draw")]
+    pie.pie(counts, labels=["Wins", "Losses", "Draws"], autopct='%1.1f%%',
+            colors=['green', 'red', 'gray'], startangle=140)
+    pie.axis('equal')
+    pie.set_title("Battle Outcomes")
+
+    trend.plot(battles, rewards, marker='o', markersize=2, linestyle='-', linewidth=0.5, color='blue')
+    trend.set_xlabel("Battle Number")
+    trend.set_ylabel("Reward")
+    trend.set_title("Reward per Battle")
+
+    rate.plot(battles, wins / np.arange(1, len(rows) + 1), color='green')
+    rate.fill_between(battles, intervals[:, 0], intervals[:, 1], color='green', alpha=0.2)
+    rate.set_ylim(0, 1)
+    rate.set_xlabel("Battles Played")
+    rate.set_ylabel("Win Rate")
+    rate.set_title(f"Win Rate ({confidence:.0%} interval)")
+
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def load_policy(path):
+    from stable_baselines3 import PPO
+    return PolicySnapshot.from_model(PPO.load(path, device="cpu"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate a trained model until its win rate is known")
+    parser.add_argument("model", nargs="?", default="src/ai/trained_model_selfplay")
+    parser.add_argument("--opponent", default="self",
+                        help="'self' (the model plays both sides), 'greedy', or another model path")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--precision", type=float, default=0.03, help="target half-width of the win-rate interval")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--min-battles", type=int, default=100)
+    parser.add_argument("--max-battles", type=int, default=10_000)
+    parser.add_argument("--csv", default=os.path.join(os.path.dirname(__file__), "evaluation_results.csv"))
+    parser.add_argument("--plot", default=os.path.join(os.path.dirname(__file__), "evaluation_results.png"),
+                        help="image file for the plots ('' to skip)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    agent = load_policy(args.model)
+    if args.opponent == "self":
+        opponent = agent
+    elif args.opponent == "greedy":
+        opponent = None
+    else:
+        opponent = load_policy(args.opponent)
+
+    all_rows = []
+    stats = EvalStats()
+    with open(args.csv, mode="w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for rows, stats in iter_evaluate(agent, opponent=opponent, workers=args.workers, seed=args.seed,
+                                         precision=args.precision, confidence=args.confidence,
+                                         min_battles=args.min_battles, max_battles=args.max_battles):
+            writer.writerows(rows)
+            f.flush()
+            all_rows.extend(rows)
+            low, high = stats.confidence_interval(args.confidence)
+            print(f"\r{stats.battles} battles, win rate {stats.win_rate:.1%} [{low:.1%}, {high:.1%}]",
+                  end="", flush=True)
+    print()
+
+    low, high = stats.confidence_interval(args.confidence)
+    logging.info("Evaluation Summary:")
+    logging.info(f"Total Battles: {stats.battles}")
+    logging.info(f"Wins   : {stats.wins}")
+    logging.info(f"Losses : {stats.losses}")
+    logging.info(f"Draws  : {stats.draws}")
+    logging.info(f"Win Rate     : {stats.win_rate:.2%} ({args.confidence:.0%} CI {low:.2%} - {high:.2%})")
+    logging.info(f"Avg Turns    : {stats.avg_turns:.2f}")
+    logging.info(f"Avg Reward   : {stats.avg_reward:.2f}")
+    logging.info(f"Results written to {args.csv}")
+
+    if args.plot and all_rows:      # nothing to plot after --max-battles 0
+        write_plots(all_rows, args.plot, args.confidence)
+        logging.info(f"Plots written to {args.plot}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+# mcts_ai.py
+# Monte Carlo Tree Search opponent. Both sides' choices are simultaneous, so each tree
+# node keeps separate UCB statistics per side (decoupled UCT) and children are keyed by
+# the joint action. Nodes stand for action sequences rather than exact states ("open
+# loop"): every iteration replays the path from the root with fresh dice, so chance is
+# sampled instead of enumerated. Rollouts can run on worker processes while the tree
+# lives in the calling process, and the tree is kept between turns.
+#
+# Usage: battle.opponent_ai = MCTSAI(time_budget=0.5, workers=4)
+#        battle.opponent_ai = MCTSAI(rollout_policy=PPORolloutPolicy("ai/trained_model_selfplay.zip"))
+
+import math
+import pickle
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from ai.search_ai import legal_actions, _side_score
+from models.battle_state import snapshot, restore
+from models.player_action import PlayerAction
+from models.sim_battle import SimBattle
+
+US, THEM = 0, 1
+VIRTUAL_LOSS = 1.0
+
+# Per-process rollout battles, keyed by MCTSAI battle key (see _worker_battle)
+_worker_battles = {}
+
+
+class RolloutBattle(SimBattle):
+    """Headless battle with its own RNG, so searching never disturbs the game's random state"""
+
+    def __init__(self, player, opponent, seed=None):
+        super().__init__(player, opponent, rng=random.Random(seed))
+
+
+def greedy_policy(battle, player, opponent):
+    return battle.make_ai_action(player, opponent)
+
+
+class PPORolloutPolicy:
+    """Rollout policy backed by a stable-baselines3 PPO model trained on PokemonEnv
+    (e.g. ai/trained_model_selfplay.zip from train_agent.py). The model is loaded lazily,
+    once per process, so the policy can be shipped to rollout workers."""
+
+    def __init__(self, model_path, deterministic=True):
+        self.model_path = model_path
+        self.deterministic = deterministic
+        self._model = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_model"] = None
+        return state
+
+    def __call__(self, battle, player, opponent):
+        if self._model is None:
+            from stable_baselines3 import PPO
+            self._model = PPO.load(self.model_path)
+        from ai.pokemon_env import observation
+
+        pokemon = player.active_pokemon()
+        action, _ = self._model.predict(observation(pokemon, opponent.active_pokemon()), deterministic=self.deterministic)
+        index = int(action)
+        if index >= len(pokemon.moves) or not pokemon.battle_stats.has_pp(pokemon.moves[index].name):
+            return battle.make_ai_action(player, opponent)
+        return PlayerAction(type="move", move=pokemon.moves[index])
+
+
+def action_key(action):
+    if action.type == "switch":
+        return ("switch", action.switch_to)
+    return (action.type, action.move.name if action.move else action.item)
+
+
+def rollout_value(us, them):
+    """+1 win, -1 loss, otherwise the HP/standing balance scaled into (-1, 1)"""
+    ours, theirs = _side_score(us), _side_score(them)
+    if ours + theirs == 0:
+        return 0.0
+    return (ours - theirs) / (ours + theirs)
+
+
+def play_rollout(battle, policy, we_are_player, max_turns, deadline=None):
+    """Play on for up to max_turns, or until the perf_counter() deadline if one is given,
+    and score the position reached"""
+    turns = 0
+    while not battle.battle_over and turns < max_turns:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        player_action = policy(battle, battle.player, battle.opponent)
+        opponent_action = policy(battle, battle.opponent, battle.player)
+        battle.take_turn(player_action, opponent_action)
+        turns += 1
+    if we_are_player:
+        return rollout_value(battle.player, battle.opponent)
+    return rollout_value(battle.opponent, battle.player)
+
+
+def _worker_battle(key, payload):
+    battle = _worker_battles.get(key)
+    if battle is None:
+        player, opponent, policy = pickle.loads(payload)
+        battle = RolloutBattle(player, opponent)
+        battle.policy = policy
+        _worker_battles.clear()  # one battle at a time per worker is plenty
+        _worker_battles[key] = battle
+    return battle
+
+
+def _remote_rollout(key, payload, state, seed, we_are_player, max_turns):
+    battle = _worker_battle(key, payload)
+    restore(battle, state)
+    battle.rng.seed(seed)
+    return play_rollout(battle, battle.policy, we_are_player, max_turns)
+
+
+def _headless_copy(player):
+    """Copy of a player without pygame surfaces, so it can be pickled to workers"""
+    clone = player.copy()
+    for pokemon in clone.team:
+        pokemon.front_sprite = None
+        pokemon.back_sprite = None
+    return clone
+
+
+class Node:
+    def __init__(self):
+        self.visits = 0
+        self.stats = ({}, {})   # per side: action key -> [visits, total value from that side's view]
+        self.children = {}      # (our key, their key) -> Node
+
+
+class MCTSAI:
+    """Anytime MCTS decision maker for one side of a battle.
+
+    time_budget      -- seconds of thinking per decision (on top of any pondering)
+    workers          -- rollout processes; 0 runs rollouts in this process
+    exploration      -- UCB1 exploration constant
+    rollout_policy   -- callable(battle, player, opponent) -> PlayerAction for both sides
+                        in rollouts; greedy make_ai_action by default
+    max_rollout_turns / max_tree_depth -- cut-offs for rollouts and tree walks
+    """
+
+    def __init__(self, time_budget=0.5, workers=0, exploration=1.0, rollout_policy=None, max_rollout_turns=50,
+                 max_tree_depth=6, switches=True, seed=None):
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy or greedy_policy
+        self.max_rollout_turns = max_rollout_turns
+        self.max_tree_depth = max_tree_depth
+        self.switches = switches
+        self.rng = random.Random(seed)
+
+        self.root = None
+        self.rollouts = 0           # finished during the last think()
+        self.rollout_seconds = 0.0
+        self.reused_visits = 0      # root visits carried over from the previous turn
+
+        self._source = None         # the battle being played
+        self._seen_actions = None
+        self._battle = None         # scratch copy for tree walks and local rollouts
+        self._root_state = None
+        self._we_are_player = False
+        self._key = None
+        self._payload = None
+        self._pool = None
+        self._pending = {}
+
+    @property
+    def rollouts_per_second(self):
+        return self.rollouts / self.rollout_seconds if self.rollout_seconds else 0.0
+
+    def __call__(self, battle, player, opponent):
+        self.ponder(battle, player, opponent, self.time_budget)
+        return self.best_action()
+
+    def ponder(self, battle, player, opponent, seconds):
+        """Think for up to `seconds` without deciding; safe to call once per frame"""
+        self.begin(battle, player, opponent)
+        self.think(seconds)
+
+    def begin(self, battle, player, opponent):
+        """Point the search at the battle's current position, keeping the subtree for the
+        turn that was actually played if there is one"""
+        if battle is not self._source:
+            self._start_battle(battle, player, opponent)
+        elif battle.last_actions is not None and battle.last_actions is not self._seen_actions:
+            player_action, opponent_action = battle.last_actions
+            ours, theirs = (player_action, opponent_action) if self._we_are_player else (opponent_action, player_action)
+            child = self.root.children.get((action_key(ours), action_key(theirs)))
+            self.root = child or Node()
+
+        self._seen_actions = battle.last_actions
+        self.reused_visits = self.root.visits
+        restore(self._battle, snapshot(battle, rng=False))
+        self._root_state = snapshot(self._battle, rng=False)
+
+    def _start_battle(self, battle, player, opponent):
+        self._source = battle
+        self._we_are_player = player is battle.player
+        self._battle = RolloutBattle(battle.player.copy(), battle.opponent.copy(), self.rng.random())
+        self.root = Node()
+        # Rollouts still queued from the last battle would only hold up this one's:
+        # cancel them (ones already running finish and are dropped with the dict)
+        for future in self._pending:
+            future.cancel()
+        self._pending = {}
+        self._key = uuid.uuid4().hex
+        self._payload = None
+        if self.workers:
+            self._payload = pickle.dumps(
+                (_headless_copy(battle.player), _headless_copy(battle.opponent), self.rollout_policy))
+
+    def think(self, seconds):
+        start = time.perf_counter()
+        deadline = start + seconds
+        self.rollouts = 0
+        if not self.workers:
+            while True:
+                path, leaf = self._select()
+                restore(self._battle, leaf)
+                # The deadline also cuts a rollout short, so a few-millisecond ponder
+                # slice never waits for a long playout to finish
+                self._backpropagate(path, play_rollout(self._battle, self.rollout_policy, self._we_are_player,
+                                                       self.max_rollout_turns, deadline))
+                self.rollouts += 1
+                if time.perf_counter() >= deadline:
+                    break
+        else:
+            pool = self._get_pool()
+            while True:
+                while len(self._pending) < self.workers * 2:
+                    path, leaf = self._select()
+                    future = pool.submit(_remote_rollout, self._key, self._payload, leaf, self.rng.random(),
+                                         self._we_are_player, self.max_rollout_turns)
+                    self._pending[future] = path
+                done, _ = wait(self._pending, timeout=max(0.0, deadline - time.perf_counter()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._backpropagate(self._pending.pop(future), future.result())
+                    self.rollouts += 1
+                if time.perf_counter() >= deadline:
+                    break
+        self.rollout_seconds = time.perf_counter() - start
+
+    def best_action(self):
+        """Our most visited root action (falls back to the first legal action)"""
+        restore(self._battle, self._root_state)
+        us, _ = self._sides()
+        actions = legal_actions(us, None, self.switches)
+        stats = self.root.stats[US]
+        return max(actions, key=lambda a: stats.get(action_key(a), (0, 0))[0])
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._pending = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _sides(self):
+        if self._we_are_player:
+            return self._battle.player, self._battle.opponent
+        return self._battle.opponent, self._battle.player
+
+    def _select(self):
+        """Walk down the tree from the root, playing each joint action with fresh dice.
+        Returns the path taken (with virtual loss applied) and the leaf's state."""
+        battle = self._battle
+        restore(battle, self._root_state)
+        battle.rng.seed(self.rng.random())
+
+        node, path = self.root, []
+        while not battle.battle_over and len(path) < self.max_tree_depth:
+            us, them = self._sides()
+            ours = self._pick(node, US, legal_actions(us, None, self.switches))
+            theirs = self._pick(node, THEM, legal_actions(them, None, self.switches))
+            keys = (action_key(ours), action_key(theirs))
+            self._apply_virtual_loss(node, keys)
+            path.append((node, keys))
+
+            if self._we_are_player:
+                battle.take_turn(ours, theirs)
+            else:
+                battle.take_turn(theirs, ours)
+
+            child = node.children.get(keys)
+            if child is None:
+                node.children[keys] = Node()
+                break
+            node = child
+        return path, snapshot(battle, rng=False)
+
+    def _pick(self, node, side, actions):
+        stats = node.stats[side]
+        for action in actions:
+            if action_key(action) not in stats:
+                return action
+        log_visits = math.log(max(1, node.visits))
+
+        def ucb(action):
+            visits, total = stats[action_key(action)]
+            return total / visits + self.exploration * math.sqrt(log_visits / visits)
+        return max(actions, key=ucb)
+
+    def _apply_virtual_loss(self, node, keys):
+        # Count the visit now and score it as a loss for both sides until the rollout
+        # returns, so concurrent selections spread out over the tree
+        node.visits += 1
+        for side, key in enumerate(keys):
+            entry = node.stats[side].setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] -= VIRTUAL_LOSS
+
+    def _backpropagate(self, path, value):
+        for node, (ours, theirs) in path:
+            node.stats[US][ours][1] += value + VIRTUAL_LOSS
+            node.stats[THEM][theirs][1] += -value + VIRTUAL_LOSS
@@ -1,17 +1,27 @@
 import gymnasium as gym
 import numpy as np
-import random
 import logging
 from gymnasium import spaces
 from models.battle_manager import BattleManager
 from models.player import Player
-from models.type_chart import get_type_multiplier
+from models.player_action import PlayerAction
+from models.pokemon import Pokemon
+from models.rng import battle_rng
+from models.type_chart import type_effectiveness
 from data.loaders import load_pokemon, get_move_lookup
 
+# Opponent action meaning "none given": the env picks the opponent's move itself, with
+# its opponent_model or else the greedy fallback, as it does without external actions
+NO_OPPONENT_ACTION = -1
+
 class PokemonEnv(gym.Env):
-    def __init__(self, opponent_model):
+    def __init__(self, opponent_model, random_ivs=True):
         super().__init__()
         self.move_lookup = get_move_lookup()
+        # Roll new IVs every episode, as loading the species afresh used to
+        self.random_ivs = random_ivs
+        # IV rolls, random fallback moves and the battles' coin flips; reset(seed=...) reseeds it
+        self.rng = battle_rng()
 
         # 4 possible moves
         self.action_space = spaces.Discrete(4)
@@ -22,57 +32,90 @@ class PokemonEnv(gym.Env):
 
         self._setup_battle()
         self.opponent_model = opponent_model
+        # Set by ai.batched_opponent.BatchedOpponent, which picks the opponent's moves for
+        # many envs in one predict() call: step() then takes (action, opponent_action) and
+        # each info carries the opponent's observation for the next pick. An
+        # opponent_action of NO_OPPONENT_ACTION leaves the choice to the env.
+        self.external_opponent = False
+
+    def use_external_opponent(self):
+        self.external_opponent = True
 
     def _setup_battle(self):
+        # Loaded once per env; reset() reuses the Pokemon rather than reloading them
         self.player = Player("AI", is_ai=True, team=[load_pokemon("pikachu", self.move_lookup)])
         self.opponent = Player("Opponent AI", is_ai=True, team=[load_pokemon("charmander", self.move_lookup)])
 
-        self.battle = BattleManager(self.player, self.opponent)
+        self.battle = self._new_battle()
+
+    def _new_battle(self):
+        battle = BattleManager(self.player, self.opponent, rng=self.rng)
+        battle.text_log = False     # nobody reads it during training
+        return battle
+
+    def _reset_battle(self):
+        for side in (self.player, self.opponent):
+            side.active_index = 0
+            for pokemon in side.team:
+                pokemon.reset_battle_state(Pokemon.generate_random_iv(self.rng) if self.random_ivs else None)
+        self.battle = self._new_battle()
 
     def reset(self, *, seed=None, options=None):
         super().reset(seed=seed)
-        self._setup_battle()
-        return self._get_obs(), {}
+        if seed is not None:
+            self.rng.seed(seed)
+        self._reset_battle()
+        return self._get_obs(), self._info()
+
+    def _info(self):
+        if self.external_opponent:
+            return {"opponent_obs": self._get_obs(perspective="opponent")}
+        return {}
 
     def step(self, action):
+        opponent_choice = NO_OPPONENT_ACTION
+        if self.external_opponent:
+            action, opponent_choice = action
+
         # Make sure action is valid
         moves = self.player.active_pokemon().moves
         if action >= len(moves):
-            action = random.randint(0, len(moves) - 1)
+            action = self.rng.randint(0, len(moves) - 1)
 
         chosen_move = moves[action]
-        player_action = self.battle.make_ai_action(self.player, move=chosen_move)
+        player_action = PlayerAction(type="move", move=chosen_move)
         
-        if self.opponent_model:
-            # Use opponent_model to predict a move based on their perspective
-            obs = self._get_obs(perspective="opponent")
-            action, _ = self.opponent_model.predict(obs, deterministic=True)
+        if opponent_choice != NO_OPPONENT_ACTION or self.opponent_model:
+            if opponent_choice != NO_OPPONENT_ACTION:
+                action = opponent_choice
+            else:
+                # Use opponent_model to predict a move based on their perspective
+                obs = self._get_obs(perspective="opponent")
+                action, _ = self.opponent_model.predict(obs, deterministic=True)
             if action >= len(self.opponent.active_pokemon().moves):
-                action = random.randint(0, len(self.opponent.active_pokemon().moves) - 1)
+                action = self.rng.randint(0, len(self.opponent.active_pokemon().moves) - 1)
 
             move = self.opponent.active_pokemon().moves[action]
-            opponent_action = self.battle.make_ai_action(self.opponent, move=move)
+            opponent_action = PlayerAction(type="move", move=move)
         else:
             # Fallback logic if no model: pick best move
             opponent_moves = self.opponent.active_pokemon().moves
             best_score = -float("inf")
 
             for move in opponent_moves:
-                if self.opponent.active_pokemon().battle_stats.pp.get(move.name, 0) <= 0:
+                if not self.opponent.active_pokemon().battle_stats.has_pp(move.name):
                     continue
 
                 stab = 1.5 if move.move_type in self.opponent.active_pokemon().types else 1.0
-                effectiveness = 1.0
-                for t in self.player.active_pokemon().types:
-                    effectiveness *= get_type_multiplier(move.move_type, t)
-                    
+                effectiveness = type_effectiveness(move.move_type, self.player.active_pokemon().types)
+
                 score = (move.power or 0) * stab * effectiveness
 
                 if score > best_score:
                     best_score = score
                     best_move = move
 
-            opponent_action = self.battle.make_ai_action(self.opponent, move=best_move)
+            opponent_action = PlayerAction(type="move", move=best_move)
 
         # --- Reward shaping block ---
         prev_opp_hp = self.opponent.active_pokemon().battle_stats.current_hp
@@ -102,40 +145,40 @@ class PokemonEnv(gym.Env):
         terminated = done
         truncated = False
 
-        return self._get_obs(), reward, terminated, truncated, {}
+        return self._get_obs(), reward, terminated, truncated, self._info()
     
     def _get_obs(self, perspective="player"):
         if perspective == "player":
-            p = self.player.active_pokemon()
-            o = self.opponent.active_pokemon()
-        else:
-            p = self.opponent.active_pokemon()
-            o = self.player.active_pokemon()
-
-        obs = [
-            p.battle_stats.current_hp / p.stats["hp"],
-            o.battle_stats.current_hp / o.stats["hp"]
-        ]
-
-        for i in range(4):
-            if i < len(p.moves):
-                move = p.moves[i]
-                power = (move.power or 0) / 100
-                pp_ratio = p.battle_stats.pp.get(move.name, 0) / (move.pp or 1)
-            else:
-                power = 0
-                pp_ratio = 0
-            obs.append(power)
-            obs.append(pp_ratio)
-
-        # Add speed (normalised)
-        obs.append(p.stats["speed"] / 200)
-        obs.append(o.stats["speed"] / 200)
-
-        return np.array(obs, dtype=np.float32)
+            return observation(self.player.active_pokemon(), self.opponent.active_pokemon())
+        return observation(self.opponent.active_pokemon(), self.player.active_pokemon())
 
     def render(self):
         p = self.player.active_pokemon()
         o = self.opponent.active_pokemon()
         logging.info(f"{p.name}: {p.battle_stats.current_hp} / {p.stats['hp']}")
-        logging.info(f"{o.name}: {o.battle_stats.current_hp} / {o.stats['hp']}")
\ No newline at end of file
+        logging.info(f"{o.name}: {o.battle_stats.current_hp} / {o.stats['hp']}")
+
+
+def observation(p, o):
+    """The 12-value observation PokemonEnv gives an agent whose active Pokemon is p facing o"""
+    obs = [
+        p.battle_stats.current_hp / p.stats["hp"],
+        o.battle_stats.current_hp / o.stats["hp"]
+    ]
+
+    for i in range(4):
+        if i < len(p.moves):
+            move = p.moves[i]
+            power = (move.power or 0) / 100
+            pp_ratio = p.battle_stats.pp.get(move.name, 0) / (move.pp or 1)
+        else:
+            power = 0
+            pp_ratio = 0
+        obs.append(power)
+        obs.append(pp_ratio)
+
+    # Add speed (normalised)
+    obs.append(p.stats["speed"] / 200)
+    obs.append(o.stats["speed"] / 200)
+
+    return np.array(obs, dtype=np.float32)
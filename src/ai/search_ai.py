@@ -0,0 +1,232 @@
+# search_ai.py
+# Depth-limited expectimax AI. For each of our moves it looks at every opponent reply
+# and every chance outcome of the turn (hits/misses, crits, status procs, full
+# paralysis, sleep length), by replaying the turn from a BattleState snapshot with
+# the coin flips scripted. Iterative deepening keeps each decision within a time budget.
+#
+# Usage: battle.opponent_ai = SearchAI(depth=2, time_budget=0.5)
+
+import time
+
+from models.battle_state import snapshot, restore
+from models.damage_distribution import damage_distribution
+from models.player_action import PlayerAction
+from models.sim_battle import SimBattle
+
+WIN_SCORE = 100.0
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class ScriptedBattle(SimBattle):
+    """Headless battle whose coin flips follow a script of option indices.
+
+    Options for each decision are ordered most likely first; once the script runs out,
+    every further decision takes its most likely option. The decisions taken and their
+    probabilities are recorded in `trace` so the caller can branch on them.
+    """
+
+    def __init__(self, player, opponent, script=()):
+        super().__init__(player, opponent)
+        self.script = script
+        self.trace = []  # (chosen index, [probability of each option])
+
+    def chance(self, probability):
+        if probability >= 1:
+            return True
+        if probability <= 0:
+            return False
+        if probability >= 0.5:
+            return self._decide([True, False], [probability, 1 - probability])
+        return self._decide([False, True], [1 - probability, probability])
+
+    def roll_int(self, low, high):
+        values = list(range(low, high + 1))
+        return self._decide(values, [1 / len(values)] * len(values))
+
+    def _decide(self, values, probabilities):
+        position = len(self.trace)
+        index = self.script[position] if position < len(self.script) else 0
+        self.trace.append((index, probabilities))
+        return values[index]
+
+
+def turn_outcomes(battle, state, player_action, opponent_action, min_probability=0.0):
+    """Every chance outcome of one turn from `state`, as (probability, BattleState after).
+
+    `battle` is a ScriptedBattle used as scratch space: the turn is replayed on it once
+    per outcome, restoring `state` each time. Branches less likely than min_probability
+    are not expanded; the probabilities returned are renormalised to sum to 1.
+    """
+    outcomes = []
+    scripts = [[]]
+    while scripts:
+        script = scripts.pop()
+        restore(battle, state)
+        battle.script, battle.trace = script, []
+        battle.take_turn(player_action, opponent_action)
+
+        probability = 1.0
+        for position, (index, probabilities) in enumerate(battle.trace):
+            if position >= len(script):
+                # First time down this path: queue the alternatives of each new decision
+                prefix = [i for i, _ in battle.trace[:position]]
+                for alternative in range(1, len(probabilities)):
+                    if probability * probabilities[alternative] >= min_probability:
+                        scripts.append(prefix + [alternative])
+            probability *= probabilities[index]
+        outcomes.append((probability, snapshot(battle, rng=False)))
+
+    total = sum(p for p, _ in outcomes)
+    return [(p / total, outcome) for p, outcome in outcomes]
+
+
+def legal_actions(player, opponent=None, switches=False):
+    """Moves with PP left (or the first move if none), plus switches if enabled.
+
+    Given the opponent, moves are ordered by expected damage against its active
+    Pokemon: the search keeps the first of equally good actions, and trying strong
+    moves first lets it prune the rest sooner.
+    """
+    pokemon = player.active_pokemon()
+    moves = [m for m in pokemon.moves if pokemon.battle_stats.has_pp(m.name)] or pokemon.moves[:1]
+    if opponent is not None:
+        target = opponent.active_pokemon()
+        moves.sort(key=lambda m: damage_distribution(pokemon, target, m).mean, reverse=True)
+    actions = [PlayerAction(type="move", move=m) for m in moves]
+    if switches:
+        actions += [
+            PlayerAction(type="switch", switch_to=i)
+            for i, p in enumerate(player.team)
+            if i != player.active_index and not p.is_fainted()
+        ]
+    return actions
+
+
+def evaluate(us, them):
+    """Heuristic value of a position for `us`: remaining HP fractions plus a bonus per
+    Pokemon still standing, relative to the other side. Wins and losses are +-WIN_SCORE."""
+    ours = _side_score(us)
+    theirs = _side_score(them)
+    if not them.has_available_pokemon() and us.has_available_pokemon():
+        return WIN_SCORE
+    if not us.has_available_pokemon() and them.has_available_pokemon():
+        return -WIN_SCORE
+    return ours - theirs
+
+
+def _side_score(player):
+    score = 0.0
+    for p in player.team:
+        if not p.is_fainted():
+            score += 0.5 + p.battle_stats.current_hp / p.battle_stats.max_hp
+    return score
+
+
+class SearchAI:
+    """Expectimax over our moves, the opponent's replies and the turn's chance outcomes.
+
+    depth          -- turns to look ahead (iterative deepening stops early on timeout)
+    time_budget    -- seconds per decision; the deepest completed search is used
+    min_probability -- chance branches below this path probability aren't expanded
+    opponent_model -- "mean" averages over the opponent's replies, "min" assumes it always
+                      finds the best reply to our move (stronger in theory, but so
+                      pessimistic that losing lines all look alike)
+    switches       -- also consider switching out (more nodes per ply)
+    """
+
+    def __init__(self, depth=2, time_budget=0.5, min_probability=0.01, opponent_model="mean", switches=True):
+        if opponent_model not in ("min", "mean"):
+            raise ValueError(f"Unknown opponent model: {opponent_model}")
+        self.depth = depth
+        self.time_budget = time_budget
+        self.min_probability = min_probability
+        self.opponent_model = opponent_model
+        self.switches = switches
+        self.nodes = 0
+        self.completed_depth = 0
+        self._deadline = None
+        self._we_are_player = True
+        self._battle = None
+
+    def __call__(self, battle, player, opponent):
+        return self.choose_action(player, opponent, we_are_player=player is battle.player)
+
+    def choose_action(self, player, opponent, we_are_player=False):
+        """Best action for `player` against `opponent` from the current position.
+        we_are_player says which side of the battle `player` is on (it decides speed ties)."""
+        self.nodes = 0
+        self.completed_depth = 0
+        self._deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+        self._we_are_player = we_are_player
+
+        # Search on copies, so the real battle (and its UI objects) is never touched
+        if we_are_player:
+            self._battle = ScriptedBattle(player.copy(), opponent.copy())
+        else:
+            self._battle = ScriptedBattle(opponent.copy(), player.copy())
+        root = snapshot(self._battle, rng=False)
+
+        actions = legal_actions(player, opponent, self.switches)
+        best_action = actions[0]
+        for depth in range(1, self.depth + 1):
+            try:
+                best_action = self._best_action(root, actions, depth)[0]
+            except SearchTimeout:
+                break
+            self.completed_depth = depth
+            # Search the current best first next time round, so pruning kicks in sooner
+            actions = [best_action] + [a for a in actions if a is not best_action]
+        return best_action
+
+    def _sides(self):
+        """(us, them) on the scratch battle"""
+        if self._we_are_player:
+            return self._battle.player, self._battle.opponent
+        return self._battle.opponent, self._battle.player
+
+    def _best_action(self, state, actions, depth):
+        restore(self._battle, state)
+        us, them = self._sides()
+        replies = legal_actions(them, us, self.switches)
+
+        best_action, best_value = None, float("-inf")
+        for action in actions:
+            value = self._action_value(state, action, replies, depth, best_value)
+            if value > best_value:
+                best_action, best_value = action, value
+        return best_action, best_value
+
+    def _action_value(self, state, action, replies, depth, alpha):
+        values = []
+        for reply in replies:
+            value = self._expected_value(state, action, reply, depth)
+            values.append(value)
+            if self.opponent_model == "min" and value <= alpha:
+                # The opponent already has a reply that makes this worse than our best
+                return value
+        return min(values) if self.opponent_model == "min" else sum(values) / len(values)
+
+    def _expected_value(self, state, action, reply, depth):
+        # Depth 1 always completes so there is always a move to play
+        if depth > 1 and self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if self._we_are_player:
+            outcomes = turn_outcomes(self._battle, state, action, reply, self.min_probability)
+        else:
+            outcomes = turn_outcomes(self._battle, state, reply, action, self.min_probability)
+        self.nodes += len(outcomes)
+
+        total = 0.0
+        for probability, outcome in outcomes:
+            restore(self._battle, outcome)
+            us, them = self._sides()
+            if depth == 1 or outcome.battle_over:
+                value = evaluate(us, them)
+            else:
+                value = self._best_action(outcome, legal_actions(us, them, self.switches), depth - 1)[1]
+            total += probability * value
+        return total
@@ -1,6 +1,6 @@
 from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import DummyVecEnv
 from ai.pokemon_env import PokemonEnv
+from ai.vec_pokemon_env import VecPokemonEnv
 import logging
 
 logging.basicConfig(
@@ -9,15 +9,17 @@ logging.basicConfig(
     format="%(asctime)s - %(message)s"
 )
 
+# Battles stepped together per env step; n_steps keeps PPO's 2048-step rollouts
+NUM_ENVS = 16
+
 # Step 1: Create initial environment (no opponent model yet)
-env = DummyVecEnv([lambda: PokemonEnv(opponent_model=None)])
+env = VecPokemonEnv(num_envs=NUM_ENVS, opponent_model=None)
 
 # Step 2: Create PPO model
-model = PPO("MlpPolicy", env, verbose=1)
+model = PPO("MlpPolicy", env, n_steps=2048 // NUM_ENVS, verbose=1)
 
 # Step 3: Rewrap the environment with the model as its opponent
-# Note: We use lambda again to recreate envs with opponent model set
-self_play_env = DummyVecEnv([lambda: PokemonEnv(opponent_model=model)])
+self_play_env = VecPokemonEnv(num_envs=NUM_ENVS, opponent_model=model)
 
 # Step 4: Set new environment and begin training
 model.set_env(self_play_env)
@@ -0,0 +1,214 @@
+# train_selfplay.py
+# Self-play PPO training with the battles spread over worker processes. Each worker
+# runs its own PokemonEnv in a SubprocVecEnv; the opponent is a NumPy snapshot of the
+# policy's weights that is shipped to every worker at the start and then every
+# `sync_every` rollouts, so workers never call back into the live (training) model.
+# By default the snapshot stays in this process instead: BatchedOpponent gathers the
+# opponent observations from all workers and picks their moves in one batched pass per
+# step (--per-env-opponent ships it to the workers as before).
+# Env steps/s and CPU utilisation (this process plus all workers) are logged with
+# PPO's own metrics after every rollout.
+#
+# Usage: python -m ai.train_selfplay --workers 8 --timesteps 200000 --sync-every 4
+
+import argparse
+import functools
+import logging
+import os
+import time
+
+import gymnasium as gym
+import numpy as np
+from stable_baselines3 import PPO
+from stable_baselines3.common.callbacks import BaseCallback
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
+from ai.batched_opponent import BatchedOpponent
+from ai.pokemon_env import PokemonEnv
+
+ACTIVATIONS = {
+    "Tanh": np.tanh,
+    "ReLU": lambda x: np.maximum(x, 0),
+}
+
+
+class PolicySnapshot:
+    """Frozen NumPy copy of a PPO policy's action network.
+
+    Has the predict() signature of an SB3 model, so it can stand in as PokemonEnv's
+    opponent_model, but it is a few small arrays: cheap to pickle to workers and free
+    of torch at inference time.
+    """
+
+    def __init__(self, layers, version=0, seed=None):
+        self.layers = layers    # (weight, bias) pairs and activation names, in order
+        self.version = version
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_model(cls, model, version=0):
+        import torch.nn as nn
+
+        policy = model.policy
+        layers = []
+        for module in list(policy.mlp_extractor.policy_net) + [policy.action_net]:
+            if isinstance(module, nn.Linear):
+                layers.append((module.weight.detach().cpu().numpy().T.copy(),
+                               module.bias.detach().cpu().numpy().copy()))
+            elif type(module).__name__ in ACTIVATIONS:
+                layers.append(type(module).__name__)
+            else:
+                raise ValueError(f"Can't snapshot policy layer {module!r}")
+        return cls(layers, version)
+
+    def logits(self, obs):
+        x = np.asarray(obs, dtype=np.float32)
+        for layer in self.layers:
+            if isinstance(layer, str):
+                x = ACTIVATIONS[layer](x)
+            else:
+                weight, bias = layer
+                x = x @ weight + bias
+        return x
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=True):
+        obs = np.asarray(observation, dtype=np.float32)
+        logits = self.logits(obs.reshape(-1, obs.shape[-1]))
+        if deterministic:
+            actions = logits.argmax(axis=1)
+        else:
+            # Gumbel-max: a sample from softmax(logits)
+            actions = (logits - np.log(-np.log(self.rng.random(logits.shape)))).argmax(axis=1)
+        return (actions[0] if obs.ndim == 1 else actions), state
+
+
+class SelfPlayWorker(gym.Wrapper):
+    """Runs in each worker process: takes opponent snapshots and reports CPU time"""
+
+    def set_opponent(self, policy):
+        self.env.unwrapped.opponent_model = policy
+        return getattr(policy, "version", None)
+
+    def cpu_seconds(self):
+        return time.process_time()
+
+
+def _make_worker(env_factory):
+    return SelfPlayWorker(env_factory())
+
+
+class SelfPlayCallback(BaseCallback):
+    """Refreshes the workers' opponent snapshot and logs each rollout's env steps/s and CPU use"""
+
+    def __init__(self, sync_every=4, verbose=0):
+        super().__init__(verbose)
+        self.sync_every = sync_every
+        self.rollouts = 0
+        self.opponent_version = 0
+        self.history = []   # one dict of throughput stats per rollout
+
+    def _on_training_start(self):
+        self._push_opponent()
+
+    def _on_rollout_start(self):
+        # Measure collection only, not the PPO update in between
+        self._mark = self._clock()
+
+    def _on_step(self):
+        return True
+
+    def _on_rollout_end(self):
+        self.rollouts += 1
+        now = self._clock()
+        wall = now["wall"] - self._mark["wall"]
+        steps = self.num_timesteps - self._mark["steps"]
+        cpu = sum(now["cpu"]) - sum(self._mark["cpu"])
+        stats = {
+            "steps_per_sec": steps / wall if wall else 0.0,
+            "cpu_utilization": cpu / (wall * (os.cpu_count() or 1)) if wall else 0.0,
+            "opponent_version": self.opponent_version,
+        }
+        self.history.append(stats)
+        for key, value in stats.items():
+            self.logger.record(f"selfplay/{key}", value)
+
+        if self.rollouts % self.sync_every == 0:
+            self._push_opponent()
+
+    def _push_opponent(self):
+        self.opponent_version += 1
+        snapshot = PolicySnapshot.from_model(self.model, self.opponent_version)
+        if isinstance(self.training_env, BatchedOpponent):
+            self.training_env.opponent_model = snapshot
+        else:
+            self.training_env.env_method("set_opponent", snapshot)
+
+    def _clock(self):
+        # This process (PPO updates, and the envs under DummyVecEnv) plus every worker
+        cpu = [time.process_time()]
+        if isinstance(self.training_env.unwrapped, SubprocVecEnv):
+            cpu += self.training_env.env_method("cpu_seconds")
+        return {"wall": time.perf_counter(), "steps": self.num_timesteps, "cpu": cpu}
+
+
+def make_vec_env(env_factory, workers, seed=0, start_method=None, batched_opponent=False):
+    """workers PokemonEnvs, each in its own process (or in this one if workers == 1)"""
+    env_fns = [functools.partial(_make_worker, env_factory)] * workers
+    if workers == 1:
+        env = DummyVecEnv(env_fns)
+    else:
+        env = SubprocVecEnv(env_fns, start_method=start_method)
+    env.seed(seed)
+    if batched_opponent:
+        env = BatchedOpponent(env)
+    return env
+
+
+def train_selfplay(total_timesteps, workers=None, env_factory=None, sync_every=4, n_steps=None,
+                   seed=0, start_method=None, batched_opponent=True, verbose=1, **ppo_kwargs):
+    """Train PPO against snapshots of itself; returns (model, callback)"""
+    workers = workers or os.cpu_count() or 1
+    env_factory = env_factory or functools.partial(PokemonEnv, opponent_model=None)
+    if n_steps is None:
+        # Keep PPO's default 2048-step rollouts whatever the worker count
+        n_steps = max(1, 2048 // workers)
+
+    env = make_vec_env(env_factory, workers, seed, start_method, batched_opponent)
+    try:
+        model = PPO("MlpPolicy", env, n_steps=n_steps, seed=seed, verbose=verbose, **ppo_kwargs)
+        callback = SelfPlayCallback(sync_every=sync_every)
+        model.learn(total_timesteps=total_timesteps, callback=callback)
+    finally:
+        env.close()
+    return model, callback
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multiprocess self-play PPO training")
+    parser.add_argument("--workers", type=int, default=None, help="env processes (default: one per CPU)")
+    parser.add_argument("--timesteps", type=int, default=100_000)
+    parser.add_argument("--sync-every", type=int, default=4, help="rollouts between opponent refreshes")
+    parser.add_argument("--n-steps", type=int, default=None, help="steps per worker per rollout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--per-env-opponent", action="store_true",
+                        help="each worker runs its own opponent copy instead of one batched predict per step")
+    parser.add_argument("--save", default="src/ai/trained_model_selfplay")
+    args = parser.parse_args()
+
+    model, callback = train_selfplay(args.timesteps, workers=args.workers, sync_every=args.sync_every,
+                                     n_steps=args.n_steps, seed=args.seed,
+                                     batched_opponent=not args.per_env_opponent)
+    model.save(args.save)
+
+    history = callback.history
+    steps_per_sec = np.mean([h["steps_per_sec"] for h in history])
+    utilization = np.mean([h["cpu_utilization"] for h in history])
+    summary = (f"Trained {model.num_timesteps} steps: {steps_per_sec:,.0f} env steps/s, "
+               f"{utilization:.0%} CPU utilisation, {callback.opponent_version} opponent snapshots")
+    print(summary)
+    logging.info(summary)
+    logging.info(f"Model saved to {args.save}.zip")
+
+
+if __name__ == "__main__":
+    main()
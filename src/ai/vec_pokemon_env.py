@@ -0,0 +1,392 @@
+# vec_pokemon_env.py
+# K PokemonEnv battles stepped in lockstep, with the battle state held in NumPy arrays
+# (HP, stats, stat stages, PP, status) instead of Player/Pokemon objects. It plugs
+# straight into stable-baselines3 in place of DummyVecEnv([PokemonEnv, ...]).
+#
+# The rules are BattleManager's for a 1v1 battle of moves, quirks included: turn order
+# by priority then effective speed (player first on ties), sleep/full paralysis checks,
+# PP, accuracy/evasion stages, crits, Move.compute_damage, ailment procs, stat stage
+# changes, and poison/burn at the end of the turn. Abilities aren't modelled (the
+# loaders give every Pokemon Static, whose hook never fires). The dice come from the
+# env's own NumPy generator, so results match the object engine in distribution, not
+# roll for roll.
+#
+# Usage: env = VecPokemonEnv(num_envs=16)
+#        model = PPO("MlpPolicy", env, n_steps=128)
+
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from models.battle_state import STAGE_STATS
+from models.damage_calc import stage_multiplier
+from models.type_chart import type_effectiveness
+
+PLAYER, OPPONENT = 0, 1
+MAX_MOVES = 4
+OBS_SIZE = 12
+
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+HP, ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE, SPEED = range(len(STATS))
+# STAGE_STATS starts at attack, so a stat's stage index is its STATS index - 1
+SPEED_STAGE, ACCURACY, EVASION = (STAGE_STATS.index(s) for s in ("speed", "accuracy", "evasion"))
+
+NO_STATUS = 0
+
+
+def _template(pokemon, move_lookup):
+    if isinstance(pokemon, str):
+        from data.loaders import load_pokemon
+        return load_pokemon(pokemon, move_lookup)
+    return pokemon
+
+
+class MoveSlots:
+    """Both sides' movesets as (side, slot) arrays, padded to MAX_MOVES"""
+
+    def __init__(self, sides, statuses):
+        shape = (2, MAX_MOVES)
+        self.count = np.array([len(p.moves[:MAX_MOVES]) for p in sides])
+        self.power = np.zeros(shape)
+        self.damaging = np.zeros(shape, dtype=bool)
+        self.physical = np.zeros(shape, dtype=bool)
+        self.burn_halves = np.zeros(shape, dtype=bool)
+        self.accuracy = np.full(shape, np.nan)      # nan: never misses
+        self.max_pp = np.zeros(shape, dtype=np.int64)
+        self.pp_scale = np.ones(shape)              # move.pp or 1, as the observation divides by
+        self.priority = np.zeros(shape, dtype=np.int64)
+        self.crit_chance = np.zeros(shape)
+        self.stab = np.ones(shape)
+        self.effectiveness = np.ones(shape)         # against the other side's types
+        self.greedy_score = np.full(shape, -np.inf)  # PokemonEnv's fallback opponent heuristic
+        self.ailment = np.zeros(shape, dtype=np.int64)
+        self.ailment_chance = np.zeros(shape)
+        self.badly_poisons = np.zeros(shape, dtype=bool)
+        self.stage_changes = np.zeros(shape + (len(STAGE_STATS),), dtype=np.int64)
+        self.targets_opponent = np.zeros(shape, dtype=bool)
+
+        for side, pokemon in enumerate(sides):
+            other = sides[1 - side]
+            for slot, move in enumerate(pokemon.moves[:MAX_MOVES]):
+                self.power[side, slot] = move.power or 0
+                self.damaging[side, slot] = move.power is not None and move.damage_class != "status"
+                self.physical[side, slot] = move.damage_class == "physical"
+                # Move.burn_halves and BattleManager.calculate_damage both check the
+                # capitalised class, so such moves are halved twice when burned
+                guts = getattr(pokemon.ability, "name", None) == "Guts"
+                self.burn_halves[side, slot] = move.damage_class == "Physical" and not guts
+                if move.accuracy is not None:
+                    self.accuracy[side, slot] = move.accuracy
+                self.max_pp[side, slot] = move.pp or 0
+                self.pp_scale[side, slot] = move.pp or 1
+                self.priority[side, slot] = move.priority or 0
+                self.crit_chance[side, slot] = move.critical_hit_chance()
+                effectiveness = type_effectiveness(move.move_type, other.types)
+                self.stab[side, slot] = move.stab(pokemon)
+                self.effectiveness[side, slot] = effectiveness
+                stab = 1.5 if move.move_type in pokemon.types else 1.0
+                self.greedy_score[side, slot] = (move.power or 0) * stab * effectiveness
+
+                effects = move.effects_info
+                if effects is None:
+                    continue
+                if effects.ailment and effects.ailment != "none":
+                    self.ailment[side, slot] = statuses.index(effects.ailment)
+                    self.ailment_chance[side, slot] = (effects.ailment_chance or 0) / 100
+                    self.badly_poisons[side, slot] = effects.is_badly_poisoning
+                for stat, change in (effects.stat_changes or {}).items():
+                    if stat in STAGE_STATS:
+                        self.stage_changes[side, slot, STAGE_STATS.index(stat)] = change
+                self.targets_opponent[side, slot] = move.target in ("opponent", "all-opponents")
+
+
+class VecPokemonEnv(VecEnv):
+    """PokemonEnv x num_envs as one stable-baselines3 VecEnv.
+
+    player / opponent are species names (loaded like PokemonEnv does) or Pokemon to use
+    as templates. Every reset rolls fresh IVs, as reloading the species does, unless
+    random_ivs=False, which keeps the templates' stats. opponent_model is any object with
+    SB3's predict(); it is called once per step for the whole batch.
+    """
+
+    def __init__(self, num_envs=16, opponent_model=None, player="pikachu", opponent="charmander",
+                 random_ivs=True, seed=None):
+        move_lookup = None
+        if isinstance(player, str) or isinstance(opponent, str):
+            from data.loaders import get_move_lookup
+            move_lookup = get_move_lookup()
+        self.templates = (_template(player, move_lookup), _template(opponent, move_lookup))
+        self.opponent_model = opponent_model
+        self.random_ivs = random_ivs
+        self.rng = np.random.default_rng(seed)
+        self.render_mode = None
+
+        # Status codes: 0 is healthy, the rest are the ailments the movesets can inflict
+        self.statuses = [None, "paralysis", "sleep", "poison", "burn"]
+        for pokemon in self.templates:
+            for move in pokemon.moves[:MAX_MOVES]:
+                ailment = getattr(move.effects_info, "ailment", None)
+                if ailment and ailment != "none" and ailment not in self.statuses:
+                    self.statuses.append(ailment)
+        self._paralysis, self._sleep, self._poison, self._burn = range(1, 5)
+
+        self.moves = MoveSlots(self.templates, self.statuses)
+        self.base = np.array([[getattr(p.base_stats, s) for s in STATS] for p in self.templates], dtype=np.int64)
+        self.level = np.array([p.level for p in self.templates], dtype=np.int64)
+        self.template_ivs = np.array([[p.iv[s] for s in STATS] for p in self.templates], dtype=np.int64)
+        self.evs = np.array([[p.ev[s] for s in STATS] for p in self.templates], dtype=np.int64)
+
+        k = num_envs
+        self.stats = np.zeros((k, 2, len(STATS)), dtype=np.int64)
+        self.hp = np.zeros((k, 2), dtype=np.int64)
+        self.stages = np.zeros((k, 2, len(STAGE_STATS)), dtype=np.int64)
+        self.pp = np.zeros((k, 2, MAX_MOVES), dtype=np.int64)
+        self.status = np.zeros((k, 2), dtype=np.int64)
+        self.badly_poisoned = np.zeros((k, 2), dtype=bool)
+        self.toxic_turns = np.zeros((k, 2), dtype=np.int64)
+        self.sleep_turns = np.zeros((k, 2), dtype=np.int64)
+        self._rows = np.arange(k)
+        self._actions = None
+
+        super().__init__(k, spaces.Box(low=0, high=1, shape=(OBS_SIZE,), dtype=np.float32), spaces.Discrete(MAX_MOVES))
+        self._reset_rows(self._rows)
+
+    # --- VecEnv interface ---
+
+    def reset(self):
+        if self._seeds[0] is not None:
+            self.rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+        self._reset_rows(self._rows)
+        return self.observations(PLAYER)
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+
+    def step_wait(self):
+        player_slots = self._valid_slots(PLAYER, self._actions)
+        opponent_slots = self._opponent_slots()
+
+        prev_hp = self.hp.copy()
+        self._take_turn(player_slots, opponent_slots)
+
+        max_hp = self.stats[:, :, HP]
+        damage_dealt = np.maximum(0, prev_hp[:, OPPONENT] - self.hp[:, OPPONENT])
+        damage_taken = np.maximum(0, prev_hp[:, PLAYER] - self.hp[:, PLAYER])
+        rewards = damage_dealt / max_hp[:, OPPONENT] - 0.2 * (damage_taken / max_hp[:, PLAYER])
+        opponent_fainted = self.hp[:, OPPONENT] <= 0
+        player_fainted = self.hp[:, PLAYER] <= 0
+        rewards = rewards + opponent_fainted - player_fainted
+        dones = opponent_fainted | player_fainted
+
+        obs = self.observations(PLAYER)
+        infos = [{} for _ in range(self.num_envs)]
+        finished = np.nonzero(dones)[0]
+        if len(finished):
+            for i in finished:
+                infos[i]["terminal_observation"] = obs[i].copy()
+                infos[i]["TimeLimit.truncated"] = False
+            self._reset_rows(finished)
+            obs[finished] = self.observations(PLAYER)[finished]
+        return obs, rewards.astype(np.float32), dones, infos
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name)] * len(self._indices(indices))
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(self._indices(indices))
+
+    def _indices(self, indices):
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+        return indices
+
+    # --- observations ---
+
+    def observations(self, side):
+        """PokemonEnv's 12-value observation for every battle, from `side`'s point of view"""
+        other = 1 - side
+        obs = np.zeros((self.num_envs, OBS_SIZE), dtype=np.float32)
+        obs[:, 0] = self.hp[:, side] / self.stats[:, side, HP]
+        obs[:, 1] = self.hp[:, other] / self.stats[:, other, HP]
+        count = self.moves.count[side]
+        obs[:, 2:2 + 2 * count:2] = self.moves.power[side, :count] / 100
+        obs[:, 3:3 + 2 * count:2] = self.pp[:, side, :count] / self.moves.pp_scale[side, :count]
+        obs[:, 10] = self.stats[:, side, SPEED] / 200
+        obs[:, 11] = self.stats[:, other, SPEED] / 200
+        return obs
+
+    # --- battle rules ---
+
+    def _reset_rows(self, rows):
+        if self.random_ivs:
+            ivs = self.rng.integers(0, 32, size=(len(rows), 2, len(STATS)))
+        else:
+            ivs = np.broadcast_to(self.template_ivs, (len(rows), 2, len(STATS)))
+        # Pokemon.calculate_stats
+        stats = (2 * self.base + ivs + self.evs // 4) * self.level[:, None] // 100 + 5
+        stats[:, :, HP] += self.level - 5 + 10
+        self.stats[rows] = stats
+        self.hp[rows] = stats[:, :, HP]
+        self.stages[rows] = 0
+        self.pp[rows] = self.moves.max_pp
+        self.status[rows] = NO_STATUS
+        self.badly_poisoned[rows] = False
+        self.toxic_turns[rows] = 0
+        self.sleep_turns[rows] = 0
+
+    def _valid_slots(self, side, actions):
+        """Actions past the end of the moveset are replaced by a random move, as in PokemonEnv"""
+        count = self.moves.count[side]
+        invalid = actions >= count
+        if invalid.any():
+            actions = actions.copy()
+            actions[invalid] = self.rng.integers(0, count, size=int(invalid.sum()))
+        return actions
+
+    def _opponent_slots(self):
+        if self.opponent_model is not None:
+            actions, _ = self.opponent_model.predict(self.observations(OPPONENT), deterministic=True)
+            return self._valid_slots(OPPONENT, np.asarray(actions, dtype=np.int64).reshape(self.num_envs))
+        # PokemonEnv's fallback: best power * STAB * effectiveness among moves with PP
+        scores = np.where(self.pp[:, OPPONENT] > 0, self.moves.greedy_score[OPPONENT], -np.inf)
+        return scores.argmax(axis=1)
+
+    def _effective_speed(self, side):
+        speed = np.trunc(self.stats[:, side, SPEED] * stage_multiplier(self.stages[:, side, SPEED_STAGE]))
+        return np.where(self.status[:, side] == self._paralysis, np.trunc(speed * 0.25), speed)
+
+    def _take_turn(self, player_slots, opponent_slots):
+        player_priority = self.moves.priority[PLAYER, player_slots]
+        opponent_priority = self.moves.priority[OPPONENT, opponent_slots]
+        player_first = (player_priority > opponent_priority) | (
+            (player_priority == opponent_priority) & (self._effective_speed(PLAYER) >= self._effective_speed(OPPONENT)))
+
+        first = np.where(player_first, PLAYER, OPPONENT)
+        second = 1 - first
+        first_slots = np.where(player_first, player_slots, opponent_slots)
+        second_slots = np.where(player_first, opponent_slots, player_slots)
+
+        rows = self._rows
+        self._use_moves(rows, first, first_slots)
+        # A fainted Pokemon doesn't get to act
+        acting = self.hp[rows, second] > 0
+        self._use_moves(rows[acting], second[acting], second_slots[acting])
+
+        ongoing = (self.hp > 0).all(axis=1)
+        self._end_of_turn(rows[ongoing])
+
+    def _use_moves(self, rows, sides, slots):
+        """BattleManager.perform_action for a move, for each (battle, side, slot)"""
+        if not len(rows):
+            return
+        rng = self.rng
+        targets = 1 - sides
+
+        # Sleep counts down on each attempt to move; full paralysis is a 25% chance
+        status = self.status[rows, sides]
+        asleep = status == self._sleep
+        self.sleep_turns[rows[asleep], sides[asleep]] -= 1
+        woke = asleep & (self.sleep_turns[rows, sides] <= 0)
+        self.status[rows[woke], sides[woke]] = NO_STATUS
+        self.sleep_turns[rows[woke], sides[woke]] = 0
+        paralysed = (status == self._paralysis) & (rng.random(len(rows)) < 0.25)
+        moving = (~asleep | woke) & ~paralysed & (self.pp[rows, sides, slots] > 0)
+
+        accuracy = self.moves.accuracy[sides, slots]
+        acc_stage = self.stages[rows, sides, ACCURACY]
+        eva_stage = self.stages[rows, targets, EVASION]
+        final_accuracy = accuracy * _acc_eva_multiplier(acc_stage) / _acc_eva_multiplier(eva_stage)
+        hit = np.isnan(accuracy) | (rng.random(len(rows)) < final_accuracy / 100)
+        hit &= moving
+
+        rows, sides, slots, targets = rows[hit], sides[hit], slots[hit], targets[hit]
+        self.pp[rows, sides, slots] -= 1
+
+        damage = self._damage(rows, sides, slots, targets)
+        self.hp[rows, targets] = np.maximum(0, self.hp[rows, targets] - damage)
+        self._apply_effects(rows, sides, slots, targets)
+
+    def _damage(self, rows, sides, slots, targets):
+        """Move.compute_damage (with the crit roll) and BattleManager.calculate_damage"""
+        moves = self.moves
+        critical = moves.damaging[sides, slots] & (self.rng.random(len(rows)) < moves.crit_chance[sides, slots])
+        physical = moves.physical[sides, slots]
+        attack_stat = np.where(physical, ATTACK, SP_ATTACK)
+        defense_stat = np.where(physical, DEFENSE, SP_DEFENSE)
+        attack_stage = self.stages[rows, sides, attack_stat - 1]
+        defense_stage = self.stages[rows, targets, defense_stat - 1]
+        attack_base = self.stats[rows, sides, attack_stat]
+        defense_base = self.stats[rows, targets, defense_stat]
+
+        attack = np.where(critical, attack_base * stage_multiplier(np.maximum(attack_stage, 0)),
+                          np.trunc(attack_base * stage_multiplier(attack_stage)))
+        defense = np.where(critical, defense_base * stage_multiplier(np.minimum(defense_stage, 0)),
+                           np.trunc(defense_base * stage_multiplier(defense_stage)))
+
+        level = self.level[sides]
+        damage = ((2 * level / 5 + 2) * moves.power[sides, slots] * attack / defense) / 50 + 2
+        damage = np.trunc(damage * moves.stab[sides, slots] * moves.effectiveness[sides, slots])
+        damage = np.where(critical, damage * 2, damage)
+        burned = moves.burn_halves[sides, slots] & (self.status[rows, sides] == self._burn)
+        damage = np.maximum(1, np.where(burned, damage // 2, damage))
+        damage = np.where(burned, damage // 2, damage)
+        return np.where(moves.damaging[sides, slots], damage, 0).astype(np.int64)
+
+    def _apply_effects(self, rows, sides, slots, targets):
+        """BattleManager.apply_move_effects: ailment procs, then stat stage changes"""
+        moves = self.moves
+        ailment = moves.ailment[sides, slots]
+        procs = (ailment != NO_STATUS) & (self.rng.random(len(rows)) < moves.ailment_chance[sides, slots])
+
+        toxic = procs & moves.badly_poisons[sides, slots]
+        self.status[rows[toxic], targets[toxic]] = self._poison
+        self.badly_poisoned[rows[toxic], targets[toxic]] = True
+        self.toxic_turns[rows[toxic], targets[toxic]] = 0
+
+        applies = procs & ~toxic & (self.status[rows, targets] == NO_STATUS)
+        r, t = rows[applies], targets[applies]
+        self.status[r, t] = ailment[applies]
+        falls_asleep = ailment[applies] == self._sleep
+        self.sleep_turns[r[falls_asleep], t[falls_asleep]] = self.rng.integers(1, 4, size=int(falls_asleep.sum()))
+
+        changes = moves.stage_changes[sides, slots]
+        changed = changes.any(axis=1)
+        if changed.any():
+            receiver = np.where(moves.targets_opponent[sides, slots], targets, sides)[changed]
+            r = rows[changed]
+            self.stages[r, receiver] = np.clip(self.stages[r, receiver] + changes[changed], -6, 6)
+
+    def _end_of_turn(self, rows):
+        """Poison (regular or badly) and burn damage for both active Pokemon"""
+        for side in (PLAYER, OPPONENT):
+            status = self.status[rows, side]
+            max_hp = self.stats[rows, side, HP]
+            badly = (status == self._poison) & self.badly_poisoned[rows, side]
+            self.toxic_turns[rows[badly], side] += 1
+            damage = np.select(
+                [badly, status == self._poison, status == self._burn],
+                [np.maximum(1, max_hp * self.toxic_turns[rows, side] // 16),
+                 np.maximum(1, max_hp // 8),
+                 np.maximum(1, max_hp // 16)],
+                0,
+            )
+            self.hp[rows, side] = np.maximum(0, self.hp[rows, side] - damage)
+
+
+def _acc_eva_multiplier(stages):
+    """Vectorized BattleStats.get_acc_eva_multiplier"""
+    return np.where(stages >= 0, (3 + stages) / 3, 3 / (3 - np.minimum(stages, 0)))
@@ -0,0 +1,16 @@
+import os
+
+SRC_DIR = os.path.dirname(__file__)
+
+# Downloaded sprites are kept on disk so later runs don't hit the network
+SPRITE_CACHE_DIR = os.environ.get("POKEMON_SPRITE_CACHE_DIR", os.path.join(SRC_DIR, "data", ".cache", "sprites"))
+SPRITE_CACHE_MAX_BYTES = int(os.environ.get("POKEMON_SPRITE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+# Offline mode never touches the network: sprites come from the cache or not at all
+OFFLINE = os.environ.get("POKEMON_OFFLINE", "") not in ("", "0", "false", "False")
+
+# Prebuilt sprite atlas (python -m graphics.sprite_atlas)
+SPRITE_ATLAS_DIR = os.environ.get("POKEMON_SPRITE_ATLAS_DIR", os.path.join(SRC_DIR, "data", ".cache", "atlas"))
+
+# Per-record checkpoints for the PokeAPI ingestion pipeline
+INGEST_CHECKPOINT_DIR = os.environ.get("POKEMON_INGEST_DIR", os.path.join(SRC_DIR, "data", ".cache", "ingest"))
@@ -0,0 +1,152 @@
+"""Concurrent, resumable PokeAPI ingestion.
+
+Records are fetched at most `concurrency` at a time over one pooled
+httpx.AsyncClient, and each one is checkpointed to its own file as soon as it
+arrives, so an interrupted run carries on where it stopped. Checkpoints keep the
+response's ETag: a revalidating run sends If-None-Match and only downloads the
+records that changed (the rest come back 304 Not Modified).
+"""
+import asyncio
+import json
+import logging
+import os
+
+import httpx
+
+import config
+from data.api_client.cleaners import clean_pokemon, clean_move, clean_ability
+
+POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+
+# resource -> (ids the game uses, cleaner)
+RESOURCES = {
+    "pokemon": (range(1, 494), clean_pokemon),
+    "move": (range(1, 468), clean_move),
+    "ability": (range(1, 124), clean_ability),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class IngestStats:
+    def __init__(self):
+        self.fetched = 0        # downloaded (new or changed)
+        self.not_modified = 0   # revalidated, 304
+        self.skipped = 0        # already checkpointed, not revalidated
+        self.failed = {}        # id -> error message
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def __repr__(self):
+        return (f"IngestStats(fetched={self.fetched}, not_modified={self.not_modified}, "
+                f"skipped={self.skipped}, failed={len(self.failed)})")
+
+
+class CheckpointStore:
+    """One JSON file per record: {"etag": ..., "data": <cleaned record>}"""
+
+    def __init__(self, resource, root=None):
+        self.dir = os.path.join(root or config.INGEST_CHECKPOINT_DIR, resource)
+        os.makedirs(self.dir, exist_ok=True)
+
+    def path(self, record_id):
+        return os.path.join(self.dir, f"{record_id}.json")
+
+    def load(self, record_id):
+        try:
+            with open(self.path(record_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, record_id, etag, record):
+        path = self.path(record_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"etag": etag, "data": record}, f)
+        os.replace(tmp_path, path)
+
+    def records(self, ids):
+        """Checkpointed records in id order, one at a time"""
+        for record_id in ids:
+            checkpoint = self.load(record_id)
+            if checkpoint is not None:
+                yield checkpoint["data"]
+
+
+async def fetch(client, url, etag=None, retries=3, backoff=0.5):
+    """GET url, conditionally if we have an ETag. Returns the response (200 or 304)."""
+    headers = {"If-None-Match": etag} if etag else {}
+    for attempt in range(retries + 1):
+        try:
+            response = await client.get(url, headers=headers)
+            if response.status_code not in RETRY_STATUSES:
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+            error = httpx.HTTPStatusError(f"{response.status_code} from {url}", request=response.request, response=response)
+        except httpx.TransportError as e:
+            error = e
+        if attempt < retries:
+            await asyncio.sleep(backoff * 2 ** attempt)
+    raise error
+
+
+async def ingest_resource(resource, ids=None, clean=None, base_url=POKEAPI_BASE_URL, concurrency=16,
+                          checkpoint_dir=None, revalidate=False, retries=3, backoff=0.5, client=None):
+    """Fetch every record of a PokeAPI resource into the checkpoint store.
+
+    Records that are already checkpointed are skipped unless revalidate=True, in
+    which case they're re-requested with their ETag. One failing record doesn't stop
+    the others; failures are reported in the returned IngestStats.
+    """
+    default_ids, default_clean = RESOURCES.get(resource, (None, None))
+    ids = default_ids if ids is None else ids
+    clean = clean or default_clean
+    store = CheckpointStore(resource, checkpoint_dir)
+    stats = IngestStats()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def ingest_one(http, record_id):
+        checkpoint = store.load(record_id)
+        if checkpoint is not None and not revalidate:
+            stats.skipped += 1
+            return
+
+        etag = checkpoint.get("etag") if checkpoint else None
+        async with semaphore:
+            try:
+                response = await fetch(http, f"{base_url}/{resource}/{record_id}/", etag, retries, backoff)
+            except Exception as e:
+                logging.info(f"Failed to fetch {resource} {record_id}: {e}")
+                stats.failed[record_id] = str(e)
+                return
+
+        if response.status_code == 304:
+            stats.not_modified += 1
+            return
+        try:
+            record = clean(response.json())
+        except Exception as e:
+            stats.failed[record_id] = f"Could not parse {resource} {record_id}: {e}"
+            return
+        store.save(record_id, response.headers.get("ETag"), record)
+        stats.fetched += 1
+
+    async def run(http):
+        await asyncio.gather(*(ingest_one(http, record_id) for record_id in ids))
+
+    if client is not None:
+        await run(client)
+    else:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as http:
+            await run(http)
+    return stats
+
+
+def ingest(resource, **kwargs):
+    """Synchronous wrapper around ingest_resource"""
+    return asyncio.run(ingest_resource(resource, **kwargs))
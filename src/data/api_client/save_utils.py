@@ -1,8 +1,32 @@
 import json
 import os
 
-def save_json(filename: str, data: list):
-    path = os.path.join("data", filename)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
-        f.write(",\n")
\ No newline at end of file
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def save_json(filename: str, data, directory=DATA_DIR):
+    """Stream records to <directory>/<filename> as a JSON array, one record per line.
+
+    `data` can be any iterable (a generator keeps memory flat). The array is written
+    to a temporary file and renamed into place once complete, so an interrupted
+    write never leaves a truncated file behind. Returns the number of records written.
+    """
+    path = os.path.join(directory, filename)
+    tmp_path = path + ".tmp"
+    count = 0
+    try:
+        with open(tmp_path, "w") as f:
+            f.write("[")
+            for record in data:
+                f.write(",\n" if count else "\n")
+                json.dump(record, f)
+                count += 1
+            f.write("\n]\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
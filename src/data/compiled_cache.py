@@ -0,0 +1,101 @@
+"""Pre-parsed pickle cache for the JSON data files.
+
+Parsing pokemon.json/moves.json and building Move objects on every start-up is slow,
+so the compiled result is pickled to data/.cache and reused for as long as the
+source JSON is unchanged. Run `python -m data.compiled_cache` to build it ahead
+of time; otherwise it is (re)built the first time the data is needed.
+"""
+import gc
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+# Bump when the compiled formats (or the classes pickled inside them) change shape
+CACHE_VERSION = 1
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+
+def _cache_key(compile_fn, digest):
+    return f"{CACHE_VERSION}:{compile_fn.__module__}.{compile_fn.__qualname__}:{digest}"
+
+
+def _read_header(cache_path):
+    try:
+        f = open(cache_path, "rb")
+    except OSError:
+        return None, None
+    try:
+        return pickle.load(f), f
+    except Exception:
+        f.close()
+        return None, None
+
+
+def _load_payload(f):
+    # Unpickling millions of small objects is much faster without the cyclic GC running
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.load(f)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        f.close()
+
+
+def _write_cache(cache_path, header, payload):
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # A read-only install still works, it just parses the JSON every time
+        logging.info(f"Could not write data cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_compiled(source_path, compile_fn, cache_dir=CACHE_DIR, force=False):
+    """Return compile_fn(<parsed source JSON>), from the cache when the JSON hasn't changed.
+
+    The cache is keyed by a SHA-256 of the JSON. The file's size and mtime are stored
+    alongside so the common case doesn't even need to read the JSON to hash it.
+    """
+    cache_path = os.path.join(cache_dir, os.path.basename(source_path) + ".pickle")
+    st = os.stat(source_path)
+    stat_key = (st.st_size, st.st_mtime_ns)
+
+    header, f = (None, None) if force else _read_header(cache_path)
+    if header is not None:
+        if header["stat"] == stat_key and header["key"].startswith(_cache_key(compile_fn, "")):
+            return _load_payload(f)
+
+    with open(source_path, "rb") as src:
+        raw = src.read()
+    key = _cache_key(compile_fn, hashlib.sha256(raw).hexdigest())
+
+    if header is not None and header["key"] == key:
+        # Touched but not modified (e.g. a fresh checkout): refresh the stat stamp only
+        payload = _load_payload(f)
+    else:
+        if f is not None:
+            f.close()
+        payload = compile_fn(json.loads(raw))
+    _write_cache(cache_path, {"key": key, "stat": stat_key}, payload)
+    return payload
+
+
+def main():
+    from data import loaders
+    loaders.build_caches()
+    print(f"Data cache written to {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,22 @@
 import json
+import logging
 import os
+import sys
 from models.move import Move, MoveEffects, HitInfo
 from models.pokemon import Pokemon, load_sprite
-from models.base_stats import BaseStats
+from models.species import Species
+from models.learnset import Learnset, DEFAULT_VERSION_GROUP
 from models.abilities import Static
 from models.types import Type
+from data.compiled_cache import load_compiled
 
 base_dir = os.path.dirname(__file__)
 
-with open(os.path.join(base_dir, "pokemon.json"), "r") as f:
-    POKEMON_DATA = json.load(f)
+POKEMON_PATH = os.path.join(base_dir, "pokemon.json")
+MOVES_PATH = os.path.join(base_dir, "moves.json")
 
-with open(os.path.join(base_dir, "moves.json"), "r") as f:
-    MOVES_DATA = json.load(f)
+# Compiled data, loaded on first use (see __getattr__ below)
+_loaded = {}
 
 def load_move(move_data):
     parsed_stat_changes = {}
@@ -59,71 +63,136 @@ def load_move(move_data):
 
     return move
 
-MOVE_LOOKUP = {move["name"].lower(): load_move(move) for move in MOVES_DATA}
+def compile_moves(moves_data):
+    return {move["name"].lower(): load_move(move) for move in moves_data}
+
+def compile_species(pokemon_data):
+    """Keep only what the game uses, with the learnset flattened to
+    (move, learn method, version group, level) rows in PokeAPI order."""
+    intern = sys.intern
+    return {
+        "id": pokemon_data["id"],
+        "name": pokemon_data["name"],
+        "types": pokemon_data["types"],
+        "stats": pokemon_data["stats"],
+        "sprites": {
+            "front_default": pokemon_data["sprites"].get("front_default"),
+            "back_default": pokemon_data["sprites"].get("back_default"),
+        },
+        "abilities": [a["ability"]["name"] for a in pokemon_data.get("abilities", [])],
+        "learnset": [
+            (
+                intern(move_entry["move"]["name"]),
+                intern(detail["move_learn_method"]["name"]),
+                intern(detail["version_group"]["name"]),
+                detail["level_learned_at"],
+            )
+            for move_entry in pokemon_data["moves"]
+            for detail in move_entry["version_group_details"]
+        ],
+    }
+
+def compile_pokemon_data(pokemon_data):
+    return [compile_species(p) for p in pokemon_data]
+
+def get_pokemon_data():
+    if "pokemon" not in _loaded:
+        _loaded["pokemon"] = load_compiled(POKEMON_PATH, compile_pokemon_data)
+    return _loaded["pokemon"]
+
+def normalize_species_name(name: str) -> str:
+    return name.strip().lower().replace(" ", "-")
+
+def get_species_index():
+    """Species keyed by normalized name and by national dex id, built once"""
+    if "species_index" not in _loaded:
+        index = {}
+        for record in get_pokemon_data():
+            species = Species.from_record(record)
+            index[normalize_species_name(species.name)] = species
+            index[species.id] = species
+        _loaded["species_index"] = index
+    return _loaded["species_index"]
+
+def get_species(name_or_id) -> Species:
+    """Look a species up by name (any case) or national dex number"""
+    key = name_or_id
+    if isinstance(key, str):
+        key = int(key) if key.strip().isdigit() else normalize_species_name(key)
+
+    species = get_species_index().get(key)
+    if species is None:
+        raise ValueError(f"Pokemon '{name_or_id}' not found in pokemon.json")
+    return species
 
 def get_move_lookup():
-    return MOVE_LOOKUP
+    if "moves" not in _loaded:
+        _loaded["moves"] = load_compiled(MOVES_PATH, compile_moves)
+    return _loaded["moves"]
+
+def get_moves_data():
+    """moves.json as parsed, read once"""
+    if "moves_data" not in _loaded:
+        with open(MOVES_PATH, "r") as f:
+            _loaded["moves_data"] = json.load(f)
+    return _loaded["moves_data"]
+
+def build_caches():
+    """Compile pokemon.json/moves.json into the data cache (the build step)"""
+    _loaded.pop("moves_data", None)
+    _loaded["moves"] = load_compiled(MOVES_PATH, compile_moves, force=True)
+    if os.path.exists(POKEMON_PATH):
+        _loaded["pokemon"] = load_compiled(POKEMON_PATH, compile_pokemon_data, force=True)
+
+def __getattr__(name):
+    # POKEMON_DATA / MOVE_LOOKUP used to be parsed at import time; keep the names
+    # but only load the data when something actually asks for it
+    if name == "POKEMON_DATA":
+        return get_pokemon_data()
+    if name == "MOVE_LOOKUP":
+        return get_move_lookup()
+    if name == "MOVES_DATA":
+        return get_moves_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def extract_level_up_moves(pokemon_data, move_lookup, level=50, version_group=DEFAULT_VERSION_GROUP):
+    if isinstance(pokemon_data, Species):
+        learnset = pokemon_data.learnset
+    else:
+        learnset = Learnset(pokemon_data["learnset"])
 
-
-def extract_level_up_moves(pokemon_data, move_lookup, level=50, version_group="heartgold-soulsilver"):
     selected_moves = []
-    
-    for move_entry in pokemon_data["moves"]:
-        move_name = move_entry["move"]["name"]
-
-        for detail in move_entry["version_group_details"]:
-            method = detail["move_learn_method"]["name"]
-            version = detail["version_group"]["name"]
-            learned_at = detail["level_learned_at"]
-
-            is_level_up = method == "level-up"
-            is_valid_version = version == version_group
-            is_valid_level = learned_at <= level
-
-            if is_level_up and is_valid_version and is_valid_level:
-                move_obj = move_lookup.get(move_name)
-                if move_obj and move_obj not in selected_moves:
-                    selected_moves.append(move_obj)
-    
-    return selected_moves[:4]
+    for move_name in learnset.moves_at_level(level, version_group, source_order=True):
+        move_obj = move_lookup.get(move_name)
+        if move_obj:
+            selected_moves.append(move_obj)
+            if len(selected_moves) == 4:
+                break
 
-def load_pokemon(name: str, move_lookup, level=50):
-    data = next((p for p in POKEMON_DATA if p["name"].lower() == name.lower()), None)
-    if not data:
-        raise ValueError(f"Pokemon '{name}' not found in pokemon.json")
-    
-    base_stats = BaseStats(
-        hp=data["stats"]["hp"],
-        attack=data["stats"]["attack"],
-        defense=data["stats"]["defense"],
-        sp_attack=data["stats"]["special-attack"],
-        sp_defense=data["stats"]["special-defense"],
-        speed=data["stats"]["speed"],
-    )
+    return selected_moves
 
-    sprites = data["sprites"]
-    front_url = sprites.get("front_default")
-    back_url = sprites.get("back_default")
+def load_pokemon(name: str, move_lookup, level=50):
+    species = get_species(name)
 
-    front_sprite = load_sprite(front_url)
-    back_sprite = load_sprite(back_url)
+    front_sprite = load_sprite(species.front_sprite_url)
+    back_sprite = load_sprite(species.back_sprite_url)
 
     ability = Static()
 
-    types = [Type[t.upper()] for t in data["types"]]
-    moves = extract_level_up_moves(pokemon_data=data, move_lookup=move_lookup, level=50, version_group="heartgold-soulsilver")
+    moves = extract_level_up_moves(pokemon_data=species, move_lookup=move_lookup, level=50, version_group=DEFAULT_VERSION_GROUP)
 
-    print(moves)
+    logging.debug("Moves for %s: %s", species.name, moves)
 
     return Pokemon(
-        name=data["name"],
+        name=species.name,
         ability=ability,
-        base_stats=base_stats,
-        types=types,
+        base_stats=species.base_stats,
+        types=list(species.types),
         moves=moves,
         level=level,
         iv=Pokemon.generate_random_iv(),
         ev=Pokemon.generate_default_ev(),
         front_sprite=front_sprite,
         back_sprite=back_sprite,
-    )
\ No newline at end of file
+    )
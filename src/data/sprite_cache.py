@@ -0,0 +1,131 @@
+"""On-disk cache for sprite downloads.
+
+Files are named by a hash of their URL and evicted least-recently-used first (by
+mtime, which is bumped on every hit) once the cache grows past max_bytes.
+"""
+import hashlib
+import logging
+import os
+import threading
+
+import requests
+
+import config
+
+
+class SpriteCache:
+    def __init__(self, cache_dir=None, max_bytes=None, offline=None, session=None, timeout=10):
+        self.cache_dir = cache_dir or config.SPRITE_CACHE_DIR
+        self.max_bytes = config.SPRITE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.offline = config.OFFLINE if offline is None else offline
+        self.timeout = timeout
+        self._session = session
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def session(self):
+        # One session for every download so the connection to the sprite host is reused
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def path_for(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".png")
+
+    def contains(self, url):
+        return bool(url) and os.path.exists(self.path_for(url))
+
+    def get(self, url):
+        """Return the sprite's bytes, from disk if cached, else downloaded (unless offline)"""
+        if not url:
+            return None
+
+        path = self.path_for(url)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            self.hits += 1
+            return data
+        except FileNotFoundError:
+            pass
+
+        self.misses += 1
+        if self.offline:
+            return None
+
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.content
+        self._store(path, data)
+        return data
+
+    def _store(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.info(f"Could not cache sprite at {path}: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._disk_usage()
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".png"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        return entries
+
+    def _disk_usage(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+    def clear(self):
+        with self._lock:
+            if os.path.isdir(self.cache_dir):
+                for _, _, path in self._entries():
+                    os.remove(path)
+            self._total_bytes = 0
+
+
+_default_cache = None
+
+
+def get_sprite_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SpriteCache()
+    return _default_cache
+
+
+def set_sprite_cache(cache):
+    """Swap the cache used by load_sprite, e.g. for offline mode or tests"""
+    global _default_cache
+    _default_cache = cache
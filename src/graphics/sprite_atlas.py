@@ -0,0 +1,198 @@
+"""Sprite atlas: every front/back sprite packed into a few large images.
+
+The build step (python -m graphics.sprite_atlas) pulls each sprite through the
+sprite cache, crops away its transparent border and shelf-packs the rest onto atlas
+pages, writing the pages as PNGs next to an index.json that maps sprite URL ->
+(page, x, y, w, h, offset x, offset y, original w, original h).
+At runtime SpriteAtlas loads the pages once and draws sub-rects of them, so
+screens don't decode or hold hundreds of separate Surfaces.
+"""
+import io
+import json
+import logging
+import os
+from collections import OrderedDict
+
+import pygame
+
+import config
+from data.sprite_cache import get_sprite_cache
+
+INDEX_FILE = "index.json"
+ATLAS_VERSION = 2
+DEFAULT_PAGE_SIZE = 2048
+# Standalone Surfaces get() keeps: both 6-Pokemon teams' front and back sprites
+SURFACE_CACHE_SIZE = 32
+
+
+def sprite_urls(pokemon_data):
+    """Front and back sprite URLs for every species, in dex order"""
+    urls = []
+    for pokemon in pokemon_data:
+        sprites = pokemon.get("sprites", {})
+        for key in ("front_default", "back_default"):
+            url = sprites.get(key)
+            if url and url not in urls:
+                urls.append(url)
+    return urls
+
+
+def build_atlas(urls, output_dir=None, sprite_cache=None, page_size=DEFAULT_PAGE_SIZE):
+    """Pack the sprites at `urls` into atlas pages in output_dir and return the index"""
+    output_dir = output_dir or config.SPRITE_ATLAS_DIR
+    sprite_cache = sprite_cache or get_sprite_cache()
+
+    images = []
+    for url in urls:
+        try:
+            data = sprite_cache.get(url)
+        except Exception as e:
+            logging.info(f"Skipping sprite {url}: {e}")
+            continue
+        if data:
+            image = pygame.image.load(io.BytesIO(data))
+            # Sprites are mostly transparent border; only the visible part is packed
+            bounds = image.get_bounding_rect()
+            if bounds.width == 0 or bounds.height == 0:
+                bounds = pygame.Rect(0, 0, 1, 1)
+            images.append((url, image, bounds))
+
+    # Shelf packing: tallest first, left to right, new shelf when a row is full
+    images.sort(key=lambda item: (-item[2].height, -item[2].width))
+    placements = []
+    page_number, x, y, shelf_height = 0, 0, 0, 0
+    for url, image, bounds in images:
+        if x + bounds.width > page_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + bounds.height > page_size:
+            page_number, x, y, shelf_height = page_number + 1, 0, 0, 0
+        placements.append((page_number, x, y, url, image, bounds))
+        x += bounds.width
+        shelf_height = max(shelf_height, bounds.height)
+
+    os.makedirs(output_dir, exist_ok=True)
+    index = {"version": ATLAS_VERSION, "pages": [], "sprites": {}}
+    for number in range(page_number + 1 if placements else 0):
+        on_page = [p for p in placements if p[0] == number]
+        width = max(px + bounds.width for _, px, _, _, _, bounds in on_page)
+        height = max(py + bounds.height for _, _, py, _, _, bounds in on_page)
+        page = pygame.Surface((width, height), pygame.SRCALPHA)
+        for _, px, py, url, image, bounds in on_page:
+            page.blit(image, (px, py), area=bounds)
+            index["sprites"][url] = [
+                number, px, py, bounds.width, bounds.height,
+                bounds.x, bounds.y, image.get_width(), image.get_height(),
+            ]
+
+        page_name = f"atlas_{number}.png"
+        pygame.image.save(page, os.path.join(output_dir, page_name))
+        index["pages"].append(page_name)
+
+    tmp_path = os.path.join(output_dir, INDEX_FILE + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, os.path.join(output_dir, INDEX_FILE))
+    return index
+
+
+class AtlasEntry:
+    def __init__(self, page, rect, offset, size):
+        self.page = page      # atlas page Surface
+        self.rect = rect      # visible part of the sprite on the page
+        self.offset = offset  # where that part sits in the original sprite
+        self.size = size      # original sprite size
+
+
+class SpriteAtlas:
+    def __init__(self, pages, sprites):
+        self.pages = pages
+        self.sprites = {
+            url: AtlasEntry(pages[entry[0]], pygame.Rect(entry[1:5]), tuple(entry[5:7]), tuple(entry[7:9]))
+            for url, entry in sprites.items()
+        }
+        self._surfaces = OrderedDict()    # url -> Surface, least recently used first
+
+    @classmethod
+    def load(cls, atlas_dir=None):
+        """Load a built atlas, or return None if there isn't one"""
+        atlas_dir = atlas_dir or config.SPRITE_ATLAS_DIR
+        try:
+            with open(os.path.join(atlas_dir, INDEX_FILE)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get("version") != ATLAS_VERSION:
+            return None
+
+        pages = []
+        for page_name in index["pages"]:
+            page = pygame.image.load(os.path.join(atlas_dir, page_name))
+            pages.append(page.convert_alpha() if pygame.display.get_surface() else page)
+        return cls(pages, index["sprites"])
+
+    def __contains__(self, url):
+        return url in self.sprites
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def rect(self, url):
+        return self.sprites[url].rect
+
+    def get(self, url):
+        """A standalone Surface of the original sprite size, for code that wants one
+        (e.g. Pokemon.front_sprite). The last SURFACE_CACHE_SIZE made are kept; screens
+        that show many sprites should draw them with blit() instead."""
+        entry = self.sprites.get(url)
+        if entry is None:
+            return None
+        sprite = self._surfaces.get(url)
+        if sprite is None:
+            sprite = pygame.Surface(entry.size, pygame.SRCALPHA)
+            sprite.blit(entry.page, entry.offset, area=entry.rect)
+            self._surfaces[url] = sprite
+            if len(self._surfaces) > SURFACE_CACHE_SIZE:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(url)
+        return sprite
+
+    def blit(self, surface, url, center):
+        """Draw the sprite centred on `center` straight from the atlas page.
+        Returns False if it isn't in the atlas."""
+        entry = self.sprites.get(url)
+        if entry is None:
+            return False
+        x = center[0] - entry.size[0] // 2 + entry.offset[0]
+        y = center[1] - entry.size[1] // 2 + entry.offset[1]
+        surface.blit(entry.page, (x, y), area=entry.rect)
+        return True
+
+
+_default_atlas = None
+_default_atlas_loaded = False
+
+
+def get_sprite_atlas():
+    """The atlas in config.SPRITE_ATLAS_DIR, loaded once the display is up (None if not built)"""
+    global _default_atlas, _default_atlas_loaded
+    if not _default_atlas_loaded and pygame.display.get_surface() is not None:
+        _default_atlas = SpriteAtlas.load()
+        _default_atlas_loaded = True
+    return _default_atlas
+
+
+def set_sprite_atlas(atlas):
+    global _default_atlas, _default_atlas_loaded
+    _default_atlas = atlas
+    _default_atlas_loaded = True
+
+
+def main():
+    from data.loaders import get_pokemon_data
+    index = build_atlas(sprite_urls(get_pokemon_data()))
+    print(f"Packed {len(index['sprites'])} sprites into {len(index['pages'])} page(s) in {config.SPRITE_ATLAS_DIR}")
+
+
+if __name__ == "__main__":
+    main()
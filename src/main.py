@@ -40,8 +40,7 @@ def on_pokemon_selected(team_data):
     opponent = Player("Red", True, opponent_team)
 
     battle_manager = BattleManager(player, opponent)
-    scene = BattleScene(screen, battle_manager)
-    battle_manager.ui_logger = scene.log_message
+    scene = BattleScene(screen, battle_manager)     # subscribes to the battle's events
     run_game_loop(scene)
 
 select_scene = PokemonSelectScene(screen, pokemon_data, on_pokemon_selected)
@@ -1,3 +1,5 @@
+import logging
+
 from .ability import Ability
 
 class Levitate(Ability):
@@ -6,6 +8,6 @@ class Levitate(Ability):
 
     def modify_damage(self, attacker, defender, move, damage):
         if move.move_type.name == "GROUND":
-            self.log(f"{defender.name}'s Levitate made it immune!")
+            logging.debug("%s's Levitate made it immune!", defender.name)
             return 0
         return damage
\ No newline at end of file
@@ -0,0 +1,148 @@
+# battle_events.py
+# What happens in a battle, as data. BattleManager.emit() builds one of these only
+# when something is listening (a subscriber, or the battle's text log), so headless
+# battles never construct events or format messages. Each event's text() renders it
+# for the battle log; it returns None for events with nothing to say (a move's damage
+# is shown by the HP bar, not a message).
+#
+# Usage:
+#   battle.subscribe(lambda event: print(type(event).__name__, event))
+#   battle.take_turn(player_action, opponent_action)
+
+from typing import NamedTuple, Optional
+
+
+class MoveUsed(NamedTuple):
+    pokemon: object
+    move: object
+
+    def text(self):
+        return f"{self.pokemon.name} used {self.move.name}!"
+
+
+class Damage(NamedTuple):
+    pokemon: object
+    amount: int
+    hp: int                 # HP left afterwards
+    cause: Optional[str] = None     # None for a move, else "poison", "badly poisoned" or "burn"
+
+    def text(self):
+        if self.cause is None:
+            return None
+        hurt = "is badly poisoned!" if self.cause == "badly poisoned" else f"was hurt by {self.cause}!"
+        return f"{self.pokemon.name} {hurt} It took {self.amount} damage."
+
+
+class Crit(NamedTuple):
+    pokemon: object         # the one that was hit
+
+    def text(self):
+        return "A critical hit!"
+
+
+class Effectiveness(NamedTuple):
+    pokemon: object
+    multiplier: float       # never 1: neutral hits aren't reported
+
+    def text(self):
+        if self.multiplier == 0:
+            return "It had no effect..."
+        return "It's super effective!" if self.multiplier > 1 else "It's not very effective..."
+
+
+class StatusApplied(NamedTuple):
+    pokemon: object
+    status: str
+    badly_poisoned: bool = False
+
+    def text(self):
+        if self.badly_poisoned:
+            return f"{self.pokemon.name} was badly poisoned!"
+        return f"{self.pokemon.name} was {self.status}ed!"
+
+
+class StatChange(NamedTuple):
+    pokemon: object
+    stat: str
+    change: int             # stages, e.g. +2 for Swords Dance
+
+    def text(self):
+        stage = "sharply " if abs(self.change) == 2 else ""
+        direction = "rose" if self.change > 0 else "fell"
+        return f"{self.pokemon.name}'s {self.stat.capitalize()} {stage}{direction}!"
+
+
+class StatusCheck(NamedTuple):
+    """A sleeping or paralysed Pokemon trying to move"""
+    pokemon: object
+    status: str             # "sleep" or "paralysis"
+    can_move: bool          # for sleep, whether it woke up
+
+    def text(self):
+        if self.status == "sleep":
+            return f"{self.pokemon.name} woke up!" if self.can_move else f"{self.pokemon.name} is fast asleep!"
+        return f"{self.pokemon.name} is paralyzed! It can't move!"
+
+
+class Miss(NamedTuple):
+    pokemon: object         # the attacker
+    move: object
+
+    def text(self):
+        return f"{self.pokemon.name}'s {self.move.name} missed!"
+
+
+class NoPP(NamedTuple):
+    pokemon: object
+    move: object
+
+    def text(self):
+        return f"{self.pokemon.name} has no PP left for {self.move.name}"
+
+
+class BurnHalved(NamedTuple):
+    pokemon: object         # the burned attacker
+
+    def text(self):
+        return f"{self.pokemon.name}'s attack was halved due to burn!"
+
+
+class ItemUsed(NamedTuple):
+    player: object
+    item: str
+    effective: bool         # False for items with no effect
+
+    def text(self):
+        if not self.effective:
+            return f"Item {self.item} does nothing"
+        return f"{self.player.name} used {self.item}!"
+
+
+class Faint(NamedTuple):
+    pokemon: object
+
+    def text(self):
+        return f"{self.pokemon.name} has fainted!"
+
+
+class Switch(NamedTuple):
+    player: object
+    pokemon: object         # the one sent out
+
+    def text(self):
+        return f"{self.player.name} sent out {self.pokemon.name}!"
+
+
+class Message(NamedTuple):
+    """Anything without an event of its own, e.g. abilities and prompts"""
+    message: str
+
+    def text(self):
+        return self.message
+
+
+class BattleEnd(NamedTuple):
+    winner: object          # the Player left with Pokemon standing, None if neither is
+
+    def text(self):
+        return "Battle over: True"
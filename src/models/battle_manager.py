@@ -1,30 +1,103 @@
 from .player import Player
 from .player_action import PlayerAction
-from .type_chart import get_type_multiplier
+from .type_chart import get_type_multiplier, type_effectiveness
 from .item_effects import ITEM_EFFECTS
+from . import evaluation_cache
 from .move import Move
-import random
+from .battle_stats import ACCURACY, EVASION, SPEED
+from .rng import battle_rng
+from .battle_events import (BattleEnd, BurnHalved, Crit, Damage, Effectiveness, Faint, ItemUsed, Message, Miss,
+                            MoveUsed, NoPP, StatChange, StatusApplied, StatusCheck, Switch)
 import logging
 
 class BattleManager:
-    def __init__(self, player: Player, opponent: Player, ui_logger=None):
+    def __init__(self, player: Player, opponent: Player, ui_logger=None, rng=None):
         self.player = player
         self.opponent = opponent
+        # This battle's random stream (see models.rng): pass random.Random(seed) or
+        # SimRNG(seed) to replay it exactly
+        self.rng = rng if rng is not None else battle_rng()
         self.battle_log = []
         self.battle_over = False
         self.ui_logger = ui_logger
+        # Whether events are rendered into battle_log (and logging / ui_logger).
+        # Headless engines turn this off so nothing is formatted.
+        self.text_log = True
+        # Callables given every event (see models.battle_events), e.g. a UI's feed
+        self.subscribers = []
+        # Optional policy for the opponent's moves, e.g. ai.search_ai.SearchAI().
+        # Called as opponent_ai(battle, player, opponent) and returns a PlayerAction.
+        self.opponent_ai = None
+        # (player_action, opponent_action) of the turn most recently played, so planning
+        # AIs can follow the game down their search tree
+        self.last_actions = None
+        # Memoize the greedy AI's move scoring (see models.evaluation_cache)
+        self.use_evaluation_cache = True
+        # models.replay.ReplayRecorder, when this battle is being recorded
+        self.replay = None
+
+    def subscribe(self, callback):
+        """Call callback(event) for every event from now on"""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def emit(self, event_type, *args):
+        """Report an event. It is only built, and its text only formatted, if
+        something is listening."""
+        if not self.text_log and not self.subscribers:
+            return
+        event = event_type(*args)
+        if self.text_log:
+            message = event.text()
+            if message is not None:
+                self.battle_log.append(message)
+                logging.info(message)
+                if self.ui_logger:
+                    self.ui_logger(message)
+        for callback in self.subscribers:
+            callback(event)
 
     def log(self, message: str):
-        self.battle_log.append(message)
-        logging.info(message)
-        if hasattr(self, "ui_logger") and self.ui_logger:
-            self.ui_logger(message)
-    
+        self.emit(Message, message)
+
+    def debug(self, message: str, *args):
+        """Developer trace output, at logging's DEBUG level. Arguments are formatted lazily."""
+        logging.debug(message, *args)
+
+    def chance(self, probability):
+        """Whether an event with the given probability happens. Every coin flip in the
+        rules goes through here (and roll_int), so a search AI can enumerate outcomes."""
+        return self.rng.random() < probability
+
+    def roll_int(self, low, high):
+        return self.rng.randint(low, high)
+
     def make_ai_action(self, player, opponent):
-        best_move = None
-        best_score = float('-inf')
+        if player is self.opponent and self.opponent_ai is not None:
+            return self.opponent_ai(self, player, opponent)
+
         attacker = player.active_pokemon()
         defender = opponent.active_pokemon()
+        if self.use_evaluation_cache:
+            # The cache holds an index into the attacker's own moves (see move_choice_key)
+            index = evaluation_cache.cached(evaluation_cache.move_choice_key(attacker, defender),
+                                            lambda: self.best_move_index(attacker, defender))
+            best_move = None if index is None else attacker.moves[index]
+        else:
+            best_move = self.best_move(attacker, defender)
+
+        if best_move is None:
+            best_move = attacker.moves[0]
+
+        self.debug("AI selected move: %s", best_move.name)
+        return PlayerAction(type="move", move=best_move)
+
+    def best_move(self, attacker, defender):
+        """The attacker's usable move with the best type/STAB/power score, or None"""
+        best_move = None
+        best_score = float('-inf')
 
         for move in attacker.moves:
             if not attacker.battle_stats.has_pp(move.name):
@@ -41,55 +114,76 @@ class BattleManager:
             if hasattr(move, "power") and move.power:
                 score *= move.power
 
-            print(f"Evaluating move: {move.name}, score: {score}")
+            self.debug("Evaluating move: %s, score: %s", move.name, score)
 
             if score > best_score:
                 best_score = score
                 best_move = move
 
-        if best_move is None:
-            best_move = attacker.moves[0]
+        return best_move
 
-        print(f"AI selected move: {best_move.name}")
-        return PlayerAction(type="move", move=best_move)
+    def best_move_index(self, attacker, defender):
+        best_move = self.best_move(attacker, defender)
+        return None if best_move is None else attacker.moves.index(best_move)
 
     def take_turn(self, player_action: PlayerAction, opponent_action: PlayerAction):
         if self.battle_over:
             return
+        self.last_actions = (player_action, opponent_action)
+        if self.replay is not None:
+            self.replay.record_turn(player_action, opponent_action)
         # Determine turn order
         first, second = self.determine_turn_order(player_action, opponent_action)
 
         first_action = player_action if first == self.player else opponent_action
         second_action = opponent_action if first == self.player else player_action
 
-        move = first.active_pokemon().get_move_by_name(first_action.move_name)
-        self.execute_move(first, second, move)
+        self.perform_action(first, second, first_action)
 
-        if self.ui_logger:
-            self.ui_logger(f"{first.active_pokemon().name} used {first_action.move_name}")
-        
         if second.active_pokemon().is_fainted():
+            # A fainted Pokemon doesn't get to act, and neither does its replacement
             self.handle_faint(second)
-            if self.check_battle_end():
-                return
-            
-        move = second.active_pokemon().get_move_by_name(second_action.move_name)
-        self.execute_move(second, first, move)
-            
-        if self.ui_logger:
-            self.ui_logger(f"{second.active_pokemon().name} used {second_action.move_name}")
+        else:
+            self.perform_action(second, first, second_action)
 
-        if (first.active_pokemon().is_fainted()):
-            self.handle_faint(first)
+            if first.active_pokemon().is_fainted():
+                self.handle_faint(first)
 
         # check if battle is over
         if self.check_battle_end():
             return
-        
-        self.apply_end_of_turn_status_effects([
-            self.player.active_pokemon(),
-            self.opponent.active_pokemon()
-        ])
+
+        self.apply_end_of_turn_damage()
+
+    def perform_action(self, actor, opponent, action: PlayerAction):
+        """Resolve one side's action for the turn, honouring sleep/paralysis for moves"""
+        if action.type != "move":
+            self.resolve_action(actor, opponent, action)
+            return
+
+        can_move, status = self.status_check(actor)
+        if status is not None:
+            self.emit(StatusCheck, actor.active_pokemon(), status, can_move)
+        if not can_move:
+            return
+
+        self.emit(MoveUsed, actor.active_pokemon(), action.move)
+        self.execute_move(actor, opponent, action.move)
+
+    def apply_end_of_turn_damage(self):
+        """Apply poison/burn damage to both active Pokemon and handle any faints"""
+        for side in (self.player, self.opponent):
+            pokemon = side.active_pokemon()
+            hurt = self.end_of_turn_damage(pokemon)
+            if hurt is not None:
+                damage, cause = hurt
+                pokemon.battle_stats.current_hp = max(0, pokemon.battle_stats.current_hp - damage)
+                self.emit(Damage, pokemon, damage, pokemon.battle_stats.current_hp, cause)
+
+        for side in (self.player, self.opponent):
+            if side.active_pokemon().is_fainted():
+                self.handle_faint(side)
+        self.check_battle_end()
 
     def choose_best_counter(self, current_opponent_pokemon, player_active_pokemon):
         best_index = None
@@ -97,16 +191,24 @@ class BattleManager:
 
         for i, poke in enumerate(current_opponent_pokemon.team):
             if poke != current_opponent_pokemon.active_pokemon() and poke.battle_stats.current_hp > 0:
-                # Basic Heuristic: count the number of type advantages
-                score = 0
-                for move in poke.moves:
-                    for player_type in player_active_pokemon.types:
-                        multiplier = get_type_multiplier(move.move_type, player_type)
-                        score += multiplier
+                if self.use_evaluation_cache:
+                    score = evaluation_cache.cached(evaluation_cache.counter_key(poke, player_active_pokemon),
+                                                    lambda: self.counter_score(poke, player_active_pokemon))
+                else:
+                    score = self.counter_score(poke, player_active_pokemon)
                 if score > best_score:
                     best_score = score
                     best_index = i
         return best_index
+
+    def counter_score(self, poke, player_active_pokemon):
+        # Basic Heuristic: count the number of type advantages
+        score = 0
+        for move in poke.moves:
+            for player_type in player_active_pokemon.types:
+                multiplier = get_type_multiplier(move.move_type, player_type)
+                score += multiplier
+        return score
     
     def determine_turn_order(self, player_action=None, opponent_action=None):
         player_priority = 0
@@ -122,8 +224,8 @@ class BattleManager:
         elif opponent_priority > player_priority:
             return (self.opponent, self.player)
         else:
-            player_speed = self.player.active_pokemon().battle_stats.get_effective_stat("speed")
-            opponent_speed = self.opponent.active_pokemon().battle_stats.get_effective_stat("speed")
+            player_speed = self.player.active_pokemon().battle_stats.effective_stat(SPEED)
+            opponent_speed = self.opponent.active_pokemon().battle_stats.effective_stat(SPEED)
             return (self.player, self.opponent) if player_speed >= opponent_speed else (self.opponent, self.player)
 
     def resolve_action(self, actor, opponent, action: PlayerAction):
@@ -131,6 +233,7 @@ class BattleManager:
             self.execute_move(actor, opponent, action.move)
         if action.type == "switch":
             actor.switch_to(action.switch_to)
+            self.emit(Switch, actor, actor.active_pokemon())
         if action.type == "item":
             self.use_item(actor, action.item)
 
@@ -138,43 +241,43 @@ class BattleManager:
         item_fn = ITEM_EFFECTS.get(item_name)
         if item_fn:
             item_fn(player, player.active_pokemon())
-            self.log(f"{player.name} used {item_name}!")
+            self.emit(ItemUsed, player, item_name, True)
         else:
-            self.log(f"Item {item_name} does nothing")
+            self.emit(ItemUsed, player, item_name, False)
+
+    def end_of_turn_damage(self, pokemon):
+        """(damage, cause) that poison or burn deals the Pokemon at the end of the turn,
+        or None. Advances a bad poisoning's counter."""
+        battle_stats = pokemon.battle_stats
+        status = battle_stats.status
+
+        self.debug("Checking end-of-turn effects for %s, status: %s", pokemon.name, status)
+
+        if status == "poison":
+            if battle_stats.badly_poisoned:
+                battle_stats.toxic_turns += 1
+                return max(1, (battle_stats.max_hp * battle_stats.toxic_turns) // 16), "badly poisoned"
+            return max(1, battle_stats.max_hp // 8), "poison"
+        if status == "burn":
+            return max(1, battle_stats.max_hp // 16), "burn"
+        return None
 
     def apply_end_of_turn_status_effects(self, pokemon_list):
-        if not pokemon_list:
-            return []
-        pokemon = pokemon_list[0]
-        status = pokemon.battle_stats.status
+        """(owner, new_hp, message) entries for poison/burn damage, without applying it"""
         status_effects = []
-        
-        print(f"Checking end-of-turn effects for {pokemon.name}, status: {status}")
-        
-        if status == "poison":
-            if pokemon.battle_stats.badly_poisoned:
-                pokemon.battle_stats.toxic_turns += 1
-                turns = pokemon.battle_stats.toxic_turns
-                damage = max(1, (pokemon.battle_stats.max_hp * turns) // 16)
-                message = f"{pokemon.name} is badly poisoned!"
-            else:
-                damage = max(1, pokemon.battle_stats.max_hp // 8)
-                message = f"{pokemon.name} was hurt by poison!"
-            
-            new_hp = max(0, pokemon.battle_stats.current_hp - damage)
-            status_effects.append((self.get_pokemon_owner(pokemon), new_hp, message))
-            status_effects.append((self.get_pokemon_owner(pokemon), new_hp, f"It took {damage} damage."))
-            
-        elif status == "burn":
-            damage = max(1, pokemon.battle_stats.max_hp // 16)
-            message = f"{pokemon.name} was hurt by burn!"
+        for pokemon in pokemon_list:
+            hurt = self.end_of_turn_damage(pokemon)
+            if hurt is None:
+                continue
+            damage, cause = hurt
             new_hp = max(0, pokemon.battle_stats.current_hp - damage)
-            status_effects.append((self.get_pokemon_owner(pokemon), new_hp, message))
-            status_effects.append((self.get_pokemon_owner(pokemon), new_hp, f"It took {damage} damage."))
-
-        status_effects.extend(self.apply_end_of_turn_status_effects(pokemon_list[1:]))
+            message = f"{pokemon.name} is badly poisoned!" if cause == "badly poisoned" else \
+                f"{pokemon.name} was hurt by {cause}!"
+            owner = self.get_pokemon_owner(pokemon)
+            status_effects.append((owner, new_hp, message))
+            status_effects.append((owner, new_hp, f"It took {damage} damage."))
         return status_effects
-    
+
     def get_pokemon_owner(self, pokemon):
         """Helper method to find which player owns a pokemon"""
         if self.player.active_pokemon() == pokemon:
@@ -185,6 +288,14 @@ class BattleManager:
 
     def check_status_prevents_move(self, attacker):
         """Check if status effects prevent the pokemon from using a move, return (can_move, status_message)"""
+        can_move, status = self.status_check(attacker)
+        if status is None:
+            return can_move, None
+        return can_move, StatusCheck(attacker.active_pokemon(), status, can_move).text()
+
+    def status_check(self, attacker):
+        """(can_move, status) for an attempt to move, where status is the "sleep" or
+        "paralysis" that had a say, or None. Formats nothing."""
         attacker_status = attacker.active_pokemon().battle_stats.status
         
         # Sleep check
@@ -194,40 +305,40 @@ class BattleManager:
             if attacker.active_pokemon().battle_stats.sleep_turns <= 0:
                 attacker.active_pokemon().battle_stats.status = None
                 attacker.active_pokemon().battle_stats.sleep_turns = 0
-                return True, f"{attacker.active_pokemon().name} woke up!"
+                return True, "sleep"
             else:
-                return False, f"{attacker.active_pokemon().name} is fast asleep!"
+                return False, "sleep"
         
         # Paralysis check (25% chance to be fully paralyzed and unable to move)
         if attacker_status == "paralysis":
-            if random.randint(1, 4) == 1:  # 25% chance
-                return False, f"{attacker.active_pokemon().name} is paralyzed! It can't move!"
+            if self.chance(0.25):  # 25% chance
+                return False, "paralysis"
         
         return True, None
 
     def execute_move_calculate_only(self, attacker, defender, move: Move):
         """Execute move calculations without applying damage immediately"""
         if not attacker.active_pokemon().battle_stats.has_pp(move.name):
-            self.log(f"{attacker.active_pokemon().name} has no PP left for {move.name}")
+            self.emit(NoPP, attacker.active_pokemon(), move)
             return None, False, False
         
-        print(f"Executing move: {move.name}")
+        self.debug("Executing move: %s", move.name)
 
         if move.accuracy is not None:
-            attacker_accuracy_stage = attacker.active_pokemon().battle_stats.stat_modifiers.get("accuracy", 0)
-            defender_evasion_stage = defender.active_pokemon().battle_stats.stat_modifiers.get("evasion", 0)
+            attacker_accuracy_stage = attacker.active_pokemon().battle_stats.stages[ACCURACY]
+            defender_evasion_stage = defender.active_pokemon().battle_stats.stages[EVASION]
 
             acc_mod = attacker.active_pokemon().battle_stats.get_acc_eva_multiplier(attacker_accuracy_stage)
             eva_mod = defender.active_pokemon().battle_stats.get_acc_eva_multiplier(defender_evasion_stage)
 
             final_accuracy = move.accuracy * acc_mod / eva_mod
-            if random.random() * 100 > final_accuracy:
-                self.log(f"{attacker.active_pokemon().name}'s {move.name} missed!")
+            if not self.chance(final_accuracy / 100):
+                self.emit(Miss, attacker.active_pokemon(), move)
                 return None, False, True
         
-        print("PP map before:", attacker.active_pokemon().battle_stats.pp)
-        print("Move used:", move.name)
-        print("Is move in PP map?", move.name in attacker.active_pokemon().battle_stats.pp)
+        self.debug("PP map before: %s", attacker.active_pokemon().battle_stats.pp)
+        self.debug("Move used: %s", move.name)
+        self.debug("Is move in PP map? %s", move.name in attacker.active_pokemon().battle_stats.pp)
         # Use PP but don't apply damage yet
         attacker.active_pokemon().battle_stats.use_pp(move.name)
         damage, is_critical = self.calculate_damage(attacker, defender, move)
@@ -237,32 +348,30 @@ class BattleManager:
     def apply_move_effects(self, attacker, defender, move: Move):
         """Apply non-damage effects of a move (status effects, stat changes)"""
         effects = move.effects_info
-        print(f"Checking move effects for {move.name}: {effects}")
+        self.debug("Checking move effects for %s: %s", move.name, effects)
         if effects:
             # Ailment (e.g., poison, burn)
             if effects.ailment and effects.ailment != "none":
                 ailment_chance = effects.ailment_chance
-                roll = random.randint(1, 100)
-                print(f"Status effect check: {move.name} has {effects.ailment} with {ailment_chance}% chance, rolled {roll}")
-                # Temporarily increase chance to 100% for testing
-                if roll <= ailment_chance:
+                self.debug("Status effect check: %s has %s with %s%% chance", move.name, effects.ailment, ailment_chance)
+                if self.chance(ailment_chance / 100):
                     target = defender.active_pokemon().battle_stats
-                    print(f"Applying status {effects.ailment} to {defender.active_pokemon().name}")
+                    self.debug("Applying status %s to %s", effects.ailment, defender.active_pokemon().name)
                     if effects.is_badly_poisoning:
                         target.status = "poison"
                         target.badly_poisoned = True
                         target.toxic_turns = 0
-                        self.log(f"{defender.active_pokemon().name} was badly poisoned!")
+                        self.emit(StatusApplied, defender.active_pokemon(), "poison", True)
                     else:
                         if target.status is None:
                             target.apply_status(effects.ailment)
                             # Set sleep turns for sleep status
                             if effects.ailment == "sleep":
-                                target.sleep_turns = random.randint(1, 3)  # Sleep for 1-3 turns in Gen IV
-                            self.log(f"{defender.active_pokemon().name} was {effects.ailment}ed!")
-                            print(f"Status applied: {target.status}")
+                                target.sleep_turns = self.roll_int(1, 3)  # Sleep for 1-3 turns in Gen IV
+                            self.emit(StatusApplied, defender.active_pokemon(), effects.ailment)
+                            self.debug("Status applied: %s", target.status)
                         else:
-                            print(f"Status not applied - {defender.active_pokemon().name} already has status: {target.status}")
+                            self.debug("Status not applied - %s already has status: %s", defender.active_pokemon().name, target.status)
 
             # Stat changes (e.g., Swords Dance)
             if effects.stat_changes:
@@ -277,16 +386,11 @@ class BattleManager:
                     target_stats = t.battle_stats
                     for stat, change in effects.stat_changes.items():
                         target_stats.apply_stat_change(stat, change)
-                        stage = "sharply " if abs(change) == 2 else ""
-                        direction = "rose" if change > 0 else "fell"
-                        # self.log(f"{t.name}'s {stat.capitalize()} {stage}{direction}!")
+                        self.emit(StatChange, t, stat, change)
 
     def calculate_type_effectiveness(self, move_type, defender):
         """Calculate the total type effectiveness multiplier for a move against the defender."""
-        multiplier = 1.0
-        for defender_type in defender:
-            multiplier *= get_type_multiplier(move_type, defender_type)
-        return multiplier
+        return type_effectiveness(move_type, defender)
 
     def execute_move(self, attacker, defender, move: Move):
         damage, is_critical, missed = self.execute_move_calculate_only(attacker, defender, move)
@@ -302,13 +406,9 @@ class BattleManager:
         self.apply_calculated_damage(attacker, defender, move, damage, is_critical)
 
         # Type effectiveness logging
-        multiplier = self.calculate_type_effectiveness(move.move_type, defender)
-        if multiplier > 1:
-            self.log("It's super effective!")
-        elif multiplier < 1 and multiplier > 0:
-            self.log("It's not very effective...")
-        elif multiplier == 0:
-            self.log("It had no effect...")
+        multiplier = self.calculate_type_effectiveness(move.move_type, defender.active_pokemon().types)
+        if multiplier != 1:
+            self.emit(Effectiveness, defender.active_pokemon(), multiplier)
 
         self.apply_move_effects(attacker, defender, move)
 
@@ -321,7 +421,7 @@ class BattleManager:
 
     def calculate_damage(self, attacker, defender, move):
         """Calculate damage without applying it or logging messages"""
-        damage, is_critical = move.apply_damage(attacker.active_pokemon(), defender.active_pokemon())
+        damage, is_critical = self.roll_move_damage(attacker.active_pokemon(), defender.active_pokemon(), move)
 
         ability = defender.active_pokemon().ability
         if hasattr(ability, "modify_damage"):
@@ -338,6 +438,12 @@ class BattleManager:
 
         return damage, is_critical
 
+    def roll_move_damage(self, attacker_pokemon, defender_pokemon, move):
+        # The crit roll goes through chance() like every other coin flip
+        damage, is_critical = move.roll_damage(attacker_pokemon, defender_pokemon, self.chance)
+        self.debug("Damage roll for %s: %s, critical: %s", move.name, damage, is_critical)
+        return damage, is_critical
+
     def apply_calculated_damage(self, attacker, defender, move, damage, is_critical, skip_damage_application=False, skip_crit_message=False):
         """Apply pre-calculated damage and log appropriate messages"""
         if (
@@ -347,13 +453,15 @@ class BattleManager:
             # Check if Pokemon has Guts ability (which prevents burn attack reduction)
             has_guts = hasattr(attacker.active_pokemon().ability, 'name') and attacker.active_pokemon().ability.name == "Guts"
             if not has_guts:
-                self.log(f"{attacker.active_pokemon().name}'s attack was halved due to burn!")
+                self.emit(BurnHalved, attacker.active_pokemon())
 
         if is_critical and not skip_crit_message:
-            self.log("A critical hit!")
+            self.emit(Crit, defender.active_pokemon())
         
         if not skip_damage_application:
-            defender.active_pokemon().take_damage(damage)
+            target = defender.active_pokemon()
+            target.take_damage(damage)
+            self.emit(Damage, target, damage, target.battle_stats.current_hp)
 
     def apply_damage(self, attacker, defender, move):
         damage, is_critical = self.calculate_damage(attacker, defender, move)
@@ -366,16 +474,15 @@ class BattleManager:
 
     def handle_faint(self, player):
         if player.active_pokemon().is_fainted():
-            self.log(f"{player.active_pokemon().name} has fainted!")
+            self.emit(Faint, player.active_pokemon())
 
             if player.has_available_pokemon():
                 if player.is_ai:
                     # 🧠 Smart AI switch using type effectiveness
                     opponent = self.player if player == self.opponent else self.opponent
                     replacement = self.choose_best_counter(player, opponent.active_pokemon())
-                    if replacement:
-                        player.switch_to(replacement)
-                        self.log(f"{player.name} sent out {player.team[replacement].name}!")
+                    if replacement is not None:
+                        self.send_out(player, replacement)
                 else:
                     # Player manual switch
                     valid_choices = [(i, p) for i, p in enumerate(player.team) if not p.is_fainted()]
@@ -387,14 +494,28 @@ class BattleManager:
                         try:
                             choice = int(input("Switch to: ")) - 1
                             if any(i == choice for i, _ in valid_choices):
-                                player.switch_to(choice)
+                                self.send_out(player, choice)
                                 break
                             else:
                                 self.log("Invalid choice. Try again.")
                         except ValueError:
                             self.log("Please enter a number.")
 
+    def send_out(self, player, index):
+        """Bring in the replacement for a fainted Pokemon"""
+        player.switch_to(index)
+        self.emit(Switch, player, player.active_pokemon())
+        if self.replay is not None:
+            self.replay.record_replacement(player, index)
+
     def check_battle_end(self):
         if not self.player.has_available_pokemon() or not self.opponent.has_available_pokemon():
             self.battle_over = True
-            self.log(f"Battle over: {self.battle_over}")
+            if self.player.has_available_pokemon():
+                winner = self.player
+            elif self.opponent.has_available_pokemon():
+                winner = self.opponent
+            else:
+                winner = None
+            self.emit(BattleEnd, winner)
+        return self.battle_over
@@ -0,0 +1,90 @@
+"""Immutable snapshots of a battle's mutable state, for search, rollouts and what-ifs.
+
+A BattleState holds only what changes during a battle (HP, status, stat stages, PP,
+active slots and the RNG state) as nested tuples, so it is hashable, shares freely
+and never references sprites, abilities or other UI objects. Species data, stats and
+moves stay on the Pokemon the state is restored onto.
+
+    state = snapshot(battle)
+    battle.take_turn(...)            # explore
+    restore(battle, state)           # and rewind
+"""
+from array import array
+from typing import NamedTuple, Optional, Tuple
+
+from .battle_stats import ATTACK, STAGE_TYPECODE, STAT_TYPECODE
+
+# BattleStats.stat_modifiers keys, in the order PokemonState.stages stores them
+STAGE_STATS = ("attack", "defense", "sp_attack", "sp_defense", "speed", "accuracy", "evasion")
+
+
+class PokemonState(NamedTuple):
+    current_hp: int
+    status: Optional[str]
+    badly_poisoned: bool
+    toxic_turns: int
+    sleep_turns: int
+    stages: Tuple[int, ...]     # in STAGE_STATS order
+    pp: Tuple[int, ...]         # in the order of BattleStats.pp (the moveset's order)
+
+    @classmethod
+    def of(cls, pokemon):
+        stats = pokemon.battle_stats
+        return cls(
+            stats.current_hp, stats.status, stats.badly_poisoned, stats.toxic_turns, stats.sleep_turns,
+            tuple(stats.stages[ATTACK:]),
+            tuple(stats.pp_left),
+        )
+
+    def apply(self, pokemon):
+        stats = pokemon.battle_stats
+        stats.current_hp = self.current_hp
+        stats.status = self.status
+        stats.badly_poisoned = self.badly_poisoned
+        stats.toxic_turns = self.toxic_turns
+        stats.sleep_turns = self.sleep_turns
+        stats.stages[ATTACK:] = array(STAGE_TYPECODE, self.stages)
+        stats.pp_left = array(STAT_TYPECODE, self.pp)
+
+
+class SideState(NamedTuple):
+    active_index: int
+    team: Tuple[PokemonState, ...]
+
+    @classmethod
+    def of(cls, player):
+        return cls(player.active_index, tuple([PokemonState.of(p) for p in player.team]))
+
+    def apply(self, player):
+        player.active_index = self.active_index
+        for pokemon_state, pokemon in zip(self.team, player.team):
+            pokemon_state.apply(pokemon)
+
+
+class BattleState(NamedTuple):
+    player: SideState
+    opponent: SideState
+    battle_over: bool
+    rng_state: Optional[tuple] = None
+
+
+def snapshot(battle, rng=True) -> BattleState:
+    """Capture the battle's mutable state (and its RNG's, unless rng=False)"""
+    return BattleState(
+        SideState.of(battle.player),
+        SideState.of(battle.opponent),
+        battle.battle_over,
+        battle.rng.getstate() if rng else None,
+    )
+
+
+def restore(battle, state: BattleState):
+    """Put the battle (and the RNG, if the snapshot has its state) back to `state`.
+
+    The teams must be the ones the snapshot was taken from, or copies of them.
+    """
+    state.player.apply(battle.player)
+    state.opponent.apply(battle.opponent)
+    battle.battle_over = state.battle_over
+    if state.rng_state is not None:
+        battle.rng.setstate(state.rng_state)
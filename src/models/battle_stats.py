@@ -1,48 +1,216 @@
 import logging
+from array import array
+from collections.abc import MutableMapping
+from functools import lru_cache
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .pokemon import Pokemon
 
+# Fixed slots of the stat arrays. Pokemon.stat_values/iv_values/ev_values hold the
+# first six; BattleStats.stat_values and .stages hold all eight (HP's stage is unused).
+# Typed arrays rather than lists: 2 bytes a value instead of an 8-byte pointer, at the
+# cost of a fixed range. Writing outside it raises ValueError.
+STAT_TYPECODE = "H"     # stats, IVs, EVs and PP: 0 to 65535
+STAGE_TYPECODE = "b"    # stages: -128 to 127 (modify_stat keeps them within -6..6)
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "accuracy", "evasion")
+HP, ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE, SPEED, ACCURACY, EVASION = range(len(STATS))
+POKEMON_STATS = STATS[:ACCURACY]
+# Keys of the dict-style views, mapped to their slot
+POKEMON_STAT_INDEX = {name: i for i, name in enumerate(POKEMON_STATS)}
+BATTLE_STAT_INDEX = {name: i for i, name in enumerate(STATS) if i != HP}
+
+MIN_STAGE, MAX_STAGE = -6, 6
+# get_stage_multiplier for every stage a stages array can hold, indexed by the stage
+# itself: negative stages reach the top half through Python's negative indexing
+STAGE_MULTIPLIERS = tuple((2 + s) / 2 if s >= 0 else 2 / (2 - s) for s in (*range(128), *range(-128, 0)))
+
+
+def store(values, slot, value, name):
+    """values[slot] = value, with ValueError rather than OverflowError if the array's
+    typecode can't hold it"""
+    try:
+        values[slot] = value
+    except OverflowError:
+        low, high = (0, 65535) if values.typecode == STAT_TYPECODE else (-128, 127)
+        raise ValueError(f"{name} must be between {low} and {high}, got {value}") from None
+
+
+
+def stat_array(values, names=None):
+    """A STAT_TYPECODE array of values[name] for each name (POKEMON_STATS by default)"""
+    names = POKEMON_STATS if names is None else names
+    result = array(STAT_TYPECODE, bytes(2 * len(names)))
+    for slot, name in enumerate(names):
+        store(result, slot, values[name], name)
+    return result
+
+class StatView(MutableMapping):
+    """Dict-style access by stat name to one of the fixed-index stat arrays, e.g.
+    battle_stats.stat_modifiers["attack"]. Reads and writes go straight to the array;
+    copy() (or dict(view)) gives a plain dict, e.g. for json.dumps."""
+    __slots__ = ("values", "index")
+
+    def __init__(self, values, index):
+        self.values = values
+        self.index = index
+
+    def __getitem__(self, name):
+        return self.values[self.index[name]]
+
+    def __setitem__(self, name, value):
+        store(self.values, self.index[name], value, name)
+
+    def __delitem__(self, name):
+        raise TypeError(f"Stats have a fixed layout; can't remove {name!r}")
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class PPView(MutableMapping):
+    """BattleStats.pp: PP left by move name, over the per-move-slot pp_left array"""
+    __slots__ = ("owner",)
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def __getitem__(self, move_name):
+        return self.owner.pp_left[self.owner.move_slots[move_name]]
+
+    def __setitem__(self, move_name, value):
+        self.owner.set_pp(move_name, value)
+
+    def __delitem__(self, move_name):
+        raise TypeError(f"PP slots are fixed; can't remove {move_name!r}")
+
+    def __iter__(self):
+        return iter(self.owner.move_slots)
+
+    def __len__(self):
+        return len(self.owner.move_slots)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+_NO_ACC_EVA = array(STAT_TYPECODE, [0, 0])
+_NO_STAGES = bytes(len(STATS))
+
+
+@lru_cache(maxsize=4096)
+def move_slots(move_names):
+    """{move name: slot} for a moveset, shared by every BattleStats with that moveset.
+    Never modified: set_pp for a new move gives its BattleStats its own copy."""
+    return {name: slot for slot, name in enumerate(move_names)}
+
+
 class BattleStats:
+    # Thousands of these are alive at once in tournaments and searches, so no
+    # per-instance __dict__ and no dicts: stats, stages and PP are flat typed arrays
+    __slots__ = ("max_hp", "current_hp", "stat_values", "stages", "status", "badly_poisoned", "toxic_turns",
+                 "sleep_turns", "pp_left", "move_slots")
+
     def __init__(self, pokemon: "Pokemon",):
-        self.max_hp = pokemon.stats["hp"]
+        self.max_hp = pokemon.stat_values[HP]
         self.current_hp = self.max_hp
-        self.battle_stats = {
-            "attack": pokemon.stats["attack"],
-            "defense": pokemon.stats["defense"],
-            "sp_attack": pokemon.stats["sp_attack"],
-            "sp_defense": pokemon.stats["sp_defense"],
-            "speed": pokemon.stats["speed"],
-            "accuracy": 0,
-            "evasion": 0,
-        }
+        self.stat_values = pokemon.stat_values + _NO_ACC_EVA     # accuracy and evasion have no base value
+        self.stages = array(STAGE_TYPECODE, _NO_STAGES)
         self.status = None
         self.badly_poisoned = False
         self.toxic_turns = 0
         self.sleep_turns = 0
-        self.pp = {move.name: move.pp for move in pokemon.moves}
-        self.stat_modifiers = {stat: 0 for stat in self.battle_stats}
+        moves = pokemon.moves
+        self.move_slots = move_slots(tuple([move.name for move in moves]))
+        self.pp_left = array(STAT_TYPECODE, [move.pp or 0 for move in moves])
+
+    # Assigning a mapping to battle_stats, stat_modifiers or pp copies it into the arrays
+
+    @property
+    def battle_stats(self):
+        """{stat: value} for attack through evasion"""
+        return StatView(self.stat_values, BATTLE_STAT_INDEX)
+
+    @battle_stats.setter
+    def battle_stats(self, values):
+        self.battle_stats.update(values)
+
+    @property
+    def stat_modifiers(self):
+        """{stat: stage}, -6 to +6, for attack through evasion"""
+        return StatView(self.stages, BATTLE_STAT_INDEX)
+
+    @stat_modifiers.setter
+    def stat_modifiers(self, stages):
+        # Stats missing from the mapping are back at stage 0, as .get(stat, 0) read them
+        self.stages[ATTACK:] = array(STAGE_TYPECODE, bytes(len(BATTLE_STAT_INDEX)))
+        self.stat_modifiers.update(stages)
+
+    @property
+    def pp(self):
+        return PPView(self)
+
+    @pp.setter
+    def pp(self, pp):
+        # Replaces the move slots, like assigning a new dict did
+        pp_left = stat_array(pp, tuple(pp))
+        self.move_slots = move_slots(tuple(pp))
+        self.pp_left = pp_left
+
+    def copy(self):
+        """Independent copy of the battle state, for search and simulation"""
+        clone = BattleStats.__new__(BattleStats)
+        clone.max_hp = self.max_hp
+        clone.current_hp = self.current_hp
+        clone.stat_values = self.stat_values[:]
+        clone.stages = self.stages[:]
+        clone.status = self.status
+        clone.badly_poisoned = self.badly_poisoned
+        clone.toxic_turns = self.toxic_turns
+        clone.sleep_turns = self.sleep_turns
+        clone.pp_left = self.pp_left[:]
+        clone.move_slots = self.move_slots
+        return clone
 
     def is_fainted(self):
         return self.current_hp <= 0
-    
+
     def apply_status(self, condition: str):
         if self.status is None:
             self.status = condition
 
     def set_pp(self, move_name: str, max_pp: int):
-        self.pp[move_name] = max_pp
+        slot = self.move_slots.get(move_name)
+        if slot is None:
+            # A move the moveset didn't start with: extend a private copy of the slots
+            self.move_slots = {**self.move_slots, move_name: len(self.pp_left)}
+            self.pp_left.append(0)
+            slot = self.move_slots[move_name]
+        store(self.pp_left, slot, max_pp, move_name)
 
     def use_pp(self, move_name: str):
-        print(f"Using PP for: {move_name}")
-        if self.pp.get(move_name, 0) > 0:
-            self.pp[move_name] -= 1
-        else:
+        logging.debug("Using PP for: %s", move_name)
+        if not self.has_pp(move_name):
             raise ValueError(f"No PP left for move {move_name}.")
-        
+        self.pp_left[self.move_slots[move_name]] -= 1
+
     def has_pp(self, move_name: str):
-        return self.pp.get(move_name, 0) > 0
-    
+        try:
+            return self.pp_left[self.move_slots[move_name]] > 0
+        except KeyError:
+            return False
+
     def apply_stat_change(self, stat_name: str, amount: int):
         self.modify_stat(stat_name, amount)
 
@@ -54,24 +222,33 @@ class BattleStats:
         self.current_hp = min(self.max_hp, self.current_hp + amount)
 
     def modify_stat(self, stat_name: str, stat_change: int, ):
-        if stat_name not in self.stat_modifiers:
+        index = BATTLE_STAT_INDEX.get(stat_name)
+        if index is None:
             return
-        
-        current_stage = self.stat_modifiers[stat_name]
-        new_stage = max(-6, min(6, current_stage + stat_change))
-        self.stat_modifiers[stat_name] = new_stage
+
+        stage = self.stages[index] + stat_change
+        if stage > MAX_STAGE:
+            stage = MAX_STAGE
+        elif stage < MIN_STAGE:
+            stage = MIN_STAGE
+        self.stages[index] = stage
 
     def get_effective_stat(self, stat_name: str):
-        base = self.battle_stats[stat_name]
-        stage = self.stat_modifiers[stat_name]
-        multiplier = self.get_stage_multiplier(stage)
-        stat_value = int(base * multiplier)
-        
+        index = BATTLE_STAT_INDEX[stat_name]
+        stat_value = int(self.stat_values[index] * STAGE_MULTIPLIERS[self.stages[index]])
+
         # Apply status effects
-        if stat_name == "speed" and self.status == "paralysis":
+        if index == SPEED and self.status == "paralysis":
             # Paralysis reduces speed to 25% of normal
             stat_value = int(stat_value * 0.25)
-            
+
+        return stat_value
+
+    def effective_stat(self, index: int):
+        """get_effective_stat by array slot (ATTACK, SPEED, ...)"""
+        stat_value = int(self.stat_values[index] * STAGE_MULTIPLIERS[self.stages[index]])
+        if index == SPEED and self.status == "paralysis":
+            stat_value = int(stat_value * 0.25)
         return stat_value
 
     def get_stage_multiplier(self, stage: int) -> float:
@@ -79,9 +256,9 @@ class BattleStats:
             return (2 + stage) / 2
         else:
             return 2 / (2 - stage)
-        
+
     def get_acc_eva_multiplier(self, stage) -> float:
         if stage >= 0:
             return (3 + stage) / 3
         else:
-            return 3 / (3 - stage)
\ No newline at end of file
+            return 3 / (3 - stage)
@@ -0,0 +1,148 @@
+"""Damage for whole teams at once: every attacker's moves against every defender, in NumPy.
+
+This mirrors Move.compute_damage step for step (including its truncations), so for
+any single attacker/move/defender the result equals the scalar formula.
+"""
+import numpy as np
+
+from models.battle_stats import BATTLE_STAT_INDEX
+from models.type_chart import DUAL_TYPE_MATRIX, NUM_TYPES, TYPE_INDEX, defender_key
+
+# Random damage factor as percentages. The battle engine doesn't roll one, so the
+# default reproduces Move.compute_damage; GEN4_DAMAGE_ROLLS is the cartridge's 85-100% spread.
+NO_ROLL = (100,)
+GEN4_DAMAGE_ROLLS = tuple(range(85, 101))
+
+STATS = ("attack", "defense", "sp_attack", "sp_defense")
+ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE = range(len(STATS))
+# Where STATS sit in BattleStats' stat_values and stages arrays
+_STAT_SLOTS = slice(BATTLE_STAT_INDEX[STATS[0]], BATTLE_STAT_INDEX[STATS[-1]] + 1)
+
+# Dual-type table padded with a neutral "unknown type" slot, for moves or Pokemon
+# with types missing from the chart
+_UNKNOWN = NUM_TYPES
+_EFFECTIVENESS = np.ones((NUM_TYPES + 1,) * 3)
+_EFFECTIVENESS[:NUM_TYPES, :NUM_TYPES, :NUM_TYPES] = DUAL_TYPE_MATRIX
+
+
+def stage_multiplier(stages):
+    """Vectorized BattleStats.get_stage_multiplier"""
+    stages = np.asarray(stages)
+    return np.where(stages >= 0, (2 + stages) / 2, 2 / (2 - np.minimum(stages, 0)))
+
+
+class StatArrays:
+    """Battle stats of a list of Pokemon, stacked into (pokemon, stat) arrays"""
+
+    def __init__(self, pokemon_list):
+        battle_stats = [p.battle_stats for p in pokemon_list]
+        base = np.array([s.stat_values[_STAT_SLOTS] for s in battle_stats], dtype=float).reshape(-1, len(STATS))
+        stages = np.array([s.stages[_STAT_SLOTS] for s in battle_stats], dtype=int).reshape(-1, len(STATS))
+
+        self.level = np.array([p.level for p in pokemon_list])
+        # get_effective_stat truncates; the crit branch uses the untruncated stat with
+        # the attacker's drops and the defender's boosts ignored
+        self.effective = np.trunc(base * stage_multiplier(stages))
+        self.crit_attack = base * stage_multiplier(np.maximum(stages, 0))
+        self.crit_defense = base * stage_multiplier(np.minimum(stages, 0))
+        self.type_keys = np.array([defender_key(p.types) or (_UNKNOWN, _UNKNOWN) for p in pokemon_list],
+                                  dtype=np.intp).reshape(-1, 2)
+
+    def __len__(self):
+        return len(self.level)
+
+
+class MoveTable:
+    """Each attacker's moveset, padded to the longest one: arrays are (attacker, move slot)"""
+
+    def __init__(self, attackers, movesets=None):
+        if movesets is None:
+            movesets = [p.moves for p in attackers]
+        width = max((len(moves) for moves in movesets), default=0)
+        self.moves = [list(moves) + [None] * (width - len(moves)) for moves in movesets]
+
+        shape = (len(self.moves), width)
+        self.damaging = np.zeros(shape, dtype=bool)
+        self.power = np.zeros(shape)
+        self.physical = np.zeros(shape, dtype=bool)
+        self.type_index = np.full(shape, _UNKNOWN, dtype=np.intp)
+        self.stab = np.ones(shape)
+        self.burn_halves = np.zeros(shape, dtype=bool)
+        self.crit_chance = np.zeros(shape)
+
+        for i, (attacker, moves) in enumerate(zip(attackers, self.moves)):
+            for j, move in enumerate(moves):
+                if move is None or move.power is None or move.damage_class == "status":
+                    continue
+                self.damaging[i, j] = True
+                self.power[i, j] = move.power
+                self.physical[i, j] = move.damage_class == "physical"
+                self.type_index[i, j] = TYPE_INDEX.get(move.move_type, _UNKNOWN)
+                self.stab[i, j] = move.stab(attacker)
+                self.burn_halves[i, j] = move.burn_halves(attacker)
+                self.crit_chance[i, j] = move.critical_hit_chance()
+
+
+def damage_rolls(attackers, moves, defenders, is_critical=False, rolls=NO_ROLL):
+    """Damage of every roll, as an int array of shape (attacker, move slot, defender, roll).
+
+    attackers and defenders are StatArrays, moves the attackers' MoveTable. Padding
+    slots and status moves deal 0.
+    """
+    physical = moves.physical[:, :, None]
+    if is_critical:
+        attack_stats, defense_stats = attackers.crit_attack, defenders.crit_defense
+    else:
+        attack_stats, defense_stats = attackers.effective, defenders.effective
+
+    attack = np.where(physical, attack_stats[:, None, None, ATTACK], attack_stats[:, None, None, SP_ATTACK])
+    defense = np.where(physical, defense_stats[None, None, :, DEFENSE], defense_stats[None, None, :, SP_DEFENSE])
+    level = attackers.level[:, None, None]
+    power = moves.power[:, :, None]
+
+    base = ((2 * level / 5 + 2) * power * attack / defense) / 50 + 2
+    type_multiplier = _EFFECTIVENESS[moves.type_index[:, :, None],
+                                     defenders.type_keys[None, None, :, 0],
+                                     defenders.type_keys[None, None, :, 1]]
+
+    factor = np.asarray(rolls, dtype=float) / 100
+    damage = np.trunc(base[..., None] * factor * moves.stab[:, :, None, None] * type_multiplier[..., None])
+    if is_critical:
+        damage *= 2
+    damage = np.where(moves.burn_halves[:, :, None, None], damage // 2, damage)
+    damage = np.maximum(1, damage)
+    return np.where(moves.damaging[:, :, None, None], damage, 0).astype(np.int64)
+
+
+class DamageRange:
+    """Min/max/mean damage per (attacker, move slot, defender), for normal and critical hits"""
+
+    def __init__(self, normal, critical, crit_chance):
+        self.min = normal.min(axis=-1)
+        self.max = normal.max(axis=-1)
+        self.mean = normal.mean(axis=-1)
+        self.crit_min = critical.min(axis=-1)
+        self.crit_max = critical.max(axis=-1)
+        self.crit_mean = critical.mean(axis=-1)
+        self.crit_chance = crit_chance[:, :, None]
+
+    @property
+    def expected(self):
+        """Mean damage of a hit, with the move's crit chance folded in"""
+        return (1 - self.crit_chance) * self.mean + self.crit_chance * self.crit_mean
+
+
+def damage_range(attackers, moves, defenders, rolls=NO_ROLL):
+    """DamageRange of every attacker move against every defender, from prebuilt arrays"""
+    normal = damage_rolls(attackers, moves, defenders, False, rolls)
+    critical = damage_rolls(attackers, moves, defenders, True, rolls)
+    return DamageRange(normal, critical, moves.crit_chance)
+
+
+def team_damage(attackers, defenders, rolls=NO_ROLL):
+    """DamageRange of each attacker's own moves against each defender.
+
+    >>> table = team_damage(player.team, opponent.team)
+    >>> table.max[i, j, k]   # attacker i, move slot j, defender k
+    """
+    return damage_range(StatArrays(attackers), MoveTable(attackers), StatArrays(defenders), rolls)
@@ -0,0 +1,181 @@
+"""Exact damage distributions and KO probabilities, without Monte Carlo.
+
+A move's distribution combines the accuracy check, the number of hits, and for every
+hit the crit branch and the random damage rolls, each adjusted by the defender's
+ability as BattleManager.calculate_damage does. Distributions are cached per
+(attacker, defender, move) key, built from everything the damage formula reads.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from models.battle_stats import ACCURACY, ATTACK, EVASION
+from models.damage_calc import NO_ROLL
+
+# Gen 4 odds for 2-5 hit moves like Fury Attack
+GEN4_MULTI_HIT = {2: 3 / 8, 3: 3 / 8, 4: 1 / 8, 5: 1 / 8}
+
+CACHE_SIZE = 4096
+
+
+class DamageDistribution:
+    """Discrete distribution of damage dealt by one use of a move: probs[d] = P(damage == d)"""
+
+    def __init__(self, probs):
+        self.probs = np.asarray(probs, dtype=float)
+        self.probs.flags.writeable = False
+
+    @property
+    def mean(self):
+        return float(np.dot(np.arange(len(self.probs)), self.probs))
+
+    @property
+    def min(self):
+        return int(np.flatnonzero(self.probs)[0])
+
+    @property
+    def max(self):
+        return int(np.flatnonzero(self.probs)[-1])
+
+    def chance(self, damage):
+        return float(self.probs[damage]) if damage < len(self.probs) else 0.0
+
+    def ko_chances(self, hp, turns=2):
+        """Chance that `turns` consecutive uses have knocked out a defender with `hp` left,
+        for 1..turns uses (so [OHKO, 2HKO, ...]).
+
+        Totals are capped at hp while convolving, so the arrays never grow past hp + 1.
+        """
+        if hp <= 0:
+            return [1.0] * turns
+        capped = np.zeros(hp + 1)
+        capped[:min(hp, len(self.probs))] = self.probs[:hp]
+        capped[hp] = self.probs[hp:].sum()
+
+        chances = []
+        total = capped
+        for turn in range(turns):
+            if turn:
+                total = np.convolve(total, capped)
+                total[hp] = total[hp:].sum()
+                total = total[:hp + 1]
+            chances.append(float(total[hp]))
+        return chances
+
+    def ko_chance(self, hp, turns=1):
+        return self.ko_chances(hp, turns)[-1]
+
+    def __eq__(self, other):
+        return isinstance(other, DamageDistribution) and np.array_equal(self.probs, other.probs)
+
+
+def hit_chance(attacker, defender, move):
+    """Chance that the move connects, from its accuracy and the accuracy/evasion stages"""
+    if move.accuracy is None:
+        return 1.0
+    acc_mod = attacker.battle_stats.get_acc_eva_multiplier(attacker.battle_stats.stages[ACCURACY])
+    eva_mod = defender.battle_stats.get_acc_eva_multiplier(defender.battle_stats.stages[EVASION])
+    return min(1.0, move.accuracy * acc_mod / eva_mod / 100)
+
+
+def hit_count_distribution(move):
+    """{number of hits: probability} from the move's HitInfo"""
+    hit_info = move.hit_info
+    min_hits = getattr(hit_info, "min_hits", None) or 1
+    max_hits = getattr(hit_info, "max_hits", None) or min_hits
+    if (min_hits, max_hits) == (2, 5):
+        return dict(GEN4_MULTI_HIT)
+    count = max_hits - min_hits + 1
+    return {hits: 1 / count for hits in range(min_hits, max_hits + 1)}
+
+
+def _single_hit(attacker, defender, move, rolls):
+    crit = move.critical_hit_chance()
+    damages = [move.compute_damage(attacker, defender, False, roll) for roll in rolls]
+    crit_damages = [move.compute_damage(attacker, defender, True, roll) for roll in rolls]
+    modify_damage = getattr(defender.ability, "modify_damage", None)
+    if modify_damage is not None:
+        damages = [modify_damage(attacker, defender, move, damage) for damage in damages]
+        crit_damages = [modify_damage(attacker, defender, move, damage) for damage in crit_damages]
+    probs = np.zeros(max(crit_damages + damages) + 1)
+    np.add.at(probs, damages, (1 - crit) / len(rolls))
+    np.add.at(probs, crit_damages, crit / len(rolls))
+    return probs
+
+
+def compute_distribution(attacker, defender, move, rolls=NO_ROLL):
+    """Uncached damage distribution of one use of move"""
+    if move.power is None or move.damage_class == "status":
+        return DamageDistribution([1.0])
+
+    single = _single_hit(attacker, defender, move, rolls)
+    hits = hit_count_distribution(move)
+    probs = np.zeros((len(single) - 1) * max(hits) + 1)
+    total = np.ones(1)
+    for count in range(1, max(hits) + 1):
+        total = np.convolve(total, single)
+        if count in hits:
+            probs[:len(total)] += hits[count] * total
+
+    accuracy = hit_chance(attacker, defender, move)
+    probs *= accuracy
+    probs[0] += 1 - accuracy
+    return DamageDistribution(probs)
+
+
+def _pokemon_key(pokemon):
+    stats = pokemon.battle_stats
+    return (
+        pokemon.level,
+        tuple(pokemon.types),
+        tuple(stats.stat_values[ATTACK:]),
+        tuple(stats.stages[ATTACK:]),
+        stats.status,
+        getattr(pokemon.ability, "name", None),
+        # Pinch abilities like Overgrow change damage at a third of max HP or less
+        stats.current_hp <= stats.max_hp // 3,
+    )
+
+
+def _move_key(move):
+    hit_info = move.hit_info
+    return (
+        move.power, move.damage_class, move.move_type, move.accuracy, move.crit_rate,
+        getattr(hit_info, "min_hits", None), getattr(hit_info, "max_hits", None),
+    )
+
+
+_cache = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def damage_distribution(attacker, defender, move, rolls=NO_ROLL):
+    """Damage distribution of one use of move, from a bounded LRU cache"""
+    key = (_pokemon_key(attacker), _pokemon_key(defender), _move_key(move), tuple(rolls))
+    distribution = _cache.get(key)
+    if distribution is not None:
+        _cache.move_to_end(key)
+        _cache_stats["hits"] += 1
+        return distribution
+
+    _cache_stats["misses"] += 1
+    distribution = compute_distribution(attacker, defender, move, rolls)
+    _cache[key] = distribution
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return distribution
+
+
+def ko_probabilities(attacker, defender, move, turns=2, rolls=NO_ROLL):
+    """[OHKO, 2HKO, ...] chances of move against the defender's current HP"""
+    distribution = damage_distribution(attacker, defender, move, rolls)
+    return distribution.ko_chances(defender.battle_stats.current_hp, turns)
+
+
+def cache_info():
+    return dict(_cache_stats, size=len(_cache))
+
+
+def clear_cache():
+    _cache.clear()
+    _cache_stats.update(hits=0, misses=0)
@@ -0,0 +1,60 @@
+"""Memoized move scoring for the greedy AI (make_ai_action and choose_best_counter).
+
+Both heuristics only look at types, move types/powers and which moves still have PP,
+so the same species pairing scores the same every turn and in every battle. Results
+are kept in a bounded LRU table keyed by exactly those inputs, with hit/miss counters
+so the work saved over a tournament can be read off cache_info().
+"""
+from collections import OrderedDict
+
+CACHE_SIZE = 8192
+
+_cache = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def move_choice_key(attacker, defender):
+    """What make_ai_action's score reads: the attacker's types and the moves it still has
+    PP for, and the defender's types. HP, stat stages and status don't change the score,
+    so they are left out rather than splitting identical entries.
+
+    Each move is keyed with its index in attacker.moves and the entry stores an index,
+    never a Move: Pokemon sharing a key can know moves that match on name, type and
+    power but differ in accuracy, priority or effects, and each must get its own."""
+    has_pp = attacker.battle_stats.has_pp
+    return (
+        tuple(attacker.types),
+        tuple([(index, move.name, move.move_type, move.power)
+               for index, move in enumerate(attacker.moves) if has_pp(move.name)]),
+        tuple(defender.types),
+    )
+
+
+def counter_key(candidate, defender):
+    """What choose_best_counter's score for one bench Pokemon reads"""
+    return ("counter", tuple([move.move_type for move in candidate.moves]), tuple(defender.types))
+
+
+def cached(key, compute):
+    """compute() for key, or its remembered result"""
+    try:
+        value = _cache[key]
+    except KeyError:
+        _cache_stats["misses"] += 1
+        value = _cache[key] = compute()
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return value
+    _cache.move_to_end(key)
+    _cache_stats["hits"] += 1
+    return value
+
+
+def cache_info():
+    lookups = _cache_stats["hits"] + _cache_stats["misses"]
+    return dict(_cache_stats, size=len(_cache), hit_rate=_cache_stats["hits"] / lookups if lookups else 0.0)
+
+
+def clear_cache():
+    _cache.clear()
+    _cache_stats.update(hits=0, misses=0)
@@ -0,0 +1,83 @@
+from bisect import bisect_right
+
+DEFAULT_VERSION_GROUP = "heartgold-soulsilver"
+LEVEL_UP = "level-up"
+
+
+class Learnset:
+    """Per-species learnset indexed by (version group, learn method).
+
+    Each bucket holds parallel tuples sorted by level, so "moves known at level L"
+    is a bisect plus a slice. A move that appears more than once in a bucket is kept
+    at its lowest level. Built from (move, method, version group, level) rows; the
+    index itself is built on the first query so loading every species stays cheap.
+    """
+
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+        self._index = None
+
+    def _build_index(self):
+        buckets = {}
+        for position, (move, method, version_group, level) in enumerate(self.rows):
+            buckets.setdefault((version_group, method), []).append((level, position, move))
+
+        index = {}
+        for key, entries in buckets.items():
+            entries.sort()
+            seen = set()
+            levels, moves, positions = [], [], []
+            for level, position, move in entries:
+                if move in seen:
+                    continue
+                seen.add(move)
+                levels.append(level)
+                moves.append(move)
+                positions.append(position)
+            index[key] = (tuple(levels), tuple(moves), tuple(positions))
+        self._index = index
+        return index
+
+    @property
+    def index(self):
+        return self._index if self._index is not None else self._build_index()
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __eq__(self, other):
+        return isinstance(other, Learnset) and self.rows == other.rows
+
+    def __hash__(self):
+        return hash(self.rows)
+
+    def version_groups(self):
+        return sorted({version_group for version_group, _ in self.index})
+
+    def methods(self, version_group=DEFAULT_VERSION_GROUP):
+        return sorted(method for group, method in self.index if group == version_group)
+
+    def moves_at_level(self, level, version_group=DEFAULT_VERSION_GROUP, method=LEVEL_UP, source_order=False):
+        """Moves learnable at or below `level`, lowest level first.
+
+        source_order=True returns them in the order PokeAPI lists them instead,
+        which is what extract_level_up_moves has always used to pick a moveset.
+        """
+        bucket = self.index.get((version_group, method))
+        if bucket is None:
+            return ()
+        levels, moves, positions = bucket
+        end = bisect_right(levels, level)
+        if not source_order:
+            return moves[:end]
+        return tuple(move for _, move in sorted(zip(positions[:end], moves[:end])))
+
+    def moves_at_level_by_version_group(self, level, method=LEVEL_UP):
+        """moves_at_level for every version group this species has data for"""
+        return {
+            version_group: self.moves_at_level(level, version_group, method)
+            for version_group in self.version_groups()
+        }
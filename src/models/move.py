@@ -1,8 +1,18 @@
-from models.type_chart import get_type_multiplier
+from models.battle_stats import ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE, STAGE_MULTIPLIERS
+from models.type_chart import type_effectiveness
 from models.types import Type
 import logging
 import random
 
+# Generation 4 critical hit rates
+CRIT_RATES = {
+    0: 1/16,   # 6.25% (normal)
+    1: 1/8,    # 12.5% (high crit moves like Slash)
+    2: 1/4,    # 25% (Focus Energy + high crit move)
+    3: 1/3,    # 33.3%
+    4: 1/2,    # 50%
+}
+
 class HitInfo:
     def __init__(self, min_hits, max_hits, min_turns, max_turns):
         self.min_hits = min_hits
@@ -39,88 +49,94 @@ class Move:
 
 
 
-    def calculate_critical_hit_chance(self, attacker):
+    def critical_hit_chance(self):
         crit_stage = self.crit_rate or 0
-        
-        # Generation 4 critical hit rates
-        crit_rates = {
-            0: 1/16,   # 6.25% (normal)
-            1: 1/8,    # 12.5% (high crit moves like Slash)
-            2: 1/4,    # 25% (Focus Energy + high crit move)
-            3: 1/3,    # 33.3%
-            4: 1/2,    # 50%
-        }
-        
+
         # Cap at stage 4
         crit_stage = min(crit_stage, 4)
-        crit_chance = crit_rates.get(crit_stage, 1/16)
+        return CRIT_RATES.get(crit_stage, 1/16)
+
+    def calculate_critical_hit_chance(self, attacker, rng=random):
+        crit_stage = min(self.crit_rate or 0, 4)
+        crit_chance = self.critical_hit_chance()
         
-        random_roll = random.random()
+        random_roll = rng.random()
         is_crit = random_roll < crit_chance
         
         logging.info(f"Critical hit check for {self.name}: stage={crit_stage}, chance={crit_chance:.4f}, roll={random_roll:.4f}, result={is_crit}")
         
         return is_crit
 
-    def apply_damage(self, attacker, defender):
+    def apply_damage(self, attacker, defender, rng=random):
         logging.info(f"Apply damage called for move: {self.name}")
         if self.power is None or self.damage_class == "status":
             logging.info(f"Move {self.name} is status move or has no power, returning 0 damage")
             return 0, False
         
         # Check for critical hit
-        is_critical = self.calculate_critical_hit_chance(attacker)
+        is_critical = self.calculate_critical_hit_chance(attacker, rng)
         logging.info(f"Critical hit result for {self.name}: {is_critical}")
-        
+        logging.info(f"MOVE TYPE: {self.move_type}, ATTACKER TYPES: {attacker.types}")
+
+        return self.compute_damage(attacker, defender, is_critical), is_critical
+
+    def roll_damage(self, attacker, defender, chance=None):
+        """Same as apply_damage but without logging. The crit roll is chance(probability),
+        e.g. BattleManager.chance so searches can enumerate it; by default it is drawn
+        from the random module, as apply_damage draws it."""
+        if self.power is None or self.damage_class == "status":
+            return 0, False
+
+        crit_chance = self.critical_hit_chance()
+        is_critical = chance(crit_chance) if chance is not None else random.random() < crit_chance
+        return self.compute_damage(attacker, defender, is_critical), is_critical
+
+    def compute_damage(self, attacker, defender, is_critical, roll=100):
+        """Deterministic part of the damage formula once the crit roll is known.
+        roll is the random damage factor in percent; the battle engine always uses 100."""
         # Get relevant stats - for crits, ignore stat changes that would be disadvantageous
         if self.damage_class == "physical":
-            if is_critical:
-                # Critical hits ignore negative attack stages and positive defense stages
-                attack_mod = max(0, attacker.battle_stats.stat_modifiers.get("attack", 0))
-                defense_mod = min(0, defender.battle_stats.stat_modifiers.get("defense", 0))
-                attack = attacker.battle_stats.battle_stats["attack"] * attacker.battle_stats.get_stage_multiplier(attack_mod)
-                defense = defender.battle_stats.battle_stats["defense"] * defender.battle_stats.get_stage_multiplier(defense_mod)
-            else:
-                attack = attacker.battle_stats.get_effective_stat("attack")
-                defense = defender.battle_stats.get_effective_stat("defense")
+            attack_stat, defense_stat = ATTACK, DEFENSE
+        else:
+            attack_stat, defense_stat = SP_ATTACK, SP_DEFENSE
+        attacker_stats, defender_stats = attacker.battle_stats, defender.battle_stats
+        if is_critical:
+            # Critical hits ignore negative attack stages and positive defense stages
+            attack = attacker_stats.stat_values[attack_stat] * STAGE_MULTIPLIERS[max(0, attacker_stats.stages[attack_stat])]
+            defense = defender_stats.stat_values[defense_stat] * STAGE_MULTIPLIERS[min(0, defender_stats.stages[defense_stat])]
         else:
-            if is_critical:
-                # Critical hits ignore negative sp_attack stages and positive sp_defense stages
-                sp_attack_mod = max(0, attacker.battle_stats.stat_modifiers.get("sp_attack", 0))
-                sp_defense_mod = min(0, defender.battle_stats.stat_modifiers.get("sp_defense", 0))
-                attack = attacker.battle_stats.battle_stats["sp_attack"] * attacker.battle_stats.get_stage_multiplier(sp_attack_mod)
-                defense = defender.battle_stats.battle_stats["sp_defense"] * defender.battle_stats.get_stage_multiplier(sp_defense_mod)
-            else:
-                attack = attacker.battle_stats.get_effective_stat("sp_attack")
-                defense = defender.battle_stats.get_effective_stat("sp_defense")
+            attack = attacker_stats.effective_stat(attack_stat)
+            defense = defender_stats.effective_stat(defense_stat)
 
         # Apply STAB bonus
-        stab = 1.5 if self.move_type in [t.value for t in attacker.types] else 1.0
+        stab = self.stab(attacker)
 
-        logging.info(f"MOVE TYPE: {self.move_type}, ATTACKER TYPES: {attacker.types}")
         # Apply type effectiveness
-        type_multiplier = 1.0
-        for t in defender.types:
-            type_effect = get_type_multiplier(self.move_type, t)
-            logging.info(f"{self.move_type} vs {t} = {type_effect}")
-            type_multiplier *= type_effect
+        type_multiplier = type_effectiveness(self.move_type, defender.types)
 
         # Calculate final damage
         level = attacker.level
         power = self.power
         damage = (((2 * level / 5 + 2) * power * attack / defense) / 50 + 2)
-        damage = int(damage * stab * type_multiplier)
+        damage = int(damage * (roll / 100) * stab * type_multiplier)
         
         # Apply critical hit multiplier
         if is_critical:
             damage = int(damage * 2)
             
         # Apply burn damage reduction for physical moves
-        if (self.damage_class == "Physical" and 
-            attacker.battle_stats.status == "burn"):
+        if self.burn_halves(attacker):
+            damage = damage // 2
+
+        return max(1, damage)
+
+    def stab(self, attacker):
+        return 1.5 if self.move_type in [t.value for t in attacker.types] else 1.0
+
+    def burn_halves(self, attacker):
+        """Whether a burned attacker deals half damage with this move"""
+        if self.damage_class == "Physical" and attacker.battle_stats.status == "burn":
             # Check if Pokemon has Guts ability (which prevents burn attack reduction)
             has_guts = hasattr(attacker.ability, 'name') and attacker.ability.name == "Guts"
-            if not has_guts:
-                damage = damage // 2
-
-        return max(1, damage), is_critical
\ No newline at end of file
+            return not has_guts
+        return False
\ No newline at end of file
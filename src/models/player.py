@@ -1,3 +1,5 @@
+import copy
+
 from .pokemon import Pokemon
 from typing import List
 
@@ -8,6 +10,12 @@ class Player:
         self.team = team
         self.active_index = 0
     
+    # copy of the player and their team's battle state, for search/simulation
+    def copy(self):
+        clone = copy.copy(self)
+        clone.team = [p.copy() for p in self.team]
+        return clone
+
     # return pokemon at front of party
     def active_pokemon(self):
         return self.team[self.active_index]
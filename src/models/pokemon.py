@@ -1,26 +1,37 @@
+import copy
 import random
-import requests
+from array import array
 import io
 import pygame
 import logging
 
 from .base_stats import BaseStats
-from .battle_stats import BattleStats
+from .battle_stats import HP, POKEMON_STAT_INDEX, POKEMON_STATS, STAT_TYPECODE, BattleStats, StatView, stat_array
 from .abilities.ability import Ability
+from data.sprite_cache import get_sprite_cache
+from graphics.sprite_atlas import get_sprite_atlas
 
 def load_sprite(url):
     if not pygame.display.get_init():
         return None
+    atlas = get_sprite_atlas()
+    if atlas and url in atlas:
+        return atlas.get(url)
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        image_data = response.content
+        image_data = get_sprite_cache().get(url)
+        if image_data is None:
+            return None
         return pygame.image.load(io.BytesIO(image_data)).convert_alpha()
     except Exception as e:
         logging.info(f"Failed to load sprite from {url}: {e}")
         return None
 
 class Pokemon:
+    # IVs, EVs and stats are arrays in POKEMON_STATS order (see models.battle_stats);
+    # iv, ev and stats are dict-style views of them
+    __slots__ = ("name", "ability", "base_stats", "types", "moves", "level", "iv_values", "ev_values",
+                 "stat_values", "front_sprite", "back_sprite", "battle_stats")
+
     def __init__(self, name, ability: Ability, base_stats: BaseStats, types, moves, level, iv, ev, front_sprite=None, back_sprite=None):
         self.name = name
         self.ability = ability
@@ -33,18 +44,42 @@ class Pokemon:
         self.front_sprite = front_sprite
         self.back_sprite = back_sprite
         
-        self.stats = self.calculate_stats()
+        self.stat_values = self.calculate_stat_values()
         self.battle_stats = BattleStats(self)
 
+    @property
+    def iv(self):
+        return StatView(self.iv_values, POKEMON_STAT_INDEX)
+
+    @iv.setter
+    def iv(self, iv):
+        self.iv_values = stat_array(iv)
+
+    @property
+    def ev(self):
+        return StatView(self.ev_values, POKEMON_STAT_INDEX)
+
+    @ev.setter
+    def ev(self, ev):
+        self.ev_values = stat_array(ev)
+
+    @property
+    def stats(self):
+        return StatView(self.stat_values, POKEMON_STAT_INDEX)
+
+    @stats.setter
+    def stats(self, stats):
+        self.stat_values = stat_array(stats)
+
     @staticmethod
-    def generate_random_iv():
+    def generate_random_iv(rng=random):
         return {
-            "hp": random.randint(0, 31),
-            "attack": random.randint(0, 31),
-            "defense": random.randint(0, 31),
-            "sp_attack": random.randint(0, 31),
-            "sp_defense": random.randint(0, 31),
-            "speed": random.randint(0, 31),
+            "hp": rng.randint(0, 31),
+            "attack": rng.randint(0, 31),
+            "defense": rng.randint(0, 31),
+            "sp_attack": rng.randint(0, 31),
+            "sp_defense": rng.randint(0, 31),
+            "speed": rng.randint(0, 31),
         }
 
     @staticmethod
@@ -65,24 +100,29 @@ class Pokemon:
         return None
 
     def calculate_stats(self):
-        def calc(stat, is_hp=False):
-            base = getattr(self.base_stats, stat)
-            iv = self.iv[stat]
-            ev = self.ev[stat]
-            if is_hp:
-                return int(((2 * base + iv + ev // 4) * self.level) / 100) + self.level + 10
-            else:
-                return int(((2 * base + iv + ev // 4) * self.level) / 100) + 5
+        return dict(zip(POKEMON_STATS, self.calculate_stat_values()))
 
-        return {
-            "hp": calc("hp", is_hp=True),
-            "attack": calc("attack"),
-            "defense": calc("defense"),
-            "sp_attack": calc("sp_attack"),
-            "sp_defense": calc("sp_defense"),
-            "speed": calc("speed"),
-        }
+    def calculate_stat_values(self):
+        level = self.level
+        values = array(STAT_TYPECODE)
+        for i, stat in enumerate(POKEMON_STATS):
+            value = int(((2 * getattr(self.base_stats, stat) + self.iv_values[i] + self.ev_values[i] // 4) * level) / 100)
+            values.append(value + level + 10 if i == HP else value + 5)
+        return values
     
+    def copy(self):
+        """Copy for search/simulation: battle state is copied, species data and moves are shared"""
+        clone = copy.copy(self)
+        clone.battle_stats = self.battle_stats.copy()
+        return clone
+
+    def reset_battle_state(self, iv=None):
+        """Back to full HP/PP with no status or stat stages. New IVs, if given, recalculate the stats."""
+        if iv is not None:
+            self.iv = iv
+            self.stat_values = self.calculate_stat_values()
+        self.battle_stats = BattleStats(self)
+
     def is_fainted(self):
         return self.battle_stats.is_fainted()
 
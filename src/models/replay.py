@@ -0,0 +1,327 @@
+# replay.py
+# Compact battle replays. A battle's outcome is fixed by its RNG seed, the two teams
+# and the actions each side picked, so that is all a Replay keeps: a few dozen bytes
+# of struct-packed header and teams, then 3 bytes per turn (one byte per side's
+# action plus the forced replacements after faints). Replayer re-runs the turns
+# through the engine to rebuild the battle as it stood after any turn, and
+# write_archive/read_archive store many replays as one zlib stream, so a tournament
+# of thousands of games fits in a few MB.
+#
+# Usage:
+#   battle = SimBattle(player, opponent)
+#   recorder = ReplayRecorder(battle, seed=42)   # reseeds the battle, records each turn
+#   battle.run()
+#   data = recorder.replay().to_bytes()
+#   battle = Replayer(Replay.from_bytes(data)).battle_at(turn=5)
+
+import random
+import struct
+import zlib
+from typing import List, NamedTuple, Tuple
+
+from .player import Player
+from .player_action import PlayerAction
+from .rng import SimRNG
+from .sim_battle import SimBattle
+
+MAGIC = b"PKRP"
+VERSION = 1
+
+# Action byte: kind in the top two bits, slot / team index / item string in the rest
+MOVE, SWITCH, ITEM = 0, 1, 2
+ACTION_KINDS = {"move": MOVE, "switch": SWITCH, "item": ITEM}
+ARG_MASK = 0x3F
+
+# Replacement byte: side in the top bit, team index in the rest
+OPPONENT_SIDE = 0x80
+
+RNG_KINDS = ["Random", "SimRNG"]
+WINNERS = [None, "player", "opponent"]
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+
+_HEADER = struct.Struct("<4sBBBQ")      # magic, version, rng kind, winner, seed
+_POKEMON = struct.Struct("<HB6B6BB")    # name, level, IVs, EVs, move count
+
+
+class PokemonRecord(NamedTuple):
+    name: str
+    level: int
+    iv: Tuple[int, ...]     # in STATS order
+    ev: Tuple[int, ...]
+    moves: Tuple[str, ...]
+
+    @classmethod
+    def of(cls, pokemon):
+        return cls(pokemon.name, pokemon.level, tuple(pokemon.iv[s] for s in STATS),
+                   tuple(pokemon.ev[s] for s in STATS), tuple(move.name for move in pokemon.moves))
+
+
+class Turn(NamedTuple):
+    player_action: int      # action bytes
+    opponent_action: int
+    replacements: Tuple[int, ...] = ()      # replacement bytes, in the order they happened
+
+
+class Replay(NamedTuple):
+    seed: int
+    teams: Tuple[Tuple[PokemonRecord, ...], Tuple[PokemonRecord, ...]]
+    turns: Tuple[Turn, ...]
+    winner: object = None   # "player", "opponent" or None
+    rng_kind: str = "Random"
+    strings: Tuple[str, ...] = ()   # items used, for decoding item actions
+
+    def to_bytes(self) -> bytes:
+        strings = _StringTable(self.strings)
+        teams = bytearray()
+        for team in self.teams:
+            teams.append(len(team))
+            for record in team:
+                teams += _POKEMON.pack(strings.index(record.name), record.level, *record.iv, *record.ev,
+                                       len(record.moves))
+                teams += struct.pack(f"<{len(record.moves)}H", *[strings.index(m) for m in record.moves])
+        turns = bytearray(struct.pack("<I", len(self.turns)))
+        for turn in self.turns:
+            turns += bytes((turn.player_action, turn.opponent_action, len(turn.replacements)))
+            turns += bytes(turn.replacements)
+
+        header = _HEADER.pack(MAGIC, VERSION, RNG_KINDS.index(self.rng_kind), WINNERS.index(self.winner), self.seed)
+        return header + strings.to_bytes() + teams + turns
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        replay, _ = cls._unpack(memoryview(data), 0)
+        return replay
+
+    @classmethod
+    def _unpack(cls, data, offset):
+        magic, version, rng_kind, winner, seed = _HEADER.unpack_from(data, offset)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} replay")
+        offset += _HEADER.size
+        strings, offset = _StringTable.unpack(data, offset)
+
+        teams = []
+        for _ in range(2):
+            team = []
+            size = data[offset]
+            offset += 1
+            for _ in range(size):
+                name, level, *rest = _POKEMON.unpack_from(data, offset)
+                offset += _POKEMON.size
+                iv, ev, n_moves = tuple(rest[:6]), tuple(rest[6:12]), rest[12]
+                moves = struct.unpack_from(f"<{n_moves}H", data, offset)
+                offset += 2 * n_moves
+                team.append(PokemonRecord(strings[name], level, iv, ev, tuple(strings[m] for m in moves)))
+            teams.append(tuple(team))
+
+        (n_turns,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        turns = []
+        for _ in range(n_turns):
+            player_action, opponent_action, n_replacements = data[offset:offset + 3]
+            offset += 3
+            turns.append(Turn(player_action, opponent_action, tuple(data[offset:offset + n_replacements])))
+            offset += n_replacements
+
+        replay = cls(seed, tuple(teams), tuple(turns), WINNERS[winner], RNG_KINDS[rng_kind], tuple(strings))
+        return replay, offset
+
+
+class _StringTable:
+    """Pokemon, move and item names, each stored once per replay"""
+
+    def __init__(self, strings=()):
+        self.strings = list(strings)
+        self._index = {s: i for i, s in enumerate(self.strings)}
+
+    def index(self, string):
+        if string not in self._index:
+            self._index[string] = len(self.strings)
+            self.strings.append(string)
+        return self._index[string]
+
+    def to_bytes(self):
+        out = bytearray(struct.pack("<H", len(self.strings)))
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            out.append(len(encoded))
+            out += encoded
+        return bytes(out)
+
+    @staticmethod
+    def unpack(data, offset):
+        (count,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        strings = []
+        for _ in range(count):
+            length = data[offset]
+            strings.append(bytes(data[offset + 1:offset + 1 + length]).decode("utf-8"))
+            offset += 1 + length
+        return strings, offset
+
+
+def encode_action(action: PlayerAction, pokemon, strings: _StringTable) -> int:
+    if action.type == "move":
+        arg = next((i for i, move in enumerate(pokemon.moves) if move.name == action.move.name), None)
+        if arg is None:
+            raise ValueError(f"{pokemon.name} doesn't know {action.move.name}")
+    elif action.type == "switch":
+        arg = action.switch_to
+    else:
+        arg = strings.index(action.item)
+    if arg > ARG_MASK:
+        raise ValueError(f"Can't record {action.type} argument {arg}")
+    return ACTION_KINDS[action.type] << 6 | arg
+
+
+def decode_action(byte: int, pokemon, strings) -> PlayerAction:
+    kind, arg = byte >> 6, byte & ARG_MASK
+    if kind == MOVE:
+        return PlayerAction(type="move", move=pokemon.moves[arg])
+    if kind == SWITCH:
+        return PlayerAction(type="switch", switch_to=arg)
+    return PlayerAction(type="item", item=strings[arg])
+
+
+class ReplayRecorder:
+    """Records a battle from its first turn. Reseeds the battle's RNG with `seed`
+    (0 <= seed < 2**64) so the replay can reproduce every roll."""
+
+    def __init__(self, battle, seed: int):
+        if not 0 <= seed < 2 ** 64:
+            raise ValueError("Replay seeds must fit in 64 bits")
+        if type(battle.rng).__name__ not in RNG_KINDS:
+            raise ValueError(f"Can't record a battle using {type(battle.rng).__name__}")
+        battle.rng.seed(seed)
+        battle.replay = self
+        # The sides, not the battle: a back-reference would make every recorded
+        # battle a cycle that only the garbage collector can free
+        self.player, self.opponent = battle.player, battle.opponent
+        self.seed = seed
+        self.rng_kind = type(battle.rng).__name__
+        self.teams = tuple(tuple(PokemonRecord.of(p) for p in side.team) for side in (self.player, self.opponent))
+        self.strings = _StringTable()
+        self.turns = []
+
+    def record_turn(self, player_action, opponent_action):
+        self.turns.append(Turn(encode_action(player_action, self.player.active_pokemon(), self.strings),
+                               encode_action(opponent_action, self.opponent.active_pokemon(), self.strings), ()))
+
+    def record_replacement(self, player, index):
+        if not self.turns:
+            return      # sent out before the first recorded turn: part of the starting teams
+        side = OPPONENT_SIDE if player is self.opponent else 0
+        turn = self.turns[-1]
+        self.turns[-1] = turn._replace(replacements=turn.replacements + (side | index,))
+
+    def replay(self) -> Replay:
+        player_left, opponent_left = self.player.has_available_pokemon(), self.opponent.has_available_pokemon()
+        winner = None
+        if player_left and not opponent_left:
+            winner = "player"
+        elif opponent_left and not player_left:
+            winner = "opponent"
+        return Replay(self.seed, self.teams, tuple(self.turns), winner, self.rng_kind, tuple(self.strings.strings))
+
+
+class ReplayBattle(SimBattle):
+    """Headless battle that takes its faint replacements from a replay"""
+
+    def __init__(self, player, opponent, rng, replacements=()):
+        super().__init__(player, opponent, rng=rng)
+        self.replacements = list(replacements)
+
+    def handle_faint(self, player):
+        if not player.active_pokemon().is_fainted() or not player.has_available_pokemon():
+            return
+        side = OPPONENT_SIDE if player is self.opponent else 0
+        for i, byte in enumerate(self.replacements):
+            if byte & OPPONENT_SIDE == side:
+                del self.replacements[i]
+                self.send_out(player, byte & ~OPPONENT_SIDE)
+                return
+        super().handle_faint(player)
+
+
+class Replayer:
+    """Rebuilds a recorded battle by re-running its turns through the engine.
+
+    pokemon_factory(name, level) must return that Pokemon with the moves it was
+    recorded with (in any order); the default loads it from the game data.
+    """
+
+    def __init__(self, replay: Replay, pokemon_factory=None):
+        self.replay = replay
+        self.pokemon_factory = pokemon_factory or _load_pokemon
+
+    def __len__(self):
+        return len(self.replay.turns)
+
+    def build_team(self, records: List[PokemonRecord]):
+        team = []
+        for record in records:
+            pokemon = self.pokemon_factory(record.name, record.level)
+            known = {move.name: move for move in pokemon.moves}
+            missing = [name for name in record.moves if name not in known]
+            if missing:
+                raise ValueError(f"{record.name} from the factory doesn't know {', '.join(missing)}")
+            pokemon.moves = [known[name] for name in record.moves]
+            pokemon.ev = dict(zip(STATS, record.ev))
+            pokemon.reset_battle_state(dict(zip(STATS, record.iv)))
+            team.append(pokemon)
+        return team
+
+    def battle_at(self, turn=None) -> ReplayBattle:
+        """The battle as it stood after `turn` turns (all of them by default)"""
+        battle = self._start()
+        for recorded in self.replay.turns[:turn]:
+            self._play(battle, recorded)
+        return battle
+
+    def turns(self):
+        """Yield the battle after each turn, re-running the replay once"""
+        battle = self._start()
+        for recorded in self.replay.turns:
+            self._play(battle, recorded)
+            yield battle
+
+    def _start(self):
+        rng = (SimRNG if self.replay.rng_kind == "SimRNG" else random.Random)(self.replay.seed)
+        return ReplayBattle(Player("Player", True, self.build_team(self.replay.teams[0])),
+                            Player("Opponent", True, self.build_team(self.replay.teams[1])), rng)
+
+    def _play(self, battle, recorded):
+        strings = self.replay.strings
+        battle.replacements.extend(recorded.replacements)
+        battle.take_turn(decode_action(recorded.player_action, battle.player.active_pokemon(), strings),
+                         decode_action(recorded.opponent_action, battle.opponent.active_pokemon(), strings))
+
+
+def write_archive(path, replays):
+    """Store replays as one zlib-compressed stream of length-prefixed records"""
+    compressor = zlib.compressobj(9)
+    count = 0
+    with open(path, "wb") as f:
+        for replay in replays:
+            data = replay.to_bytes()
+            f.write(compressor.compress(struct.pack("<I", len(data)) + data))
+            count += 1
+        f.write(compressor.flush())
+    return count
+
+
+def read_archive(path):
+    """Yield the replays of an archive written by write_archive, in order"""
+    with open(path, "rb") as f:
+        data = memoryview(zlib.decompress(f.read()))
+    offset = 0
+    while offset < len(data):
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        yield Replay.from_bytes(data[offset:offset + length])
+        offset += length
+
+
+def _load_pokemon(name, level):
+    from data.loaders import load_pokemon, get_move_lookup
+    return load_pokemon(name, get_move_lookup(), level)
@@ -0,0 +1,83 @@
+from .battle_events import Faint
+from .battle_manager import BattleManager
+from .player import Player
+
+DEFAULT_MAX_TURNS = 500
+
+
+class BattleResult:
+    def __init__(self, winner, turns, player_hp, opponent_hp):
+        self.winner = winner            # "player", "opponent" or None (draw / turn cap)
+        self.turns = turns
+        self.player_hp = player_hp      # remaining HP per team slot
+        self.opponent_hp = opponent_hp
+
+    def __eq__(self, other):
+        return isinstance(other, BattleResult) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return f"BattleResult(winner={self.winner!r}, turns={self.turns})"
+
+
+def play_out(battle: BattleManager, max_turns=DEFAULT_MAX_TURNS) -> BattleResult:
+    """Let the AI pick moves for both sides until the battle ends or max_turns is hit.
+
+    Works on any BattleManager, so the headless engine and the regular one can be
+    compared turn for turn.
+    """
+    turns = 0
+    while not battle.battle_over and turns < max_turns:
+        player_action = battle.make_ai_action(battle.player, battle.opponent)
+        opponent_action = battle.make_ai_action(battle.opponent, battle.player)
+        battle.take_turn(player_action, opponent_action)
+        turns += 1
+
+    player_alive = battle.player.has_available_pokemon()
+    opponent_alive = battle.opponent.has_available_pokemon()
+    if player_alive and not opponent_alive:
+        winner = "player"
+    elif opponent_alive and not player_alive:
+        winner = "opponent"
+    else:
+        winner = None
+
+    return BattleResult(
+        winner=winner,
+        turns=turns,
+        player_hp=[p.battle_stats.current_hp for p in battle.player.team],
+        opponent_hp=[p.battle_stats.current_hp for p in battle.opponent.team],
+    )
+
+
+class SimBattle(BattleManager):
+    """Headless battle engine for AI training and balance analysis.
+
+    Uses the same rules as BattleManager (it only overrides output), so for the same
+    random seed it produces the same outcome, but it emits no text, keeps no battle
+    log and skips the debug trace unless verbose=True.
+    Events still reach subscribers either way.
+    """
+
+    def __init__(self, player: Player, opponent: Player, verbose=False, ui_logger=None, rng=None):
+        super().__init__(player, opponent, ui_logger=ui_logger, rng=rng)
+        self.verbose = verbose
+        self.text_log = verbose
+
+    def debug(self, message: str, *args):
+        if self.verbose:
+            super().debug(message, *args)
+
+    def handle_faint(self, player):
+        # Nobody is at the keyboard, so both sides pick replacements like the AI does
+        if not player.active_pokemon().is_fainted():
+            return
+        self.emit(Faint, player.active_pokemon())
+
+        if player.has_available_pokemon():
+            opponent = self.player if player == self.opponent else self.opponent
+            replacement = self.choose_best_counter(player, opponent.active_pokemon())
+            if replacement is not None:
+                self.send_out(player, replacement)
+
+    def run(self, max_turns=DEFAULT_MAX_TURNS) -> BattleResult:
+        return play_out(self, max_turns=max_turns)
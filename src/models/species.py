@@ -0,0 +1,42 @@
+from typing import NamedTuple, Optional, Tuple
+from .base_stats import BaseStats
+from .learnset import Learnset
+from .types import Type
+
+
+class Species(NamedTuple):
+    """Immutable, pre-parsed species data shared by every Pokemon of that species"""
+    id: int
+    name: str
+    types: Tuple[Type, ...]
+    stats: Tuple[int, int, int, int, int, int]   # hp, attack, defense, sp_attack, sp_defense, speed
+    learnset: Learnset
+    abilities: Tuple[str, ...] = ()
+    front_sprite_url: Optional[str] = None
+    back_sprite_url: Optional[str] = None
+
+    @property
+    def base_stats(self) -> BaseStats:
+        return BaseStats(*self.stats)
+
+    @classmethod
+    def from_record(cls, data):
+        """Build from a compiled pokemon.json record (see data.loaders.compile_species)"""
+        stats = data["stats"]
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            types=tuple(Type[t.upper()] for t in data["types"]),
+            stats=(
+                stats["hp"],
+                stats["attack"],
+                stats["defense"],
+                stats["special-attack"],
+                stats["special-defense"],
+                stats["speed"],
+            ),
+            learnset=Learnset(data["learnset"]),
+            abilities=tuple(data.get("abilities", ())),
+            front_sprite_url=data["sprites"].get("front_default"),
+            back_sprite_url=data["sprites"].get("back_default"),
+        )
@@ -1,3 +1,5 @@
+import numpy as np
+
 from models.types import Type
 
 TYPE_EFFECTIVENESS = {
@@ -159,6 +161,70 @@ TYPE_EFFECTIVENESS = {
     }
 }
 
+
+
+# Dense form of the chart, indexed by type ordinal: TYPE_MATRIX[attacking, defending].
+TYPE_ORDER = tuple(Type)
+TYPE_INDEX = {t: i for i, t in enumerate(TYPE_ORDER)}
+NUM_TYPES = len(TYPE_ORDER)
+
+TYPE_MATRIX = np.ones((NUM_TYPES, NUM_TYPES))
+for _attacking, _row in TYPE_EFFECTIVENESS.items():
+    for _defending, _multiplier in _row.items():
+        TYPE_MATRIX[TYPE_INDEX[_attacking], TYPE_INDEX[_defending]] = _multiplier
+
+# Every defender as a (primary, secondary) pair: DUAL_TYPE_MATRIX[attacking, primary, secondary].
+# Single-typed defenders sit on the diagonal (secondary == primary) and aren't squared.
+DUAL_TYPE_MATRIX = TYPE_MATRIX[:, :, None] * TYPE_MATRIX[:, None, :]
+_diagonal = np.arange(NUM_TYPES)
+DUAL_TYPE_MATRIX[:, _diagonal, _diagonal] = TYPE_MATRIX
+TYPE_MATRIX.flags.writeable = False
+DUAL_TYPE_MATRIX.flags.writeable = False
+
+# Scalar lookups go through plain nested lists: indexing a NumPy array one element
+# at a time costs more than the dict lookups it replaces.
+_TYPE_ROWS = TYPE_MATRIX.tolist()
+_DUAL_ROWS = DUAL_TYPE_MATRIX.tolist()
+
+
 def get_type_multiplier(attacking: Type, defending: Type) -> float:
-    return TYPE_EFFECTIVENESS.get(attacking, {}).get(defending, 1.0)
+    i = TYPE_INDEX.get(attacking)
+    j = TYPE_INDEX.get(defending)
+    if i is None or j is None:
+        return 1.0
+    return _TYPE_ROWS[i][j]
+
+
+def defender_key(types) -> tuple:
+    """(primary, secondary) ordinals for a defender's types; secondary == primary when single-typed"""
+    indices = [TYPE_INDEX[t] for t in types if t in TYPE_INDEX]
+    if not indices:
+        return None
+    return indices[0], indices[-1]
+
+
+def type_effectiveness(attacking: Type, defending_types) -> float:
+    """Combined multiplier of one attacking type against a defender's (one or two) types"""
+    try:
+        return _DUAL_ROWS[TYPE_INDEX[attacking]][TYPE_INDEX[defending_types[0]]][TYPE_INDEX[defending_types[-1]]]
+    except (KeyError, IndexError, TypeError):
+        # Unknown attacking type, no types, or types we don't chart: skip what we can't look up
+        i = TYPE_INDEX.get(attacking)
+        key = defender_key(defending_types)
+        if i is None or key is None:
+            return 1.0
+        return _DUAL_ROWS[i][key[0]][key[1]]
+
+
+def effectiveness_matrix(move_types, defenders) -> np.ndarray:
+    """Score many attacking types against many defenders in one lookup.
 
+    move_types is a sequence of Types (or ordinals), defenders a sequence of type
+    lists (or an (N, 2) array of defender_key pairs). Returns an (M, N) array.
+    """
+    moves = np.asarray([TYPE_INDEX.get(t, t) for t in move_types], dtype=np.intp)
+    if isinstance(defenders, np.ndarray):
+        keys = defenders.astype(np.intp, copy=False).reshape(-1, 2)
+    else:
+        keys = np.asarray([defender_key(types) for types in defenders], dtype=np.intp).reshape(-1, 2)
+    return DUAL_TYPE_MATRIX[moves[:, None], keys[None, :, 0], keys[None, :, 1]]
@@ -1,9 +1,18 @@
 import pygame
 import time
 import logging
+from models.battle_events import Damage, StatusApplied, StatusCheck, Switch
 from models.player_action import PlayerAction
 from models.type_colouring import TYPE_COLORS
 
+# Seconds per frame a planning opponent AI (one with ponder() and best_action(), e.g.
+# ai.mcts_ai.MCTSAI) may think, so frames aren't dropped: it ponders while the player
+# is choosing and decides from that tree once they have
+AI_PONDER_SLICE = 0.004
+
+# Seconds each battle message stays up before the next event plays
+MESSAGE_PAUSE = 1.0
+
 class BattleScene:
     def __init__(self, screen, battle_manager):
         self.screen = screen
@@ -17,13 +26,19 @@ class BattleScene:
 
         self.turn_state = "start"
         self.action_timer = 0
-        self.first = None
-        self.second = None
-        self.first_action = None
-        self.second_action = None
-        self.status_queue = []
+        self.opponent_action = None
+        # The turn is resolved in one go; its events are then played back one at a
+        # time, and until they have been the screen shows the state the turn began in
+        self.events = []
+        self.shown_active = {}      # Player -> Pokemon on screen
+        self.shown_hp = {}          # id(pokemon) -> HP on its bar
+        self.shown_status = {}      # id(pokemon) -> status on its label
         self.previous_player_pokemon = None
         self.previous_opponent_pokemon = None
+        battle_manager.subscribe(self.on_battle_event)
+
+    def on_battle_event(self, event):
+        self.events.append(event)
 
     def log_message(self, text):
         self.battle_log.append(text)
@@ -43,7 +58,7 @@ class BattleScene:
         self.previous_opponent_pokemon = current_opponent_pokemon
 
     def handle_input(self, event):
-        if self.battle_manager.battle_over:
+        if self.battle_manager.battle_over or self.turn_state != "start":
             return
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             pos = event.pos
@@ -59,320 +74,112 @@ class BattleScene:
                         move = moves[i]
                         self.selected_action = PlayerAction(type="move", move=move)
 
-    def animate_hp_change(self, pokemon_owner, new_hp):
-        current_hp = pokemon_owner.active_pokemon().battle_stats.current_hp
+    def freeze_display(self):
+        """Keep showing the battle as it is now while the coming turn plays back"""
+        for side in (self.battle_manager.player, self.battle_manager.opponent):
+            self.shown_active[side] = side.active_pokemon()
+            for pokemon in side.team:
+                self.shown_hp[id(pokemon)] = pokemon.battle_stats.current_hp
+                self.shown_status[id(pokemon)] = pokemon.battle_stats.status
+
+    def release_display(self):
+        self.shown_active.clear()
+        self.shown_hp.clear()
+        self.shown_status.clear()
+
+    def displayed(self, side):
+        return self.shown_active.get(side) or side.active_pokemon()
+
+    def displayed_hp(self, pokemon):
+        return self.shown_hp.get(id(pokemon), pokemon.battle_stats.current_hp)
+
+    def displayed_status(self, pokemon):
+        return self.shown_status.get(id(pokemon), pokemon.battle_stats.status)
+
+    def animate_hp_change(self, pokemon, new_hp):
+        current_hp = self.displayed_hp(pokemon)
         hp_diff = new_hp - current_hp
         steps = max(abs(hp_diff), 1)
         step_fraction = hp_diff / steps
         for i in range(steps):
             current_hp += step_fraction
-            pokemon_owner.active_pokemon().battle_stats.current_hp = int(round(current_hp))
+            self.shown_hp[id(pokemon)] = int(round(current_hp))
             self.draw()
             pygame.display.flip()
             pygame.time.delay(35)
-        pokemon_owner.active_pokemon().battle_stats.current_hp = new_hp
+        self.shown_hp[id(pokemon)] = new_hp
         self.draw()
         pygame.display.flip()
 
+    def play_event(self, event):
+        """Show one battle event; returns how long to wait before the next"""
+        if isinstance(event, Damage):
+            self.animate_hp_change(event.pokemon, event.hp)
+        elif isinstance(event, Switch):
+            self.shown_active[event.player] = event.pokemon
+        elif isinstance(event, StatusApplied):
+            self.shown_status[id(event.pokemon)] = event.status
+        elif isinstance(event, StatusCheck) and event.can_move:
+            self.shown_status[id(event.pokemon)] = None     # woke up
+
+        text = event.text()
+        if text is None:
+            return 0
+        self.log_message(text)
+        return MESSAGE_PAUSE
+
     def update(self):
         self.check_pokemon_switches()
         
         current_time = time.time()
 
-        if self.battle_manager.battle_over:
-            return
-
-        if self.turn_state == "start" and self.selected_action:
-            # self.log_message(f"What will {self.battle_manager.player.active_pokemon().name} do?")
-            self.opponent_action = self.battle_manager.make_ai_action(
-                self.battle_manager.opponent, self.battle_manager.player
-            )
-            self.first, self.second = self.battle_manager.determine_turn_order(self.selected_action, self.opponent_action)
-            self.first_action = self.selected_action if self.first == self.battle_manager.player else self.opponent_action
-            self.second_action = self.opponent_action if self.first == self.battle_manager.player else self.selected_action
-
-            self.turn_state = "first_move"
-            self.action_timer = current_time + 1
-            return
-
-        elif self.turn_state == "first_move" and current_time >= self.action_timer:
-            if self.first_action and self.first_action.move:
-                # Check if status effects prevent the move
-                can_move, status_message = self.battle_manager.check_status_prevents_move(self.first)
-                
-                if not can_move:
-                    # Status prevents move - show status message instead of move name
-                    self.log_message(status_message)
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "second_move"  # Skip to opponent's turn
-                elif status_message:
-                    # Pokemon woke up - show wake up message then move name
-                    self.log_message(status_message)
-                    self.draw(); pygame.display.flip()
-                    pygame.time.delay(800)
-                    self.log_message(f"{self.first.active_pokemon().name} used {self.first_action.move.name}!")
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "first_damage_anim"
+        if self.turn_state == "playback":
+            if current_time >= self.action_timer:
+                if self.events:
+                    self.action_timer = current_time + self.play_event(self.events.pop(0))
                 else:
-                    # Normal move execution
-                    self.log_message(f"{self.first.active_pokemon().name} used {self.first_action.move.name}!")
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "first_damage_anim"
-            else:
-                self.turn_state = "start"
+                    self.release_display()
+                    self.selected_action = None
+                    self.turn_state = "start"
+                    self.ui_state = "main_menu"
             return
 
-        elif self.turn_state == "first_damage_anim" and current_time >= self.action_timer:
-            if self.first_action and self.first_action.move:
-                previous_status = self.second.active_pokemon().battle_stats.status
-                
-                # Calculate move damage without applying it
-                damage, is_critical, missed = self.battle_manager.execute_move_calculate_only(
-                    self.first, self.second, self.first_action.move)
-
-                # --- TYPE EFFECTIVENESS LOGGING ---
-                effectiveness = self.battle_manager.calculate_type_effectiveness(
-                    self.first_action.move.move_type,
-                    self.second.active_pokemon().types
-                )
-                if effectiveness > 1:
-                    self.log_message("It's super effective!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                elif effectiveness > 0 and effectiveness < 1:
-                    self.log_message("It's not very effective...")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                # --- END TYPE EFFECTIVENESS LOGGING ---
-
-                if missed or damage is None:
-                    self.turn_state = "second_move"
-                    self.action_timer = current_time + 1
-                    return
-                
-                # Calculate new HP for animation
-                original_hp = self.second.active_pokemon().battle_stats.current_hp
-                new_hp = max(0, original_hp - damage)
-                
-                # Animate HP change
-                self.animate_hp_change(self.second, new_hp)
-                
-                # Show critical hit message after HP animation if applicable
-                if is_critical:
-                    self.log_message("A critical hit!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                
-                # Apply effects and show damage message (damage already applied by animation)
-                ability = self.second.active_pokemon().ability
-                if hasattr(ability, "on_damage_taken"):
-                    ability.on_damage_taken(self.first.active_pokemon(), self.second.active_pokemon(), self.first_action.move, damage)
-                
-                # Skip damage application since animate_hp_change already applied it, and skip crit message since we showed it above
-                self.battle_manager.apply_calculated_damage(self.first, self.second, self.first_action.move, damage, is_critical, skip_damage_application=True, skip_crit_message=True)
-                
-                # Apply move effects (status effects, stat changes)
-                self.battle_manager.apply_move_effects(self.first, self.second, self.first_action.move)
-                
-                new_status = self.second.active_pokemon().battle_stats.status
-                if previous_status is None and new_status is not None:
-                    status_name = new_status.name if hasattr(new_status, 'name') else str(new_status)
-                    self.log_message(f"{self.second.active_pokemon().name} is now {status_name}!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(1000)
-                
-                self.action_timer = current_time + 1
-                self.turn_state = "check_faint1"
-            else:
-                self.turn_state = "start"
-            return
-
-        elif self.turn_state == "check_faint1" and current_time >= self.action_timer:
-            if self.second.active_pokemon().is_fainted():
-                self.battle_manager.handle_faint(self.second)
-                self.selected_action = None
-                self.first_action = None
-                self.second_action = None
-                self.ui_state = "main_menu"
-                if self.battle_manager.check_battle_end():
-                    self.turn_state = "end"
-                    return
-            self.turn_state = "second_move"
-            self.action_timer = current_time + 1
+        if self.battle_manager.battle_over:
             return
 
-        elif self.turn_state == "second_move" and current_time >= self.action_timer:
-            if self.second_action and self.second_action.move:
-                # Check if status effects prevent the move
-                can_move, status_message = self.battle_manager.check_status_prevents_move(self.second)
-                
-                if not can_move:
-                    # Status prevents move - show status message instead of move name
-                    self.log_message(status_message)
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "status"  # Skip to status effects
-                elif status_message:
-                    # Pokemon woke up - show wake up message then move name
-                    self.log_message(status_message)
-                    self.draw(); pygame.display.flip()
-                    pygame.time.delay(800)
-                    self.log_message(f"{self.second.active_pokemon().name} used {self.second_action.move.name}!")
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "second_damage_anim"
-                else:
-                    # Normal move execution
-                    self.log_message(f"{self.second.active_pokemon().name} used {self.second_action.move.name}!")
-                    self.draw(); pygame.display.flip()
-                    self.action_timer = current_time + 1
-                    self.turn_state = "second_damage_anim"
+        if self.turn_state == "start" and not self.selected_action:
+            ponder = getattr(self.battle_manager.opponent_ai, "ponder", None)
+            if ponder is not None:
+                ponder(self.battle_manager, self.battle_manager.opponent, self.battle_manager.player, AI_PONDER_SLICE)
+
+        elif self.turn_state == "start" and self.selected_action:
+            ai = self.battle_manager.opponent_ai
+            if getattr(ai, "ponder", None) is not None:
+                # Decide from the tree pondered so far: a full think() here would
+                # stall this frame for the AI's whole time budget
+                ai.ponder(self.battle_manager, self.battle_manager.opponent, self.battle_manager.player, AI_PONDER_SLICE)
+                self.opponent_action = ai.best_action()
             else:
-                self.turn_state = "start"
-            return
-
-        elif self.turn_state == "second_damage_anim" and current_time >= self.action_timer:
-            if self.second_action and self.second_action.move:
-                previous_status = self.first.active_pokemon().battle_stats.status
-                
-                # Calculate move damage without applying it
-                damage, is_critical, missed = self.battle_manager.execute_move_calculate_only(
-                    self.second, self.first, self.second_action.move)
-
-                # --- TYPE EFFECTIVENESS LOGGING ---
-                effectiveness = self.battle_manager.calculate_type_effectiveness(
-                    self.second_action.move.move_type,
-                    self.first.active_pokemon().types
+                self.opponent_action = self.battle_manager.make_ai_action(
+                    self.battle_manager.opponent, self.battle_manager.player
                 )
-                if effectiveness > 1:
-                    self.log_message("It's super effective!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                elif effectiveness > 0 and effectiveness < 1:
-                    self.log_message("It's not very effective...")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                # --- END TYPE EFFECTIVENESS LOGGING ---
-
-                if missed or damage is None:
-                    self.turn_state = "status"
-                    self.action_timer = current_time + 1
-                    return
-                
-                # Calculate new HP for animation
-                original_hp = self.first.active_pokemon().battle_stats.current_hp
-                new_hp = max(0, original_hp - damage)
-                
-                # Animate HP change
-                self.animate_hp_change(self.first, new_hp)
-                
-                # Show critical hit message after HP animation if applicable
-                if is_critical:
-                    self.log_message("A critical hit!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(800)
-                
-                # Apply effects and show damage message (damage already applied by animation)
-                ability = self.first.active_pokemon().ability
-                if hasattr(ability, "on_damage_taken"):
-                    ability.on_damage_taken(self.second.active_pokemon(), self.first.active_pokemon(), self.second_action.move, damage)
-                
-                # Skip damage application since animate_hp_change already applied it, and skip crit message since we showed it above
-                self.battle_manager.apply_calculated_damage(self.second, self.first, self.second_action.move, damage, is_critical, skip_damage_application=True, skip_crit_message=True)
-                
-                # Apply move effects (status effects, stat changes)
-                self.battle_manager.apply_move_effects(self.second, self.first, self.second_action.move)
-                
-                new_status = self.first.active_pokemon().battle_stats.status
-                if previous_status is None and new_status is not None:
-                    status_name = new_status.name if hasattr(new_status, 'name') else str(new_status)
-                    self.log_message(f"{self.first.active_pokemon().name} is now {status_name}!")
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(1000)
-                
-                self.action_timer = current_time + 1
-                self.turn_state = "check_faint2"
-            else:
-                self.turn_state = "start"
-            return
-
-        elif self.turn_state == "check_faint2" and current_time >= self.action_timer:
-            if self.first.active_pokemon().is_fainted():
-                self.battle_manager.handle_faint(self.first)
-                self.selected_action = None
-                self.first_action = None
-                self.second_action = None
-                self.ui_state = "main_menu"
-                if self.battle_manager.check_battle_end():
-                    self.turn_state = "end"
-                    return
-            self.turn_state = "status"
-            self.action_timer = current_time + 1
-            return
-
-        elif self.turn_state == "status" and current_time >= self.action_timer:
-            # Apply status effects and get list of (owner, new_hp, message)
-            self.status_queue = self.battle_manager.apply_end_of_turn_status_effects([
-                self.battle_manager.player.active_pokemon(),
-                self.battle_manager.opponent.active_pokemon()
-            ])
-            if self.status_queue:
-                owner, new_hp, message = self.status_queue.pop(0)
-                self.log_message(message)
-                self.draw()
-                pygame.display.flip()
-                self.action_timer = current_time + 1
-                self.current_status_owner = owner
-                self.current_status_new_hp = new_hp
-                self.turn_state = "status_damage_anim"
-            else:
-                self.turn_state = "end"
-                self.action_timer = current_time + 1
-            return
-
-        elif self.turn_state == "status_damage_anim" and current_time >= self.action_timer:
-            self.animate_hp_change(self.current_status_owner, self.current_status_new_hp)
-            if self.status_queue:
-                owner, new_hp, message = self.status_queue.pop(0)
-                self.log_message(message)
-                self.draw()
-                pygame.display.flip()
-                self.action_timer = current_time + 1
-                self.current_status_owner = owner
-                self.current_status_new_hp = new_hp
-                self.turn_state = "status_damage_anim"
-            else:
-                self.turn_state = "end"
-                self.action_timer = current_time + 1
-            return
-
-        elif self.turn_state == "end" and current_time >= self.action_timer:
-            self.selected_action = None
-            self.turn_state = "start"
+            self.freeze_display()
+            self.battle_manager.take_turn(self.selected_action, self.opponent_action)
             self.ui_state = "main_menu"
+            self.turn_state = "playback"
+            self.action_timer = current_time
 
     def draw(self):
         self.screen.fill((255, 255, 255))
 
-        player_pokemon = self.battle_manager.player.active_pokemon()
-        opponent_pokemon = self.battle_manager.opponent.active_pokemon()
+        player_pokemon = self.displayed(self.battle_manager.player)
+        opponent_pokemon = self.displayed(self.battle_manager.opponent)
 
         self.draw_pokemon(player_pokemon, 200, 250, is_player=True)
         self.draw_pokemon(opponent_pokemon, 1000, 150, is_player=False)
 
-        self.draw_hp_bar(player_pokemon.battle_stats.current_hp, player_pokemon.stats["hp"], 200, 350)
-        self.draw_hp_bar(opponent_pokemon.battle_stats.current_hp, opponent_pokemon.stats["hp"], 1000, 250)
+        self.draw_hp_bar(self.displayed_hp(player_pokemon), player_pokemon.stats["hp"], 200, 350)
+        self.draw_hp_bar(self.displayed_hp(opponent_pokemon), opponent_pokemon.stats["hp"], 1000, 250)
         self.fight_button_rect = pygame.Rect(300, 440, 600, 250)
 
         pygame.draw.line(self.screen, (0, 0, 0), (0, 400), (1200, 400), 2)
@@ -409,7 +216,7 @@ class BattleScene:
                 self.draw_text(move_text, x + 10, y + 10)
                 self.move_buttons.append(rect)
 
-        if self.battle_manager.battle_over:
+        if self.battle_manager.battle_over and self.turn_state != "playback":
             self.draw_text("Battle Over!", 560, 300)
 
         self.draw_dialogue_box()
@@ -425,7 +232,7 @@ class BattleScene:
         name_y = y + 75
         self.draw_text(pokemon.name, name_x, name_y)
         # Draw status label if there is a status
-        status = pokemon.battle_stats.status
+        status = self.displayed_status(pokemon)
         if status is not None:
             # status may be an Enum, str, or object with .name
             if hasattr(status, "name"):
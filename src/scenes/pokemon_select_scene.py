@@ -2,6 +2,8 @@ import pygame
 import threading
 import time
 from models.pokemon import load_sprite
+from data.sprite_cache import get_sprite_cache
+from graphics.sprite_atlas import get_sprite_atlas
 
 class PokemonSelectScene:
     def __init__(self, screen, pokemon_data, on_select_callback):
@@ -13,7 +15,9 @@ class PokemonSelectScene:
         self.page_size = 35
         self.buttons = []
         self.sprite_cache = {}
-        self.start_background_sprite_loader()
+        self.atlas = get_sprite_atlas()
+        if self.atlas is None:
+            self.start_background_sprite_loader()
 
         self.selected_team = []
         self.start_button = pygame.Rect(500, 720, 160, 40)
@@ -29,13 +33,30 @@ class PokemonSelectScene:
                 sprite_url = pokemon["sprites"]["front_default"]
 
                 if sprite_url not in self.sprite_cache:
+                    downloading = not get_sprite_cache().contains(sprite_url)
                     sprite = load_sprite(sprite_url)
                     self.sprite_cache[sprite_url] = sprite
-                    time.sleep(0.01)
+                    if downloading:
+                        # Only go easy on the sprite host, not on our own disk
+                        time.sleep(0.01)
     
     def start_background_sprite_loader(self):
         threading.Thread(target=self.preload_sprites, daemon=True).start()
 
+    def get_sprite(self, url):
+        """Sprite loaded once and kept, for sprites the atlas doesn't have"""
+        if url not in self.sprite_cache:
+            self.sprite_cache[url] = load_sprite(url)
+        return self.sprite_cache[url]
+
+    def draw_sprite(self, url, center):
+        # Never loads anything: draw() runs every frame
+        if self.atlas and self.atlas.blit(self.screen, url, center):
+            return
+        sprite = self.sprite_cache.get(url)
+        if sprite:
+            self.screen.blit(sprite, sprite.get_rect(center=center))
+
     def generate_buttons(self):
         self.buttons = []
 
@@ -57,30 +78,27 @@ class PokemonSelectScene:
             y = start_y + row * spacing_y
 
             rect = pygame.Rect(x, y, 100, 100)
-            sprite = None
+            sprite_url = None
 
-             # Load sprite from cache or download if needed
+            # Atlas sprites are drawn straight from the atlas pages, so only the URL is
+            # kept; anything else is loaded from the cache, or downloaded, now
             if "sprites" in pokemon and "front_default" in pokemon["sprites"]:
-                url = pokemon["sprites"]["front_default"]
-                if url in self.sprite_cache:
-                    sprite = self.sprite_cache[url]
-                else:
-                    sprite = load_sprite(url)
-                    self.sprite_cache[url] = sprite  # Save for reuse
+                sprite_url = pokemon["sprites"]["front_default"]
+                if not (self.atlas and sprite_url in self.atlas):
+                    self.get_sprite(sprite_url)
 
-            self.buttons.append((rect, pokemon, sprite))
+            self.buttons.append((rect, pokemon, sprite_url))
 
     def draw(self):
         # Clear screen
         self.screen.fill((255, 255, 255))
 
         # Draw pokemon grid
-        for rect, pokemon, sprite in self.buttons:
+        for rect, pokemon, sprite_url in self.buttons:
             pygame.draw.rect(self.screen, (200, 200, 200), rect)
 
-            if sprite:
-                sprite_rect = sprite.get_rect(center=(rect.centerx, rect.y + 40))
-                self.screen.blit(sprite, sprite_rect) 
+            if sprite_url:
+                self.draw_sprite(sprite_url, (rect.centerx, rect.y + 40))
 
             name_surface = self.font.render(pokemon["name"].capitalize(), True, (0, 0, 0))
             name_rect = name_surface.get_rect(center=(rect.centerx, rect.y + 80))
@@ -102,10 +120,7 @@ class PokemonSelectScene:
 
             # Draw sprite (if exists)
             if "sprites" in pokemon and "front_default" in pokemon["sprites"]:
-                sprite = load_sprite(pokemon["sprites"]["front_default"])
-                if sprite:
-                    sprite_rect = sprite.get_rect(center=(1000, y))
-                    self.screen.blit(sprite, sprite_rect)
+                self.draw_sprite(pokemon["sprites"]["front_default"], (1000, y))
 
             # Draw name
             name_surface = self.font.render(pokemon["name"].capitalize(), True, (0, 0, 0))
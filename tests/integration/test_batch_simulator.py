@@ -0,0 +1,56 @@
+"""Integration tests for the batch battle simulator"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from ai.batch_simulator import simulate_many, iter_simulate_many, BatchStats
+from models.sim_battle import BattleResult
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+SPECIES = {
+    "charizard": dict(hp=78, attack=84, defense=78, sp_attack=109, sp_defense=85, speed=100,
+                      types=[Type.FIRE, Type.FLYING], moves=[create_test_move("Ember", 40, Type.FIRE, damage_class="special")]),
+    "blastoise": dict(hp=79, attack=83, defense=100, sp_attack=85, sp_defense=105, speed=78,
+                      types=[Type.WATER], moves=[create_test_move("Water Gun", 40, Type.WATER, damage_class="special", accuracy=90)]),
+}
+
+
+def build_team(names, level):
+    return [create_test_pokemon(name, level=level, **SPECIES[name]) for name in names]
+
+
+class TestBatchSimulator:
+
+    def test_counts_add_up(self):
+        stats = simulate_many(["charizard"], ["blastoise"], 20, workers=1, team_builder=build_team)
+
+        assert stats.battles == 20
+        assert stats.wins_a + stats.wins_b + stats.draws == 20
+        assert stats.min_turns <= stats.avg_turns <= stats.max_turns
+
+    def test_type_advantage_wins(self):
+        stats = simulate_many(["charizard"], ["blastoise"], 20, workers=1, team_builder=build_team)
+
+        assert stats.win_rate_b > stats.win_rate_a
+
+    def test_results_independent_of_worker_count(self):
+        serial = simulate_many(["charizard", "blastoise"], ["blastoise"], 24, workers=1, seed=7, team_builder=build_team)
+        parallel = simulate_many(["charizard", "blastoise"], ["blastoise"], 24, workers=2, seed=7, team_builder=build_team)
+
+        assert vars(serial) == vars(parallel)
+
+    def test_streams_running_totals(self):
+        """Each yielded value keeps the totals as they stood after its chunk"""
+        snapshots = list(iter_simulate_many(["charizard"], ["blastoise"], 10, workers=1,
+                                            chunk_size=3, team_builder=build_team))
+
+        assert [s.battles for s in snapshots] == [3, 6, 9, 10]
+
+    def test_merge(self):
+        a, b = BatchStats(), BatchStats()
+        a.add(BattleResult("player", 3, [], []))
+        b.add(BattleResult(None, 9, [], []))
+        a.merge(b)
+
+        assert (a.battles, a.wins_a, a.draws, a.min_turns, a.max_turns) == (2, 1, 1, 3, 9)
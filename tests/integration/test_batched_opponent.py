@@ -0,0 +1,106 @@
+"""Integration tests for batched opponent inference over a VecEnv of PokemonEnvs"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import numpy as np
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from ai.batched_opponent import BatchedOpponent
+from ai.train_selfplay import make_vec_env, train_selfplay
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_move
+from tests.integration.test_train_selfplay import FixtureEnv
+
+
+class RecordingModel:
+    """Always picks move 0 and keeps every batch it was asked about"""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=True):
+        self.batches.append(np.array(observation))
+        return np.zeros(len(observation), dtype=np.int64), state
+
+
+class TwoMoveOpponentEnv(FixtureEnv):
+    """FixtureEnv whose opponent also knows a move the greedy fallback never picks"""
+
+    def _setup_battle(self):
+        super()._setup_battle()
+        charmander = self.opponent.active_pokemon()
+        charmander.moves = [create_test_move("Growl", None, Type.NORMAL, damage_class="status")] + charmander.moves
+        charmander.reset_battle_state()
+
+
+def opponent_views(env):
+    return np.stack(env.venv.env_method("_get_obs", perspective="opponent"))
+
+
+class TestBatchedOpponent:
+
+    def test_one_predict_per_step(self):
+        """The opponent model sees every env's observation at once, once per step"""
+        model = RecordingModel()
+        env = BatchedOpponent(DummyVecEnv([FixtureEnv] * 4), opponent_model=model)
+        env.reset()
+
+        for _ in range(3):
+            env.step(np.zeros(4, dtype=np.int64))
+
+        assert len(model.batches) == env.predict_calls == 3
+        assert all(batch.shape == (4, 12) for batch in model.batches)
+
+    def test_batch_is_each_opponents_view(self):
+        """The batch row for each env is that env's observation from the opponent's side"""
+        model = RecordingModel()
+        env = BatchedOpponent(DummyVecEnv([FixtureEnv] * 3), opponent_model=model)
+        env.reset()
+        env.step(np.array([0, 1, 0]))
+        expected = opponent_views(env)
+
+        env.step(np.array([1, 0, 1]))
+
+        np.testing.assert_allclose(model.batches[-1], expected)
+
+    def test_finished_battle_starts_from_reset_view(self):
+        """After a KO the next opponent observation is the new battle's, not the terminal one"""
+        env = BatchedOpponent(DummyVecEnv([FixtureEnv] * 2), opponent_model=RecordingModel())
+        env.reset()
+        env.venv.envs[0].unwrapped.opponent.active_pokemon().battle_stats.current_hp = 1
+
+        obs, rewards, dones, infos = env.step(np.array([0, 0]))
+
+        assert dones.tolist() == [True, False]
+        assert env.opponent_obs[0][0] == 1.0  # full HP again
+        np.testing.assert_allclose(env.opponent_obs, opponent_views(env))
+
+    def test_env_picks_opponent_move_without_model(self):
+        """With no model each env keeps its own greedy opponent instead of a random one"""
+        env = BatchedOpponent(DummyVecEnv([TwoMoveOpponentEnv] * 4))
+        env.reset()
+
+        for _ in range(3):
+            obs, rewards, dones, infos = env.step(np.zeros(4, dtype=np.int64))
+            picks = [e.battle.last_actions[1].move.name for e in env.venv.envs]
+            assert picks == ["Ember"] * 4
+
+        assert obs.shape == (4, 12)
+        assert env.predict_calls == 0
+
+    def test_selfplay_keeps_opponent_out_of_workers(self):
+        """Batched self-play swaps the snapshot on the wrapper; the workers never get a copy"""
+        model, callback = train_selfplay(32, workers=2, env_factory=FixtureEnv, sync_every=1, n_steps=8,
+                                         batch_size=16, n_epochs=1, verbose=0)
+
+        assert callback.opponent_version == 3
+        assert all(h["cpu_utilization"] > 0 for h in callback.history)
+
+        env = make_vec_env(FixtureEnv, 2, batched_opponent=True)
+        try:
+            assert isinstance(env, BatchedOpponent)
+            assert env.get_attr("external_opponent") == [True, True]
+            assert env.get_attr("opponent_model") == [None, None]
+        finally:
+            env.close()
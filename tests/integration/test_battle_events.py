@@ -0,0 +1,118 @@
+"""Integration tests for the battle event stream"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.battle_events import (BattleEnd, Damage, Faint, Miss, MoveUsed, StatChange, StatusApplied, StatusCheck,
+                                  Switch)
+from models.battle_manager import BattleManager
+from models.player_action import PlayerAction
+from models.sim_battle import SimBattle, play_out
+from tests.integration.test_sim_battle import build_battle
+
+
+class TestEventStream:
+
+    def test_events_render_the_battle_log(self, capsys):
+        """A headless battle's events carry the same text BattleManager logs"""
+        reference = build_battle(BattleManager, 4)
+        play_out(reference)
+        events = []
+        battle = build_battle(SimBattle, 4)
+        battle.subscribe(events.append)
+
+        battle.run()
+
+        assert battle.battle_log == []
+        assert [e.text() for e in events if e.text() is not None] == reference.battle_log
+
+    def test_nothing_is_built_without_listeners(self):
+        battle = build_battle(SimBattle, 0)
+
+        def explode(*args):
+            raise AssertionError("event built with nobody listening")
+
+        battle.emit(explode, "unused")
+        battle.subscribe(print)
+        battle.unsubscribe(print)
+        battle.emit(explode, "unused")
+
+    def test_damage_tracks_hp(self):
+        """Damage events carry the HP left, so a UI can animate straight from the feed"""
+        events = []
+        battle = build_battle(SimBattle, 2)
+        battle.subscribe(events.append)
+
+        battle.run()
+
+        damage = [e for e in events if isinstance(e, Damage)]
+        assert damage and all(e.amount >= 0 and e.hp >= 0 for e in damage)
+        for pokemon in battle.player.team + battle.opponent.team:
+            hits = [e.hp for e in damage if e.pokemon is pokemon]
+            assert not hits or hits[-1] == pokemon.battle_stats.current_hp
+
+    def test_faint_then_switch(self):
+        """Each faint the battle recovers from is followed by the replacement coming in"""
+        events, hp_on_entry = [], {}
+        battle = build_battle(SimBattle, 5)
+        battle.subscribe(events.append)
+        battle.subscribe(lambda e: isinstance(e, Switch) and hp_on_entry.setdefault(e, e.pokemon.battle_stats.current_hp))
+
+        battle.run()
+
+        faints = [i for i, e in enumerate(events) if isinstance(e, Faint)]
+        assert faints
+        for i in faints[:-1]:
+            switch = events[i + 1]
+            assert isinstance(switch, Switch) and events[i].pokemon in switch.player.team
+            assert hp_on_entry[switch] > 0
+
+    def test_sleep_and_battle_end(self):
+        """Status checks and the end of the battle arrive as events, not preformatted text"""
+        events = []
+        battle = build_battle(SimBattle, 3)
+        charizard = battle.player.active_pokemon()
+        charizard.battle_stats.status = "sleep"
+        charizard.battle_stats.sleep_turns = 2
+        battle.subscribe(events.append)
+
+        battle.run()
+
+        assert events[0] == StatusCheck(charizard, "sleep", False)
+        assert events[-1] == BattleEnd(battle.opponent if battle.opponent.has_available_pokemon() else battle.player)
+
+    def test_voluntary_switch(self):
+        events = []
+        battle = build_battle(SimBattle, 1)
+        battle.subscribe(events.append)
+
+        battle.take_turn(PlayerAction("switch", switch_to=2), battle.make_ai_action(battle.opponent, battle.player))
+
+        assert events[0] == Switch(battle.player, battle.player.team[2])
+        assert isinstance(events[1], MoveUsed) and events[1].pokemon is battle.opponent.active_pokemon()
+
+
+class TestEventText:
+
+    def test_end_of_turn_poison(self):
+        battle = build_battle(SimBattle, 0)
+        charizard = battle.player.active_pokemon()
+        charizard.battle_stats.status = "poison"
+        events = []
+        battle.subscribe(events.append)
+
+        battle.apply_end_of_turn_damage()
+
+        (event,) = events
+        expected = max(1, charizard.battle_stats.max_hp // 8)
+        assert event == Damage(charizard, expected, charizard.battle_stats.max_hp - expected, "poison")
+        assert event.text() == f"Charizard was hurt by poison! It took {expected} damage."
+
+    def test_stat_change_and_status_text(self):
+        charizard = build_battle(SimBattle, 0).player.active_pokemon()
+
+        assert StatChange(charizard, "attack", 2).text() == "Charizard's Attack sharply rose!"
+        assert StatChange(charizard, "speed", -1).text() == "Charizard's Speed fell!"
+        assert StatusApplied(charizard, "poison", True).text() == "Charizard was badly poisoned!"
+        assert StatusCheck(charizard, "paralysis", False).text() == "Charizard is paralyzed! It can't move!"
+        assert Miss(charizard, charizard.moves[0]).text() == f"Charizard's {charizard.moves[0].name} missed!"
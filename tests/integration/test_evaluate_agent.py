@@ -0,0 +1,72 @@
+"""Integration tests for the parallel, sequentially stopped agent evaluation"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from ai.evaluate_agent import evaluate, iter_evaluate, wilson_interval, write_plots
+from tests.integration.test_train_selfplay import FixtureEnv
+
+
+class FirstMoveAgent:
+    """Always picks move 0"""
+
+    def predict(self, observation, state=None, episode_start=None, deterministic=True):
+        return 0, state
+
+
+class TestWilsonInterval:
+
+    def test_contains_rate_and_narrows(self):
+        """The interval brackets the observed rate and tightens with more battles"""
+        low, high = wilson_interval(30, 100)
+        wide_low, wide_high = wilson_interval(3, 10)
+
+        assert low < 0.3 < high
+        assert high - low < wide_high - wide_low
+
+    def test_extremes_stay_in_bounds(self):
+        assert wilson_interval(0, 20)[0] == pytest.approx(0.0)
+        assert wilson_interval(20, 20)[1] == pytest.approx(1.0)
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+class TestEvaluate:
+
+    def test_stops_once_interval_is_tight(self):
+        """Evaluation ends at the first chunk whose win-rate interval meets the precision"""
+        stats, rows = evaluate(FirstMoveAgent(), workers=1, precision=0.15, min_battles=10, max_battles=1000,
+                               chunk_size=10, env_factory=FixtureEnv)
+
+        low, high = stats.confidence_interval()
+        assert (high - low) / 2 <= 0.15
+        assert stats.battles == len(rows) < 1000
+        assert [row[0] for row in rows] == list(range(1, stats.battles + 1))
+        assert stats.wins + stats.losses + stats.draws == stats.battles
+
+    def test_max_battles_caps_evaluation(self):
+        stats, rows = evaluate(FirstMoveAgent(), workers=1, precision=0.0, min_battles=1, max_battles=25,
+                               chunk_size=10, env_factory=FixtureEnv)
+
+        assert stats.battles == 25
+        assert [len(chunk) for chunk, _ in iter_evaluate(FirstMoveAgent(), workers=1, precision=0.0,
+                                                         max_battles=25, chunk_size=10,
+                                                         env_factory=FixtureEnv)] == [10, 10, 5]
+
+    def test_results_independent_of_worker_count(self):
+        """Seeding per battle and consuming chunks in order gives the same rows on a pool"""
+        kwargs = dict(seed=3, precision=0.2, min_battles=12, max_battles=200, chunk_size=4, env_factory=FixtureEnv)
+        serial_stats, serial_rows = evaluate(FirstMoveAgent(), workers=1, **kwargs)
+        parallel_stats, parallel_rows = evaluate(FirstMoveAgent(), workers=2, **kwargs)
+
+        assert parallel_rows == serial_rows
+        assert vars(parallel_stats) == vars(serial_stats)
+
+    def test_plots_written_to_file(self, tmp_path):
+        pytest.importorskip("matplotlib")
+        _, rows = evaluate(FirstMoveAgent(), workers=1, precision=0.0, max_battles=20, env_factory=FixtureEnv)
+        path = tmp_path / "evaluation.png"
+
+        write_plots(rows, path)
+
+        assert path.stat().st_size > 0
@@ -0,0 +1,105 @@
+"""Integration tests for the PokeAPI ingestion pipeline, against a local stand-in server"""
+import pytest
+import json
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from data.api_client.ingest import ingest, CheckpointStore
+
+
+class FakePokeAPI:
+    """Serves /api/v2/move/<id>/ with ETags; ids in `failing` answer 500"""
+
+    def __init__(self):
+        self.versions = {}
+        self.failing = set()
+        self.requests = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                record_id = int(self.path.rstrip("/").split("/")[-1])
+                api.requests.append((record_id, self.headers.get("If-None-Match")))
+                if record_id in api.failing:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+
+                etag = f'"v{api.versions.get(record_id, 1)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                body = json.dumps({"id": record_id, "name": f"move-{record_id}", "version": etag}).encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v2"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def fetched_ids(self):
+        return sorted(record_id for record_id, _ in self.requests)
+
+
+@pytest.fixture
+def api():
+    server = FakePokeAPI()
+    yield server
+    server.server.shutdown()
+
+
+def run(api, tmp_path, **kwargs):
+    return ingest("move", ids=range(1, 21), clean=lambda d: d, base_url=api.base_url,
+                  checkpoint_dir=str(tmp_path), concurrency=4, retries=1, backoff=0, **kwargs)
+
+
+class TestIngest:
+
+    def test_fetches_and_checkpoints_everything(self, api, tmp_path):
+        stats = run(api, tmp_path)
+
+        assert stats.ok and stats.fetched == 20
+        records = list(CheckpointStore("move", str(tmp_path)).records(range(1, 21)))
+        assert [r["id"] for r in records] == list(range(1, 21))
+
+    def test_resumes_after_failures(self, api, tmp_path):
+        api.failing = {3, 17}
+        stats = run(api, tmp_path)
+        assert set(stats.failed) == {3, 17}
+        assert stats.fetched == 18
+
+        api.failing = set()
+        api.requests.clear()
+        stats = run(api, tmp_path)
+
+        assert stats.ok
+        assert (stats.fetched, stats.skipped) == (2, 18)
+        assert api.fetched_ids() == [3, 17]
+
+    def test_failures_are_retried(self, api, tmp_path):
+        api.failing = {5}
+        run(api, tmp_path)
+
+        assert [r for r in api.requests if r[0] == 5] == [(5, None), (5, None)]
+
+    def test_revalidate_only_refetches_changed_records(self, api, tmp_path):
+        run(api, tmp_path)
+        api.versions[7] = 2
+        api.requests.clear()
+
+        stats = run(api, tmp_path, revalidate=True)
+
+        assert (stats.fetched, stats.not_modified) == (1, 19)
+        assert all(etag is not None for _, etag in api.requests)
+        assert CheckpointStore("move", str(tmp_path)).load(7)["data"]["version"] == '"v2"'
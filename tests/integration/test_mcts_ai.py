@@ -0,0 +1,132 @@
+"""Integration tests for the MCTS AI"""
+import random
+import sys
+import os
+import time
+from concurrent.futures import Future
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from ai.mcts_ai import MCTSAI, RolloutBattle, action_key, rollout_value
+from models.player import Player
+from models.player_action import PlayerAction
+from models.sim_battle import SimBattle, play_out
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+from tests.integration.test_sim_battle import build_battle
+
+
+class TestMCTSAI:
+
+    def test_picks_the_finishing_move(self):
+        """With the opponent on low HP the sure-hit move is chosen over the inaccurate stronger one"""
+        ours = create_test_pokemon("Ours", hp=100, speed=120, moves=[
+            create_test_move("Big Miss", 120, damage_class="physical", accuracy=30),
+            create_test_move("Sure Hit", 40, damage_class="physical"),
+        ])
+        theirs = create_test_pokemon("Theirs", hp=100, speed=50, moves=[create_test_move("Tackle", 60, damage_class="physical")])
+        theirs.battle_stats.current_hp = 5
+        battle = SimBattle(Player("Them", True, [theirs]), Player("Us", True, [ours]))
+
+        action = MCTSAI(time_budget=0.2, seed=0)(battle, battle.opponent, battle.player)
+
+        assert action.move.name == "Sure Hit"
+
+    def test_search_leaves_game_untouched(self):
+        """Thinking neither changes the battle nor consumes the global random state"""
+        battle = build_battle(SimBattle, seed=3)
+        before = (random.getstate(), [p.battle_stats.current_hp for p in battle.player.team + battle.opponent.team])
+
+        MCTSAI(time_budget=0.05, seed=0)(battle, battle.opponent, battle.player)
+
+        after = (random.getstate(), [p.battle_stats.current_hp for p in battle.player.team + battle.opponent.team])
+        assert after == before
+
+    def test_reuses_tree_across_turns(self):
+        """After a turn is played the root moves to the matching child and keeps its visits"""
+        battle = build_battle(SimBattle, seed=5)
+        ai = MCTSAI(time_budget=0.2, seed=0, switches=False)
+        action = ai(battle, battle.opponent, battle.player)
+        root = ai.root
+
+        battle.take_turn(battle.make_ai_action(battle.player, battle.opponent), action)
+        ai.begin(battle, battle.opponent, battle.player)
+
+        assert ai.root is root.children[(action_key(action), action_key(battle.last_actions[0]))]
+        assert ai.reused_visits == ai.root.visits > 0
+
+    def test_ponder_respects_budget(self):
+        """Pondering a few milliseconds per frame stays within a frame's time"""
+        battle = build_battle(SimBattle, seed=1)
+        ai = MCTSAI(seed=0)
+        for _ in range(5):
+            start = time.perf_counter()
+            ai.ponder(battle, battle.opponent, battle.player, 0.004)
+            assert time.perf_counter() - start < 1 / 60
+        assert ai.root.visits > 0 and ai.rollouts_per_second > 0
+
+    def test_ponder_cuts_rollouts_short(self):
+        """A slow rollout policy can't hold a ponder slice past its deadline"""
+        def slow_policy(battle, player, opponent):
+            time.sleep(0.001)
+            return battle.make_ai_action(player, opponent)
+
+        battle = build_battle(SimBattle, seed=1)
+        ai = MCTSAI(seed=0, rollout_policy=slow_policy)
+        start = time.perf_counter()
+        ai.ponder(battle, battle.opponent, battle.player, 0.004)
+
+        assert time.perf_counter() - start < 1 / 60
+        assert ai.root.visits > 0
+
+    def test_worker_rollouts(self):
+        """Rollouts on a worker process come back into the tree"""
+        battle = build_battle(SimBattle, seed=2)
+        with MCTSAI(time_budget=0.5, workers=1, seed=0) as ai:
+            action = ai(battle, battle.opponent, battle.player)
+            assert ai.rollouts > 0
+        assert isinstance(action, PlayerAction)
+        assert action.type in ("move", "switch")
+
+    def test_new_battle_cancels_pending_rollouts(self):
+        """Rollouts still queued from the previous battle are cancelled, not left to run"""
+        battle = build_battle(SimBattle, seed=2)
+        ai = MCTSAI(seed=0)
+        stale = Future()
+        ai._pending = {stale: []}
+
+        ai._start_battle(battle, battle.opponent, battle.player)
+
+        assert stale.cancelled()
+        assert ai._pending == {}
+
+    def test_plays_out_as_opponent_ai(self):
+        """A battle with MCTS as the opponent AI runs to the end"""
+        battle = build_battle(SimBattle, seed=4)
+        battle.opponent_ai = MCTSAI(time_budget=0.01, seed=0, max_rollout_turns=5)
+
+        result = play_out(battle)
+
+        assert result.winner in ("player", "opponent", None)
+
+
+class TestRollouts:
+
+    def test_rollout_battle_has_own_rng(self):
+        """Rollout coin flips come from the battle's seeded RNG, not the random module"""
+        source = build_battle(SimBattle, seed=0)
+        battle = RolloutBattle(source.player, source.opponent, seed=1)
+        state = random.getstate()
+
+        rolls = [battle.roll_int(1, 100) for _ in range(5)]
+
+        assert random.getstate() == state
+        expected = random.Random(1)
+        assert rolls == [expected.randint(1, 100) for _ in range(5)]
+
+    def test_rollout_value_is_signed(self):
+        """A side with every Pokemon standing at full HP against a wiped side scores +1"""
+        battle = build_battle(SimBattle, seed=0)
+        for p in battle.opponent.team:
+            p.battle_stats.current_hp = 0
+
+        assert rollout_value(battle.player, battle.opponent) == 1.0
+        assert rollout_value(battle.opponent, battle.player) == -1.0
@@ -0,0 +1,92 @@
+"""Integration tests for PokemonEnv episode resets"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from ai import pokemon_env
+from ai.pokemon_env import PokemonEnv
+from data import loaders
+from tests.unit.test_species import record
+
+
+@pytest.fixture(autouse=True)
+def pokemon_data(monkeypatch):
+    monkeypatch.setitem(loaders._loaded, "pokemon", [
+        record(25, "pikachu", ["electric"], [("thunder-shock", "level-up", "heartgold-soulsilver", 1)]),
+        record(4, "charmander", ["fire"], [("scratch", "level-up", "heartgold-soulsilver", 1)]),
+    ])
+    monkeypatch.delitem(loaders._loaded, "species_index", raising=False)
+    yield
+    loaders._loaded.pop("species_index", None)
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    calls = []
+
+    def counting_load(name, move_lookup, level=50):
+        calls.append(name)
+        return loaders.load_pokemon(name, move_lookup, level)
+    monkeypatch.setattr(pokemon_env, "load_pokemon", counting_load)
+    return calls
+
+
+class TestPokemonEnvReset:
+
+    def test_species_loaded_once(self, load_calls):
+        """Resets reuse the Pokemon loaded when the env was built"""
+        env = PokemonEnv(opponent_model=None)
+        pokemon = env.player.active_pokemon()
+        for _ in range(5):
+            env.reset()
+
+        assert load_calls == ["pikachu", "charmander"]
+        assert env.player.active_pokemon() is pokemon
+
+    def test_reset_restores_battle_state(self):
+        """After a turn, reset brings both sides back to full health and PP"""
+        env = PokemonEnv(opponent_model=None)
+        env.reset()
+        env.step(0)
+
+        obs, _ = env.reset()
+
+        assert obs[0] == obs[1] == 1.0
+        assert obs[3] == 1.0
+        assert not env.battle.battle_over
+
+    def test_ivs_rolled_like_a_fresh_load(self):
+        """A reset seeded with 3 rolls the IVs a freshly loaded pair gets after random.seed(3)"""
+        env = PokemonEnv(opponent_model=None)
+        move_lookup = loaders.get_move_lookup()
+
+        env.reset(seed=3)
+        random.seed(3)
+        fresh = [loaders.load_pokemon(name, move_lookup) for name in ("pikachu", "charmander")]
+
+        assert env.player.active_pokemon().stats == fresh[0].stats
+        assert env.opponent.active_pokemon().stats == fresh[1].stats
+
+    def test_seeded_episodes_replay_exactly(self):
+        """Same seed, same episode, whatever the random module is doing meanwhile"""
+        def episode(env, seed, noise):
+            env.reset(seed=seed)
+            random.seed(noise)
+            trace = []
+            done = False
+            while not done:
+                obs, reward, done, _, _ = env.step(0)
+                trace.append((tuple(obs), reward))
+            return trace
+
+        assert episode(PokemonEnv(opponent_model=None), 5, 1) == episode(PokemonEnv(opponent_model=None), 5, 2)
+
+    def test_fixed_ivs(self):
+        env = PokemonEnv(opponent_model=None, random_ivs=False)
+        stats = env.player.active_pokemon().stats
+
+        env.reset()
+
+        assert env.player.active_pokemon().stats == stats
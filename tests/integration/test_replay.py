@@ -0,0 +1,140 @@
+"""Integration tests for compact battle replays"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.battle_manager import BattleManager
+from models.battle_state import snapshot
+from models.player_action import PlayerAction
+from models.replay import Replay, ReplayRecorder, Replayer, read_archive, write_archive
+from models.rng import SimRNG
+from models.sim_battle import SimBattle, play_out
+from tests.integration.test_sim_battle import build_battle
+
+
+def recorded_battle(seed, battle_cls=SimBattle, **kwargs):
+    battle = build_battle(battle_cls, seed)
+    recorder = ReplayRecorder(battle, seed=seed, **kwargs)
+    return battle, recorder
+
+
+def factory_for(battle):
+    """Rebuilds the fixture Pokemon a battle started with, by name"""
+    templates = {p.name: p for p in battle.player.team + battle.opponent.team}
+
+    def make(name, level):
+        pokemon = templates[name].copy()
+        pokemon.reset_battle_state()
+        return pokemon
+    return make
+
+
+class TestReplayFormat:
+
+    def test_round_trip(self):
+        """A replay comes back from bytes unchanged; each turn costs 3 bytes plus its replacements"""
+        battle, recorder = recorded_battle(1)
+        battle.run()
+        replay = recorder.replay()
+
+        data = replay.to_bytes()
+
+        assert Replay.from_bytes(data)[:5] == replay[:5]
+        turn_bytes = len(data) - len(replay._replace(turns=()).to_bytes())
+        assert turn_bytes == sum(3 + len(turn.replacements) for turn in replay.turns)
+
+    def test_rejects_other_data(self):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(b"NOPE" + bytes(20))
+
+    def test_archive(self, tmp_path):
+        """Many replays go into one compressed file and come back in order"""
+        replays = []
+        for seed in range(20):
+            battle, recorder = recorded_battle(seed)
+            battle.run()
+            replays.append(recorder.replay())
+        path = tmp_path / "tournament.pkrp"
+
+        assert write_archive(path, replays) == 20
+
+        assert [r.turns for r in read_archive(path)] == [r.turns for r in replays]
+        assert path.stat().st_size < sum(len(r.to_bytes()) for r in replays)
+
+
+class TestReplayer:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_reproduces_final_state(self, seed):
+        """Re-running the replay ends in exactly the recorded battle's state"""
+        battle, recorder = recorded_battle(seed)
+        result = battle.run()
+        replay = Replay.from_bytes(recorder.replay().to_bytes())
+
+        replayed = Replayer(replay, factory_for(battle)).battle_at()
+
+        assert snapshot(replayed, rng=False)[:3] == snapshot(battle, rng=False)[:3]
+        assert replayed.battle_over and replay.winner == result.winner
+
+    def test_any_turn_on_demand(self):
+        """battle_at(n) matches the live battle after n turns"""
+        battle, recorder = recorded_battle(7)
+        states = []
+        while not battle.battle_over:
+            battle.take_turn(battle.make_ai_action(battle.player, battle.opponent),
+                             battle.make_ai_action(battle.opponent, battle.player))
+            states.append(snapshot(battle, rng=False))
+        replayer = Replayer(recorder.replay(), factory_for(battle))
+
+        assert snapshot(replayer.battle_at(3), rng=False) == states[2]
+        assert [snapshot(b, rng=False) for b in replayer.turns()] == states
+
+    def test_records_battle_manager_and_sim_rng(self, capsys):
+        """BattleManager games with a SimRNG stream replay through the headless engine"""
+        battle = build_battle(BattleManager, 2, rng=SimRNG())
+        recorder = ReplayRecorder(battle, seed=11)
+        play_out(battle)
+
+        replayed = Replayer(recorder.replay(), factory_for(battle)).battle_at()
+
+        assert snapshot(replayed, rng=False)[:3] == snapshot(battle, rng=False)[:3]
+
+    def test_chosen_switches_and_replacements(self, monkeypatch, capsys):
+        """Voluntary switches and a human's faint replacements are replayed as recorded"""
+        battle, recorder = recorded_battle(3, battle_cls=BattleManager)
+        # The human always sends out their last Pokemon standing, whatever the AI would pick
+        monkeypatch.setattr("builtins.input", lambda prompt: str(
+            max(i for i, p in enumerate(battle.player.team) if not p.is_fainted()) + 1))
+        battle.take_turn(PlayerAction("switch", switch_to=1), battle.make_ai_action(battle.opponent, battle.player))
+        play_out(battle)
+        replay = recorder.replay()
+
+        replayed = Replayer(replay, factory_for(battle))
+
+        assert snapshot(replayed.battle_at(1), rng=False).player.active_index == 1
+        assert any(byte < 0x80 for turn in replay.turns for byte in turn.replacements)
+        assert snapshot(replayed.battle_at(), rng=False)[:3] == snapshot(battle, rng=False)[:3]
+
+    def test_factory_must_know_the_moves(self):
+        battle, recorder = recorded_battle(0)
+        battle.run()
+        make = factory_for(battle)
+
+        def forgetful(name, level):
+            pokemon = make(name, level)
+            pokemon.moves = pokemon.moves[1:]
+            return pokemon
+
+        with pytest.raises(ValueError):
+            Replayer(recorder.replay(), forgetful).battle_at()
+
+    def test_seed_is_the_battles_stream(self):
+        """Recording reseeds the battle, so two recordings with one seed play identically"""
+        first, _ = recorded_battle(4)
+        random.seed(100)
+        second = build_battle(SimBattle, 4)
+        ReplayRecorder(second, seed=4)
+
+        assert first.run() == second.run()
@@ -0,0 +1,113 @@
+"""Integration tests for the expectimax search AI"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from ai.search_ai import SearchAI, ScriptedBattle, turn_outcomes, legal_actions
+from models.battle_state import snapshot
+from models.player import Player
+from models.player_action import PlayerAction
+from models.sim_battle import SimBattle, play_out
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+from tests.integration.test_sim_battle import build_battle
+
+
+def move_action(player, index=0):
+    return PlayerAction(type="move", move=player.active_pokemon().moves[index])
+
+
+def outcomes_from(player, opponent, min_probability=0.0):
+    scratch = ScriptedBattle(player.copy(), opponent.copy())
+    return turn_outcomes(scratch, snapshot(scratch, rng=False), move_action(player), move_action(opponent), min_probability)
+
+
+class TestTurnOutcomes:
+
+    def test_crit_branches(self):
+        """Two sure-hit moves without side effects branch only on the two crit rolls"""
+        a = Player("A", True, [create_test_pokemon("A", hp=200, moves=[create_test_move("Tackle", 40, damage_class="physical")])])
+        b = Player("B", True, [create_test_pokemon("B", hp=200, moves=[create_test_move("Tackle", 40, damage_class="physical")])])
+
+        outcomes = outcomes_from(a, b)
+
+        assert sorted(p for p, _ in outcomes) == pytest.approx(sorted([(15 / 16) ** 2, 15 / 256, 15 / 256, 1 / 256]))
+        hp = {(state.player.team[0].current_hp, state.opponent.team[0].current_hp) for _, state in outcomes}
+        assert len(hp) == 4
+
+    def test_probabilities_sum_to_one_and_prune(self):
+        """Pruning drops unlikely branches but the rest is renormalised"""
+        battle = build_battle(SimBattle, seed=3)
+
+        full = outcomes_from(battle.player, battle.opponent)
+        pruned = outcomes_from(battle.player, battle.opponent, min_probability=0.05)
+
+        assert sum(p for p, _ in full) == pytest.approx(1.0)
+        assert sum(p for p, _ in pruned) == pytest.approx(1.0)
+        assert len(pruned) < len(full)
+
+    def test_originals_untouched(self):
+        """The search plays on copies of the teams"""
+        battle = build_battle(SimBattle, seed=3)
+        before = [p.battle_stats.current_hp for p in battle.player.team + battle.opponent.team]
+
+        SearchAI(depth=2, time_budget=None)(battle, battle.opponent, battle.player)
+
+        assert [p.battle_stats.current_hp for p in battle.player.team + battle.opponent.team] == before
+        assert battle.player.active_pokemon().battle_stats.pp == {"Ember": 35, "Wing Attack": 35}
+
+
+class TestSearchAI:
+
+    def test_prefers_damaging_move(self):
+        """With a useless move and a KO available, search takes the KO"""
+        attacker = create_test_pokemon("Pikachu", moves=[
+            create_test_move("Growl", None, damage_class="status"),
+            create_test_move("Thunderbolt", 95, Type.ELECTRIC, damage_class="special"),
+        ])
+        defender = create_test_pokemon("Gyarados", hp=30, types=[Type.WATER, Type.FLYING])
+        us, them = Player("A", True, [attacker]), Player("B", True, [defender])
+
+        action = SearchAI(depth=2, time_budget=None).choose_action(us, them, we_are_player=True)
+
+        assert action.move.name == "Thunderbolt"
+
+    def test_time_budget(self):
+        """A tiny budget still finishes depth 1 and returns a legal move"""
+        battle = build_battle(SimBattle, seed=1)
+        ai = SearchAI(depth=6, time_budget=0.001)
+
+        action = ai(battle, battle.opponent, battle.player)
+
+        assert ai.completed_depth >= 1 and ai.completed_depth < 6
+        assert action.move in battle.opponent.active_pokemon().moves or action.type == "switch"
+        assert ai.nodes > 0
+
+    def test_legal_actions(self):
+        """Moves without PP are skipped; switches only to healthy teammates"""
+        battle = build_battle(SimBattle, seed=1)
+        player = battle.player
+        player.active_pokemon().battle_stats.pp["Ember"] = 0
+        player.team[1].battle_stats.current_hp = 0
+
+        actions = legal_actions(player, switches=True)
+
+        assert [(a.type, a.move.name if a.move else a.switch_to) for a in actions] == [
+            ("move", "Wing Attack"), ("switch", 2)]
+
+    def test_plays_as_battle_opponent(self):
+        """Setting opponent_ai routes the opponent's choices through the search"""
+        battle = build_battle(SimBattle, seed=2)
+        calls = []
+        search = SearchAI(depth=1, time_budget=None)
+
+        def opponent_ai(b, player, opponent):
+            calls.append(player)
+            return search(b, player, opponent)
+
+        battle.opponent_ai = opponent_ai
+        result = play_out(battle, max_turns=50)
+
+        assert calls and all(p is battle.opponent for p in calls)
+        assert result.turns > 0
@@ -0,0 +1,93 @@
+"""Integration tests for the headless simulation engine"""
+import logging
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.player import Player
+from models.battle_manager import BattleManager
+from models.sim_battle import SimBattle, play_out
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+def build_battle(battle_cls, seed, **kwargs):
+    """Build two 3-Pokemon teams from a seed so both engines get identical IVs"""
+    random.seed(seed)
+    team_a = [
+        create_test_pokemon("Charizard", hp=78, attack=84, defense=78, sp_attack=109, sp_defense=85, speed=100,
+                            types=[Type.FIRE, Type.FLYING],
+                            moves=[create_test_move("Ember", 40, Type.FIRE, damage_class="special", ailment="burn", ailment_chance=10),
+                                   create_test_move("Wing Attack", 60, Type.FLYING, damage_class="physical", accuracy=90)]),
+        create_test_pokemon("Pikachu", hp=35, attack=55, defense=40, sp_attack=50, sp_defense=50, speed=90,
+                            types=[Type.ELECTRIC],
+                            moves=[create_test_move("Thunder Shock", 40, Type.ELECTRIC, damage_class="special", ailment="paralysis", ailment_chance=30)]),
+        create_test_pokemon("Snorlax", hp=160, attack=110, defense=65, sp_attack=65, sp_defense=110, speed=30,
+                            moves=[create_test_move("Body Slam", 85, Type.NORMAL, damage_class="physical", accuracy=85)]),
+    ]
+    team_b = [
+        create_test_pokemon("Blastoise", hp=79, attack=83, defense=100, sp_attack=85, sp_defense=105, speed=78,
+                            types=[Type.WATER],
+                            moves=[create_test_move("Water Gun", 40, Type.WATER, damage_class="special"),
+                                   create_test_move("Bite", 60, Type.DARK, damage_class="physical")]),
+        create_test_pokemon("Venusaur", hp=80, attack=82, defense=83, sp_attack=100, sp_defense=100, speed=80,
+                            types=[Type.GRASS, Type.POISON],
+                            moves=[create_test_move("Sludge Bomb", 90, Type.POISON, damage_class="special", ailment="poison", ailment_chance=30),
+                                   create_test_move("Sleep Powder", None, Type.GRASS, damage_class="status", accuracy=75, ailment="sleep", ailment_chance=100)]),
+        create_test_pokemon("Lapras", hp=130, attack=85, defense=80, sp_attack=85, sp_defense=95, speed=60,
+                            types=[Type.WATER, Type.ICE],
+                            moves=[create_test_move("Ice Beam", 90, Type.ICE, damage_class="special")]),
+    ]
+    return battle_cls(Player("Ash", False, team_a), Player("Red", True, team_b), **kwargs)
+
+
+class TestSimBattle:
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_same_outcome_as_battle_manager(self, seed, capsys):
+        """SimBattle and BattleManager agree turn for turn for the same seed"""
+        expected = play_out(build_battle(BattleManager, seed))
+        actual = build_battle(SimBattle, seed).run()
+
+        assert actual == expected
+        assert actual.winner is not None
+
+    def test_emits_no_text(self, capsys):
+        """Headless battles print nothing and keep no battle log"""
+        battle = build_battle(SimBattle, 1)
+        battle.run()
+
+        assert capsys.readouterr().out == ""
+        assert battle.battle_log == []
+
+    def test_verbose_logs_like_battle_manager(self, capsys):
+        """verbose=True restores the battle log"""
+        reference = build_battle(BattleManager, 2)
+        play_out(reference)
+        capsys.readouterr()
+
+        messages = []
+        battle = build_battle(SimBattle, 2, verbose=True, ui_logger=messages.append)
+        battle.run()
+
+        assert battle.battle_log == reference.battle_log
+        assert messages == battle.battle_log
+
+    def test_debug_trace_goes_to_logging(self, capsys, caplog):
+        """BattleManager's developer trace is logged at DEBUG, never printed"""
+        battle = build_battle(BattleManager, 2)
+
+        with caplog.at_level(logging.DEBUG):
+            play_out(battle)
+
+        assert capsys.readouterr().out == ""
+        assert any(record.getMessage().startswith("Executing move:") for record in caplog.records)
+
+    def test_turn_cap(self):
+        """run() stops at max_turns and reports no winner"""
+        result = build_battle(SimBattle, 3).run(max_turns=1)
+
+        assert result.turns == 1
+        assert result.winner is None
@@ -0,0 +1,86 @@
+"""Integration tests for multiprocess self-play training"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import numpy as np
+from stable_baselines3 import PPO
+
+from ai.pokemon_env import PokemonEnv
+from ai.train_selfplay import PolicySnapshot, make_vec_env, train_selfplay
+from models.battle_manager import BattleManager
+from models.player import Player
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+class FixtureEnv(PokemonEnv):
+    """PokemonEnv on fixture Pokemon, so it runs without pokemon.json"""
+
+    def __init__(self):
+        super().__init__(opponent_model=None)
+
+    def _setup_battle(self):
+        self.player = Player("AI", True, [create_test_pokemon("Pikachu", types=[Type.ELECTRIC], moves=[
+            create_test_move("Thunder Shock", 40, Type.ELECTRIC, damage_class="special"),
+            create_test_move("Tackle", 40, Type.NORMAL),
+        ])])
+        self.opponent = Player("Opponent AI", True, [create_test_pokemon("Charmander", types=[Type.FIRE], moves=[
+            create_test_move("Ember", 40, Type.FIRE, damage_class="special"),
+        ])])
+        self.battle = BattleManager(self.player, self.opponent)
+
+
+class TestPolicySnapshot:
+
+    def test_matches_model_predictions(self):
+        """The NumPy copy picks the same deterministic actions as the PPO model"""
+        model = PPO("MlpPolicy", FixtureEnv(), n_steps=16, batch_size=16, seed=0)
+        snapshot = PolicySnapshot.from_model(model)
+        obs = np.random.default_rng(0).random((64, 12), dtype=np.float32)
+
+        expected, _ = model.predict(obs, deterministic=True)
+        actions, _ = snapshot.predict(obs)
+        single, _ = snapshot.predict(obs[0])
+
+        np.testing.assert_array_equal(actions, expected)
+        assert single == expected[0]
+
+    def test_sampling_stays_in_action_space(self):
+        model = PPO("MlpPolicy", FixtureEnv(), n_steps=16, batch_size=16, seed=0)
+        snapshot = PolicySnapshot.from_model(model)
+
+        actions, _ = snapshot.predict(np.zeros((100, 12), dtype=np.float32), deterministic=False)
+
+        assert set(actions.tolist()) <= {0, 1, 2, 3}
+
+
+class TestTrainSelfPlay:
+
+    def test_workers_get_opponent_snapshots(self):
+        """Training on two worker processes refreshes their opponent and reports throughput"""
+        model, callback = train_selfplay(64, workers=2, env_factory=FixtureEnv, sync_every=1, n_steps=8,
+                                         batch_size=16, n_epochs=1, verbose=0)
+
+        assert model.num_timesteps >= 64
+        assert callback.rollouts == 4
+        assert callback.opponent_version == 5  # one at the start, one after every rollout
+        assert all(h["steps_per_sec"] > 0 for h in callback.history)
+        assert all(0 < h["cpu_utilization"] for h in callback.history)
+
+    def test_snapshot_reaches_worker_envs(self):
+        """The opponent the workers' PokemonEnvs play with is the shipped snapshot"""
+        model = PPO("MlpPolicy", FixtureEnv(), n_steps=16, batch_size=16, seed=0)
+        env = make_vec_env(FixtureEnv, 2)
+        try:
+            assert env.env_method("set_opponent", PolicySnapshot.from_model(model, version=7)) == [7, 7]
+            assert [o.version for o in env.get_attr("opponent_model")] == [7, 7]
+        finally:
+            env.close()
+
+    def test_single_worker_runs_in_process(self):
+        model, callback = train_selfplay(32, workers=1, env_factory=FixtureEnv, n_steps=16,
+                                         batch_size=16, n_epochs=1, verbose=0)
+
+        assert callback.rollouts == 2
+        assert callback.opponent_version == 1
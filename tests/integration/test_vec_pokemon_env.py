@@ -0,0 +1,135 @@
+"""Integration tests for the vectorized PokemonEnv"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import numpy as np
+
+from ai.pokemon_env import observation
+from ai.vec_pokemon_env import VecPokemonEnv, PLAYER, OPPONENT
+from models.battle_manager import BattleManager
+from models.player import Player
+from models.player_action import PlayerAction
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+def build_templates():
+    random.seed(0)
+    player = create_test_pokemon("Pikachu", hp=35, attack=55, defense=40, sp_attack=50, sp_defense=50, speed=90,
+                                 types=[Type.ELECTRIC], moves=[
+                                     create_test_move("Thunder Shock", 40, Type.ELECTRIC, damage_class="special",
+                                                      ailment="paralysis", ailment_chance=30),
+                                     create_test_move("Quick Attack", 40, Type.NORMAL, damage_class="physical", priority=1),
+                                     create_test_move("Slam", 80, Type.NORMAL, damage_class="physical", accuracy=75),
+                                 ])
+    opponent = create_test_pokemon("Charmander", hp=39, attack=52, defense=43, sp_attack=60, sp_defense=50, speed=65,
+                                   types=[Type.FIRE], moves=[
+                                       create_test_move("Ember", 40, Type.FIRE, damage_class="special",
+                                                        ailment="burn", ailment_chance=10),
+                                       create_test_move("Scratch", 40, Type.NORMAL, damage_class="physical"),
+                                   ])
+    return player, opponent
+
+
+def make_env(num_envs=8, **kwargs):
+    player, opponent = build_templates()
+    return VecPokemonEnv(num_envs, player=player, opponent=opponent, random_ivs=False, seed=0, **kwargs)
+
+
+class TestVecPokemonEnv:
+
+    def test_observation_matches_pokemon_env(self):
+        """At reset every row is PokemonEnv's observation of the templates, from either side"""
+        env = make_env()
+        player, opponent = env.templates
+
+        obs = env.reset()
+
+        np.testing.assert_allclose(obs, np.tile(observation(player, opponent), (8, 1)), rtol=1e-6)
+        np.testing.assert_allclose(env.observations(OPPONENT)[0], observation(opponent, player), rtol=1e-6)
+
+    def test_damage_matches_move_formula(self):
+        """The player's sure hit deals Move.compute_damage, normal or critical"""
+        env = make_env(num_envs=64)
+        player, opponent = env.templates
+        env.reset()
+        move = player.moves[0]
+        expected = {move.compute_damage(player, opponent, False), move.compute_damage(player, opponent, True)}
+
+        env.step(np.zeros(64, dtype=np.int64))
+
+        dealt = set((env.stats[:, OPPONENT, 0] - env.hp[:, OPPONENT]).tolist())
+        assert dealt <= expected
+        assert env.pp[0, PLAYER, 0] == move.pp - 1
+
+    def test_first_turn_matches_battle_manager(self):
+        """The opponent's HP after one turn of Slam (75% accuracy) is distributed as in BattleManager"""
+        n = 4000
+        env = make_env(num_envs=n)
+        env.reset()
+        env.step(np.full(n, 2))
+        vec_hp = env.hp[:, OPPONENT]
+
+        player, opponent = env.templates
+        random.seed(1)
+        scalar_hp = []
+        for _ in range(n):
+            battle = BattleManager(Player("A", True, [player.copy()]), Player("B", True, [opponent.copy()]))
+            battle.take_turn(PlayerAction("move", move=player.moves[2]), PlayerAction("move", move=opponent.moves[0]))
+            scalar_hp.append(battle.opponent.active_pokemon().battle_stats.current_hp)
+
+        assert set(vec_hp.tolist()) == set(scalar_hp)
+        assert vec_hp.mean() == pytest.approx(np.mean(scalar_hp), rel=0.05)
+
+    def test_priority_and_sleep(self):
+        """Quick Attack goes first, and a sleeping Pokemon doesn't act"""
+        env = make_env(num_envs=2)
+        env.reset()
+        env.status[:, OPPONENT] = env.statuses.index("sleep")
+        env.sleep_turns[:, OPPONENT] = 3
+
+        env.step(np.array([1, 1]))
+
+        assert (env.hp[:, PLAYER] == env.stats[:, PLAYER, 0]).all()
+        assert (env.sleep_turns[:, OPPONENT] == 2).all()
+
+    def test_finished_battles_reset(self):
+        """A KO ends that battle only: it reports the terminal observation and starts over"""
+        env = make_env(num_envs=2)
+        env.reset()
+        env.hp[0, OPPONENT] = 1
+
+        obs, rewards, dones, infos = env.step(np.array([0, 0]))
+
+        assert dones.tolist() == [True, False]
+        assert rewards[0] > 1.0
+        assert infos[0]["terminal_observation"][1] == 0.0
+        assert obs[0][1] == 1.0 and env.hp[0, OPPONENT] == env.stats[0, OPPONENT, 0]
+        assert "terminal_observation" not in infos[1]
+
+    def test_invalid_actions_pick_a_move(self):
+        """Actions past the moveset are replaced by a random legal move"""
+        env = make_env(num_envs=32)
+        env.reset()
+
+        env.step(np.full(32, 3))
+
+        used = env.moves.max_pp[PLAYER] - env.pp[:, PLAYER]
+        assert used[:, 3].sum() == 0
+        assert used[:, :3].sum() > 0
+
+    def test_trains_with_ppo(self):
+        """PPO learns on it directly and can then play the opponent side for the whole batch"""
+        from stable_baselines3 import PPO
+
+        env = make_env(num_envs=4)
+        model = PPO("MlpPolicy", env, n_steps=16, batch_size=32, n_epochs=1, seed=0)
+        model.learn(total_timesteps=64)
+
+        self_play = make_env(num_envs=4, opponent_model=model)
+        self_play.reset()
+        obs, rewards, dones, infos = self_play.step(np.zeros(4, dtype=np.int64))
+        assert obs.shape == (4, 12) and rewards.shape == (4,)
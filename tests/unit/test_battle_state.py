@@ -0,0 +1,69 @@
+"""Unit tests for battle state snapshots"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.battle_state import snapshot, restore, BattleState
+from models.sim_battle import SimBattle, play_out
+from tests.integration.test_sim_battle import build_battle
+
+
+def team_state(player):
+    return [(p.battle_stats.current_hp, p.battle_stats.status, dict(p.battle_stats.stat_modifiers),
+             dict(p.battle_stats.pp), p.battle_stats.sleep_turns) for p in player.team]
+
+
+class TestBattleState:
+
+    def test_restore_rewinds_a_battle(self):
+        """Restoring a snapshot undoes everything a played-out battle changed"""
+        battle = build_battle(SimBattle, seed=4)
+        before = (team_state(battle.player), team_state(battle.opponent))
+        state = snapshot(battle)
+
+        play_out(battle)
+        assert battle.battle_over
+        restore(battle, state)
+
+        assert (team_state(battle.player), team_state(battle.opponent)) == before
+        assert battle.player.active_index == 0 and not battle.battle_over
+
+    def test_restore_replays_identically(self):
+        """With the RNG state restored, the same battle plays out the same way"""
+        battle = build_battle(SimBattle, seed=5)
+        state = snapshot(battle)
+
+        first = play_out(battle)
+        random.random()
+        restore(battle, state)
+        second = play_out(battle)
+
+        assert first == second
+
+    def test_snapshot_is_immutable_and_hashable(self):
+        """Snapshots are plain tuples: unaffected by later turns, usable as dict keys"""
+        battle = build_battle(SimBattle, seed=6)
+        state = snapshot(battle, rng=False)
+        hp = state.player.team[0].current_hp
+
+        battle.player.active_pokemon().take_damage(10)
+
+        assert state.player.team[0].current_hp == hp
+        assert snapshot(battle, rng=False) != state
+        assert {state: 1}[state] == 1
+        with pytest.raises(AttributeError):
+            state.battle_over = True
+
+    def test_what_if(self):
+        """A modified snapshot can be restored to explore hypotheticals"""
+        battle = build_battle(SimBattle, seed=7)
+        state = snapshot(battle, rng=False)
+        lead = state.player.team[0]._replace(current_hp=1, status="paralysis")
+
+        restore(battle, state._replace(player=state.player._replace(team=(lead,) + state.player.team[1:])))
+
+        assert battle.player.active_pokemon().battle_stats.current_hp == 1
+        assert battle.player.active_pokemon().battle_stats.status == "paralysis"
+        assert isinstance(state, BattleState)
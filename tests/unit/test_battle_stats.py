@@ -4,7 +4,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from models.battle_stats import BattleStats
+from models.battle_stats import SPEED, BattleStats
 from tests.fixtures.pokemon_data import create_test_pokemon, charizard
 
 
@@ -173,4 +173,67 @@ class TestBattleStats:
         # When sleep_turns reaches 0, Pokemon should wake up
         stats.sleep_turns = 0
         stats.status = None  # Simulate waking up
-        assert stats.status is None
\ No newline at end of file
+        assert stats.status is None
+
+    def test_views_write_through(self, charizard):
+        """The dict-style views read and write the underlying arrays"""
+        stats = charizard.battle_stats
+
+        stats.stat_modifiers["speed"] = 2
+        stats.pp[charizard.moves[0].name] = 3
+
+        assert stats.stages[SPEED] == 2
+        assert stats.get_effective_stat("speed") == int(stats.stat_values[SPEED] * 2)
+        assert stats.pp_left[0] == 3
+        assert set(stats.battle_stats) == set(stats.stat_modifiers) == {
+            "attack", "defense", "sp_attack", "sp_defense", "speed", "accuracy", "evasion"}
+
+    def test_set_pp_for_new_move(self, charizard):
+        """A move outside the moveset gets its own slot without touching the shared layout"""
+        stats = charizard.battle_stats
+        shared = stats.move_slots
+        other = charizard.copy()
+        other.reset_battle_state()
+
+        stats.set_pp("Struggle", 1)
+
+        assert stats.pp["Struggle"] == 1 and stats.has_pp("Struggle")
+        assert "Struggle" not in shared and not other.battle_stats.has_pp("Struggle")
+
+    def test_copy_is_independent(self, charizard):
+        stats = charizard.battle_stats
+        clone = stats.copy()
+
+        clone.modify_stat("attack", 1)
+        clone.use_pp(charizard.moves[0].name)
+
+        assert stats.stat_modifiers["attack"] == 0
+        assert stats.pp[charizard.moves[0].name] == clone.pp[charizard.moves[0].name] + 1
+
+    def test_slotted(self, charizard):
+        """No per-instance __dict__ on the objects a battle holds thousands of"""
+        assert not hasattr(charizard, "__dict__")
+        assert not hasattr(charizard.battle_stats, "__dict__")
+
+    def test_assigning_mappings(self, charizard):
+        """battle_stats, stat_modifiers and pp can still be assigned whole, as when they were dicts"""
+        stats = charizard.battle_stats
+
+        stats.battle_stats = {"attack": 1}
+        stats.stat_modifiers = {"speed": -1}
+        stats.pp = {"Tackle": 5}
+
+        assert stats.battle_stats["attack"] == 1
+        assert stats.stat_modifiers.copy() == {**dict.fromkeys(stats.stat_modifiers, 0), "speed": -1}
+        assert stats.pp.copy() == {"Tackle": 5} and not stats.has_pp(charizard.moves[0].name)
+
+    def test_out_of_range_values(self, charizard):
+        """The unsigned arrays reject negative stats and PP with ValueError"""
+        stats = charizard.battle_stats
+
+        with pytest.raises(ValueError):
+            stats.battle_stats["attack"] = -1
+        with pytest.raises(ValueError):
+            stats.pp[charizard.moves[0].name] = -1
+        with pytest.raises(ValueError):
+            charizard.iv = {**charizard.iv, "hp": -1}
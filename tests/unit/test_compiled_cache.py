@@ -0,0 +1,121 @@
+"""Unit tests for the compiled JSON data cache"""
+import pytest
+import json
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from data import compiled_cache, loaders
+from data.compiled_cache import load_compiled
+from data.loaders import compile_species, extract_level_up_moves, get_move_lookup
+
+calls = []
+
+
+def compile_names(data):
+    calls.append(data)
+    return tuple(d["name"] for d in data)
+
+
+@pytest.fixture
+def source(tmp_path):
+    calls.clear()
+    path = tmp_path / "things.json"
+    path.write_text(json.dumps([{"name": "a"}, {"name": "b"}]))
+    return path
+
+
+class TestCompiledCache:
+
+    def test_builds_then_reuses_cache(self, source, tmp_path):
+        cache_dir = tmp_path / "cache"
+
+        assert load_compiled(str(source), compile_names, cache_dir=str(cache_dir)) == ("a", "b")
+        assert load_compiled(str(source), compile_names, cache_dir=str(cache_dir)) == ("a", "b")
+        assert len(calls) == 1
+        assert (cache_dir / "things.json.pickle").exists()
+
+    def test_rebuilds_when_source_changes(self, source, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        load_compiled(str(source), compile_names, cache_dir=cache_dir)
+
+        source.write_text(json.dumps([{"name": "c"}]))
+        os.utime(source, ns=(1, 1))
+
+        assert load_compiled(str(source), compile_names, cache_dir=cache_dir) == ("c",)
+        assert len(calls) == 2
+
+    def test_touched_but_unchanged_source_is_not_recompiled(self, source, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        load_compiled(str(source), compile_names, cache_dir=cache_dir)
+        os.utime(source, ns=(1, 1))
+
+        assert load_compiled(str(source), compile_names, cache_dir=cache_dir) == ("a", "b")
+        assert len(calls) == 1
+
+    def test_version_bump_invalidates(self, source, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        load_compiled(str(source), compile_names, cache_dir=cache_dir)
+        monkeypatch.setattr(compiled_cache, "CACHE_VERSION", compiled_cache.CACHE_VERSION + 1)
+
+        load_compiled(str(source), compile_names, cache_dir=cache_dir)
+        assert len(calls) == 2
+
+    def test_corrupt_cache_is_rebuilt(self, source, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "things.json.pickle").write_bytes(b"not a pickle")
+
+        assert load_compiled(str(source), compile_names, cache_dir=str(cache_dir)) == ("a", "b")
+
+
+def raw_species(moves):
+    return {
+        "id": 25,
+        "name": "pikachu",
+        "types": ["electric"],
+        "stats": {"hp": 35, "attack": 55, "defense": 40, "special-attack": 50, "special-defense": 50, "speed": 90},
+        "sprites": {"front_default": "front.png", "back_default": "back.png", "front_shiny": "shiny.png"},
+        "abilities": [{"ability": {"name": "static", "url": ""}, "is_hidden": False, "slot": 1}],
+        "moves": [
+            {"move": {"name": name, "url": ""}, "version_group_details": [
+                {"level_learned_at": level, "move_learn_method": {"name": method, "url": ""},
+                 "version_group": {"name": version, "url": ""}}
+                for method, version, level in details
+            ]}
+            for name, details in moves
+        ],
+    }
+
+
+class TestCompileSpecies:
+
+    def test_compact_record(self):
+        species = compile_species(raw_species([("thunder-shock", [("level-up", "heartgold-soulsilver", 1)])]))
+
+        assert species["sprites"] == {"front_default": "front.png", "back_default": "back.png"}
+        assert species["abilities"] == ["static"]
+        assert species["learnset"] == [("thunder-shock", "level-up", "heartgold-soulsilver", 1)]
+
+    def test_level_up_moves_from_learnset(self):
+        species = compile_species(raw_species([
+            ("thunder-shock", [("level-up", "diamond-pearl", 1), ("level-up", "heartgold-soulsilver", 1)]),
+            ("thunderbolt", [("machine", "heartgold-soulsilver", 0)]),
+            ("quick-attack", [("level-up", "heartgold-soulsilver", 13)]),
+            ("thunder", [("level-up", "heartgold-soulsilver", 60)]),
+        ]))
+
+        moves = extract_level_up_moves(species, get_move_lookup(), level=50)
+        assert [m.name for m in moves] == ["thunder-shock", "quick-attack"]
+
+
+class TestMovesData:
+
+    def test_moves_json_is_parsed_once(self, monkeypatch):
+        monkeypatch.delitem(loaders._loaded, "moves_data", raising=False)
+        reads = []
+        real_load = json.load
+        monkeypatch.setattr(loaders.json, "load", lambda f: reads.append(f.name) or real_load(f))
+
+        assert loaders.MOVES_DATA is loaders.MOVES_DATA
+        assert reads == [loaders.MOVES_PATH]
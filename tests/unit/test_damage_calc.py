@@ -0,0 +1,113 @@
+"""Unit tests for the vectorized damage calculator"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import numpy as np
+
+from models.damage_calc import (
+    team_damage, damage_rolls, damage_range, StatArrays, MoveTable, GEN4_DAMAGE_ROLLS,
+)
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+def random_team(rng, size):
+    team = []
+    for i in range(size):
+        moves = [
+            create_test_move(
+                f"move-{i}-{j}",
+                power=rng.choice([None, 20, 40, 65, 90, 120, 150]),
+                move_type=rng.choice(list(Type)),
+                damage_class=rng.choice(["physical", "Physical", "special", "status"]),
+            )
+            for j in range(rng.randint(1, 4))
+        ]
+        pokemon = create_test_pokemon(
+            f"mon-{i}", level=rng.randint(5, 100),
+            **{stat: rng.randint(20, 150) for stat in ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")},
+            types=rng.sample(list(Type), rng.choice([1, 2])), moves=moves,
+        )
+        for stat in ("attack", "defense", "sp_attack", "sp_defense"):
+            pokemon.battle_stats.stat_modifiers[stat] = rng.randint(-6, 6)
+        if rng.random() < 0.3:
+            pokemon.battle_stats.status = "burn"
+        team.append(pokemon)
+    return team
+
+
+class TestDamageCalc:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_scalar_formula(self, seed):
+        """Every cell of the cross product equals Move.compute_damage"""
+        rng = random.Random(seed)
+        attackers, defenders = random_team(rng, 6), random_team(rng, 6)
+
+        table = team_damage(attackers, defenders)
+
+        for i, attacker in enumerate(attackers):
+            for j, move in enumerate(attacker.moves):
+                for k, defender in enumerate(defenders):
+                    if move.power is None or move.damage_class == "status":
+                        expected, expected_crit = 0, 0
+                    else:
+                        expected = move.compute_damage(attacker, defender, False)
+                        expected_crit = move.compute_damage(attacker, defender, True)
+                    assert table.min[i, j, k] == table.max[i, j, k] == expected
+                    assert table.crit_min[i, j, k] == expected_crit
+
+    def test_padding_slots_deal_nothing(self):
+        """Movesets shorter than the longest one are padded with zero-damage slots"""
+        rng = random.Random(0)
+        attackers = random_team(rng, 4)
+        attackers[0].moves = attackers[0].moves[:1]
+        attackers[1].moves = [create_test_move(f"m{j}") for j in range(4)]
+
+        table = team_damage(attackers, random_team(rng, 2))
+
+        assert table.max.shape == (4, 4, 2)
+        assert (table.max[0, 1:] == 0).all()
+
+    def test_expected_includes_crit_chance(self):
+        """Expected damage weighs the crit branch by the move's crit chance"""
+        attacker = create_test_pokemon(moves=[create_test_move("Tackle", 40, Type.NORMAL, damage_class="physical")])
+        defender = create_test_pokemon()
+
+        table = team_damage([attacker], [defender])
+
+        normal, crit = table.mean[0, 0, 0], table.crit_mean[0, 0, 0]
+        assert table.expected[0, 0, 0] == pytest.approx(normal * 15 / 16 + crit / 16)
+
+    def test_damage_rolls(self):
+        """The random factor spreads damage between 85% and 100% of the top roll"""
+        rng = random.Random(1)
+        attackers, defenders = random_team(rng, 3), random_team(rng, 3)
+        stats_a, moves, stats_d = StatArrays(attackers), MoveTable(attackers), StatArrays(defenders)
+
+        rolls = damage_rolls(stats_a, moves, stats_d, rolls=GEN4_DAMAGE_ROLLS)
+        table = damage_range(stats_a, moves, stats_d, rolls=GEN4_DAMAGE_ROLLS)
+
+        assert rolls.shape[-1] == len(GEN4_DAMAGE_ROLLS)
+        assert (np.diff(rolls, axis=-1) >= 0).all()
+        assert (table.max == damage_rolls(stats_a, moves, stats_d)[..., 0]).all()
+        assert (table.min <= table.mean).all() and (table.mean <= table.max).all()
+
+    def test_rolls_match_scalar_formula(self):
+        """Each roll equals Move.compute_damage with that roll"""
+        rng = random.Random(2)
+        attackers, defenders = random_team(rng, 3), random_team(rng, 3)
+
+        rolls = damage_rolls(StatArrays(attackers), MoveTable(attackers), StatArrays(defenders),
+                             is_critical=True, rolls=GEN4_DAMAGE_ROLLS)
+
+        for i, attacker in enumerate(attackers):
+            for j, move in enumerate(attacker.moves):
+                if move.power is None or move.damage_class == "status":
+                    continue
+                for k, defender in enumerate(defenders):
+                    expected = [move.compute_damage(attacker, defender, True, roll) for roll in GEN4_DAMAGE_ROLLS]
+                    assert rolls[i, j, k].tolist() == expected
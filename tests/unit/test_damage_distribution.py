@@ -0,0 +1,123 @@
+"""Unit tests for exact damage distributions and KO probabilities"""
+import pytest
+import itertools
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+import numpy as np
+
+from models import damage_distribution
+from models.damage_distribution import (
+    DamageDistribution, compute_distribution, hit_chance, hit_count_distribution, ko_probabilities,
+)
+from models.abilities.levitate import Levitate
+from models.damage_calc import GEN4_DAMAGE_ROLLS
+from models.move import HitInfo
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    damage_distribution.clear_cache()
+    yield
+    damage_distribution.clear_cache()
+
+
+def tackle(accuracy=100, hits=(1, 1)):
+    move = create_test_move("Tackle", 40, Type.NORMAL, accuracy=accuracy, damage_class="physical")
+    move.hit_info = HitInfo(min_hits=hits[0], max_hits=hits[1], min_turns=0, max_turns=0)
+    return move
+
+
+class TestDamageDistribution:
+
+    def test_single_hit_has_crit_branch(self):
+        """A sure hit is the normal damage 15/16 of the time and the crit damage 1/16"""
+        attacker, defender, move = create_test_pokemon(), create_test_pokemon(), tackle()
+
+        dist = compute_distribution(attacker, defender, move)
+
+        normal = move.compute_damage(attacker, defender, False)
+        crit = move.compute_damage(attacker, defender, True)
+        assert dist.chance(normal) == pytest.approx(15 / 16)
+        assert dist.chance(crit) == pytest.approx(1 / 16)
+        assert dist.probs.sum() == pytest.approx(1.0)
+
+    def test_accuracy_and_evasion(self):
+        """Misses put weight on 0 damage, scaled by the accuracy/evasion stages"""
+        attacker, defender = create_test_pokemon(), create_test_pokemon()
+        defender.battle_stats.stat_modifiers["evasion"] = 1
+
+        assert hit_chance(attacker, defender, tackle(accuracy=80)) == pytest.approx(0.6)
+        assert compute_distribution(attacker, defender, tackle(accuracy=80)).chance(0) == pytest.approx(0.4)
+
+    def test_multi_hit_counts(self):
+        """2-5 hit moves use the Gen 4 odds; fixed counts always hit that many times"""
+        assert hit_count_distribution(tackle(hits=(2, 5))) == {2: 3 / 8, 3: 3 / 8, 4: 1 / 8, 5: 1 / 8}
+        assert hit_count_distribution(tackle(hits=(2, 2))) == {2: 1.0}
+        assert hit_count_distribution(tackle(hits=(None, None))) == {1: 1.0}
+
+    def test_multi_hit_mean(self):
+        """Expected damage of a 2-5 hit move is 3 hits' worth"""
+        attacker, defender = create_test_pokemon(), create_test_pokemon()
+
+        single = compute_distribution(attacker, defender, tackle())
+        multi = compute_distribution(attacker, defender, tackle(hits=(2, 5)))
+
+        assert multi.mean == pytest.approx(3 * single.mean)
+        assert multi.probs.sum() == pytest.approx(1.0)
+
+    def test_status_moves_deal_nothing(self):
+        """Status moves are a point mass at 0"""
+        move = create_test_move("Growl", None, Type.NORMAL, damage_class="status")
+
+        dist = compute_distribution(create_test_pokemon(), create_test_pokemon(), move)
+
+        assert dist == DamageDistribution([1.0])
+
+    def test_defender_ability_applies(self):
+        """The defender's ability adjusts the damage as it does in the battle engine"""
+        attacker, defender = create_test_pokemon(), create_test_pokemon()
+        defender.ability = Levitate()
+        earthquake = create_test_move("Earthquake", 100, Type.GROUND, damage_class="physical")
+
+        assert compute_distribution(attacker, defender, earthquake) == DamageDistribution([1.0])
+        assert compute_distribution(attacker, defender, tackle()).mean > 0
+
+    def test_ko_chances_match_enumeration(self):
+        """OHKO/2HKO chances equal brute-force enumeration over every pair of outcomes"""
+        attacker = create_test_pokemon(attack=120)
+        defender = create_test_pokemon(defense=40)
+        dist = compute_distribution(attacker, defender, tackle(accuracy=90), rolls=GEN4_DAMAGE_ROLLS)
+        outcomes = np.flatnonzero(dist.probs)
+        hp = int(dist.mean * 1.5)
+
+        two_turns = sum(dist.probs[a] * dist.probs[b]
+                        for a, b in itertools.product(outcomes, repeat=2) if a + b >= hp)
+
+        ohko, thko = dist.ko_chances(hp, turns=2)
+        assert ohko == pytest.approx(dist.probs[hp:].sum())
+        assert thko == pytest.approx(two_turns)
+        assert dist.ko_chances(0) == [1.0, 1.0]
+        assert dist.ko_chances(dist.max * 3) == [0.0, 0.0]
+
+    def test_ko_probabilities_use_current_hp(self):
+        """ko_probabilities reads the defender's remaining HP"""
+        attacker, defender, move = create_test_pokemon(), create_test_pokemon(), tackle()
+        defender.battle_stats.current_hp = 1
+
+        assert ko_probabilities(attacker, defender, move) == [1.0, 1.0]
+
+    def test_cached_per_stats_and_move(self):
+        """Repeat lookups hit the cache; a stat stage change is a different key"""
+        attacker, defender, move = create_test_pokemon(), create_test_pokemon(), tackle()
+
+        first = damage_distribution.damage_distribution(attacker, defender, move)
+        assert damage_distribution.damage_distribution(attacker, defender, move) is first
+        attacker.battle_stats.stat_modifiers["attack"] = 2
+        boosted = damage_distribution.damage_distribution(attacker, defender, move)
+
+        assert boosted.mean > first.mean
+        assert damage_distribution.cache_info() == {"hits": 1, "misses": 2, "size": 2}
@@ -0,0 +1,97 @@
+"""Unit tests for the greedy AI's evaluation cache"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models import evaluation_cache
+from models.player import Player
+from models.sim_battle import SimBattle, play_out
+from models.types import Type
+from tests.fixtures.pokemon_data import create_test_pokemon, create_test_move
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    evaluation_cache.clear_cache()
+    yield
+    evaluation_cache.clear_cache()
+
+
+def build_battle():
+    ours = create_test_pokemon("Ours", types=[Type.WATER], moves=[
+        create_test_move("Tackle", 40, Type.NORMAL),
+        create_test_move("Water Gun", 40, Type.WATER, pp=1),
+    ])
+    bench = create_test_pokemon("Bench", types=[Type.GRASS], moves=[create_test_move("Vine Whip", 45, Type.GRASS)])
+    theirs = create_test_pokemon("Theirs", types=[Type.FIRE], moves=[create_test_move("Ember", 40, Type.FIRE)])
+    return SimBattle(Player("Us", True, [ours, bench]), Player("Them", True, [theirs]))
+
+
+class TestEvaluationCache:
+
+    def test_repeat_lookup_hits(self):
+        """The same pairing is scored once and then served from the cache"""
+        battle = build_battle()
+
+        first = battle.make_ai_action(battle.player, battle.opponent)
+        second = battle.make_ai_action(battle.player, battle.opponent)
+
+        assert first.move.name == second.move.name == "Water Gun"
+        assert evaluation_cache.cache_info()["hits"] == 1
+        assert evaluation_cache.cache_info()["misses"] == 1
+
+    def test_key_ignores_hp_but_not_pp(self):
+        """Losing HP reuses the entry; running out of PP for a move re-scores"""
+        battle = build_battle()
+        ours = battle.player.active_pokemon()
+        battle.make_ai_action(battle.player, battle.opponent)
+
+        ours.battle_stats.current_hp -= 10
+        battle.make_ai_action(battle.player, battle.opponent)
+        assert evaluation_cache.cache_info()["hits"] == 1
+
+        ours.battle_stats.use_pp("Water Gun")
+        action = battle.make_ai_action(battle.player, battle.opponent)
+        assert action.move.name == "Tackle"
+        assert evaluation_cache.cache_info()["misses"] == 2
+
+    def test_same_key_returns_each_attackers_own_move(self):
+        """Moves that match on name, type and power share an entry, but each attacker gets its own Move"""
+        sure = create_test_move("Flame", 80, Type.FIRE, accuracy=100, priority=0)
+        wild = create_test_move("Flame", 80, Type.FIRE, accuracy=30, priority=1)
+        first = create_test_pokemon("First", types=[Type.FIRE], moves=[sure])
+        second = create_test_pokemon("Second", types=[Type.FIRE], moves=[wild])
+        theirs = create_test_pokemon("Theirs", types=[Type.GRASS], moves=[create_test_move("Vine Whip", 45, Type.GRASS)])
+        battle = SimBattle(Player("Us", True, [first, second]), Player("Them", True, [theirs]))
+
+        assert battle.make_ai_action(battle.player, battle.opponent).move is sure
+        battle.player.active_index = 1
+        action = battle.make_ai_action(battle.player, battle.opponent)
+
+        assert evaluation_cache.cache_info()["hits"] == 1
+        assert action.move is wild
+
+    def test_matches_uncached_play(self):
+        """Battles play out the same with and without the cache"""
+        results = []
+        for use_cache in (True, False):
+            random.seed(0)      # same IVs and battle stream both times
+            battle = build_battle()
+            battle.use_evaluation_cache = use_cache
+            results.append(battle.choose_best_counter(battle.player, battle.opponent.active_pokemon()))
+            results.append(play_out(battle).turns)
+
+        assert results[:2] == results[2:]
+
+    def test_bounded(self, monkeypatch):
+        """The oldest entries are evicted once the table is full"""
+        monkeypatch.setattr(evaluation_cache, "CACHE_SIZE", 2)
+        for key in ("a", "b", "c"):
+            evaluation_cache.cached(key, lambda: key)
+
+        info = evaluation_cache.cache_info()
+        assert info["size"] == 2
+        assert evaluation_cache.cached("a", lambda: "recomputed") == "recomputed"
+        assert evaluation_cache.cache_info()["hit_rate"] == 0.0
@@ -0,0 +1,54 @@
+"""Unit tests for the learnset index"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.learnset import Learnset
+
+ROWS = [
+    ("thunderbolt", "machine", "heartgold-soulsilver", 0),
+    ("thunder", "level-up", "heartgold-soulsilver", 37),
+    ("thunder-shock", "level-up", "heartgold-soulsilver", 1),
+    ("thunder-shock", "level-up", "red-blue", 1),
+    ("growl", "level-up", "heartgold-soulsilver", 5),
+    ("quick-attack", "level-up", "heartgold-soulsilver", 13),
+    ("quick-attack", "level-up", "heartgold-soulsilver", 1),
+    ("thunder-wave", "level-up", "red-blue", 9),
+]
+
+
+@pytest.fixture
+def learnset():
+    return Learnset(ROWS)
+
+
+class TestLearnset:
+
+    def test_moves_at_level_sorted_by_level(self, learnset):
+        assert learnset.moves_at_level(1) == ("thunder-shock", "quick-attack")
+        assert learnset.moves_at_level(13) == ("thunder-shock", "quick-attack", "growl")
+        assert learnset.moves_at_level(100) == ("thunder-shock", "quick-attack", "growl", "thunder")
+
+    def test_source_order(self, learnset):
+        assert learnset.moves_at_level(36, source_order=True) == ("thunder-shock", "growl", "quick-attack")
+
+    def test_duplicates_keep_lowest_level(self, learnset):
+        assert learnset.moves_at_level(1).count("quick-attack") == 1
+
+    def test_other_methods_and_version_groups(self, learnset):
+        assert learnset.moves_at_level(50, method="machine") == ("thunderbolt",)
+        assert learnset.moves_at_level(5, version_group="red-blue") == ("thunder-shock",)
+        assert learnset.moves_at_level(5, version_group="crystal") == ()
+
+    def test_all_version_groups(self, learnset):
+        assert learnset.version_groups() == ["heartgold-soulsilver", "red-blue"]
+        assert learnset.methods() == ["level-up", "machine"]
+        assert learnset.moves_at_level_by_version_group(10) == {
+            "heartgold-soulsilver": ("thunder-shock", "quick-attack", "growl"),
+            "red-blue": ("thunder-shock", "thunder-wave"),
+        }
+
+    def test_iterates_rows(self, learnset):
+        assert list(learnset) == ROWS
+        assert len(learnset) == len(ROWS)
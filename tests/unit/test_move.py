@@ -61,8 +61,8 @@ class TestMove:
         for _ in range(10):
             # Mock critical hit to always be False for consistent testing
             original_crit = fire_move.calculate_critical_hit_chance
-            fire_move.calculate_critical_hit_chance = lambda attacker: False
-            normal_move.calculate_critical_hit_chance = lambda attacker: False
+            fire_move.calculate_critical_hit_chance = lambda attacker, rng=None: False
+            normal_move.calculate_critical_hit_chance = lambda attacker, rng=None: False
             
             stab_damage, _ = fire_move.apply_damage(charizard, blastoise)
             no_stab_damage, _ = normal_move.apply_damage(charizard, blastoise)
@@ -135,7 +135,7 @@ class TestMove:
         
         # Mock the critical hit calculation to always return True
         original_calc = move.calculate_critical_hit_chance
-        move.calculate_critical_hit_chance = lambda attacker: True
+        move.calculate_critical_hit_chance = lambda attacker, rng=None: True
         
         crit_damage, is_critical = move.apply_damage(charizard, blastoise)
         
@@ -143,7 +143,7 @@ class TestMove:
         move.calculate_critical_hit_chance = original_calc
         
         # Mock to always return False
-        move.calculate_critical_hit_chance = lambda attacker: False
+        move.calculate_critical_hit_chance = lambda attacker, rng=None: False
         normal_damage, is_normal = move.apply_damage(charizard, blastoise)
         
         # Restore original method
@@ -154,6 +154,18 @@ class TestMove:
         # Critical hit should do roughly double damage (accounting for rounding)
         assert crit_damage >= normal_damage * 1.8  # Allow some variance for rounding
     
+    def test_roll_damage_uses_chance(self, charizard, blastoise):
+        """roll_damage asks the given chance() about the crit, with the move's crit rate"""
+        move = create_test_move("Test Move", power=50, move_type=Type.NORMAL)
+        asked = []
+
+        crit_damage, is_critical = move.roll_damage(charizard, blastoise, lambda p: asked.append(p) or True)
+
+        assert asked == [move.critical_hit_chance()]
+        assert is_critical and crit_damage == move.compute_damage(charizard, blastoise, True)
+        assert move.roll_damage(charizard, blastoise, lambda p: False) == (
+            move.compute_damage(charizard, blastoise, False), False)
+
     def test_move_accuracy(self):
         """Test move accuracy values"""
         perfect_move = create_test_move("Perfect Move", accuracy=100)
@@ -1,4 +1,5 @@
 """Unit tests for Pokemon class"""
+import json
 import pytest
 import sys
 import os
@@ -101,4 +102,39 @@ class TestPokemon:
         
         # Test non-existent move
         nonexistent = charizard.get_move_by_name("Nonexistent Move")
-        assert nonexistent is None
\ No newline at end of file
+        assert nonexistent is None
+
+    def test_reset_battle_state(self, charizard):
+        """Resetting restores full HP, PP, no status and no stat stages"""
+        move = charizard.moves[0]
+        charizard.take_damage(50)
+        charizard.battle_stats.use_pp(move.name)
+        charizard.battle_stats.apply_status("burn")
+        charizard.battle_stats.apply_stat_change("attack", 2)
+
+        charizard.reset_battle_state()
+
+        assert charizard.battle_stats.current_hp == charizard.stats["hp"]
+        assert charizard.battle_stats.pp[move.name] == move.pp
+        assert charizard.battle_stats.status is None
+        assert charizard.battle_stats.stat_modifiers["attack"] == 0
+
+    def test_reset_battle_state_with_new_ivs(self, charizard):
+        """New IVs recalculate the stats the battle state starts from"""
+        ivs = {stat: 31 for stat in charizard.iv}
+        expected = Pokemon(charizard.name, charizard.ability, charizard.base_stats, charizard.types,
+                           charizard.moves, charizard.level, ivs, charizard.ev).stats
+
+        charizard.reset_battle_state(ivs)
+
+        assert charizard.stats == expected
+        assert charizard.battle_stats.current_hp == expected["hp"]
+        assert charizard.battle_stats.battle_stats["speed"] == expected["speed"]
+
+    def test_stat_views_copy_to_dicts(self, charizard):
+        """iv, ev and stats copy out to plain dicts that json can serialise"""
+        stats = charizard.stats.copy()
+        stats["hp"] = 1
+
+        assert charizard.stats["hp"] != 1
+        assert json.loads(json.dumps(charizard.iv.copy())) == dict(charizard.iv)
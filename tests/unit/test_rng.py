@@ -0,0 +1,72 @@
+"""Unit tests for the battle engine's random streams"""
+import pytest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from models.battle_manager import BattleManager
+from models.battle_state import snapshot, restore
+from models.rng import SimRNG, battle_rng
+from models.sim_battle import SimBattle, play_out
+from tests.integration.test_sim_battle import build_battle
+
+
+class TestBattleRNG:
+
+    def test_seeded_from_random_module(self):
+        """Unseeded battle RNGs follow random.seed(), so whole runs stay reproducible"""
+        random.seed(4)
+        first = battle_rng().random()
+        random.seed(4)
+
+        assert battle_rng().random() == first
+        assert battle_rng(9).random() == random.Random(9).random()
+
+
+class TestSimRNG:
+
+    def test_randint_covers_range_uniformly(self):
+        rng = SimRNG(0)
+        rolls = [rng.randint(1, 3) for _ in range(30000)]
+
+        assert set(rolls) == {1, 2, 3}
+        assert all(abs(rolls.count(v) / len(rolls) - 1 / 3) < 0.02 for v in (1, 2, 3))
+
+    def test_state_round_trip(self):
+        rng = SimRNG(1)
+        rng.randint(0, 31)
+        state = rng.getstate()
+        expected = [rng.randint(0, 31) for _ in range(20)]
+
+        rng.setstate(state)
+
+        assert [rng.randint(0, 31) for _ in range(20)] == expected
+
+
+class TestBattleStreams:
+
+    @pytest.mark.parametrize("rng_factory", [random.Random, SimRNG])
+    def test_battle_replays_from_its_seed(self, rng_factory):
+        """A battle's outcome depends on its own seed, not on the random module"""
+        random.seed(1)
+        first = build_battle(SimBattle, seed=2, rng=rng_factory(11)).run()
+        random.seed(99)
+        second = build_battle(SimBattle, seed=2, rng=rng_factory(11)).run()
+
+        assert first == second
+
+    def test_engines_agree_on_a_shared_seed(self, capsys):
+        """BattleManager's crit rolls come from the battle's stream too, so it matches SimBattle"""
+        expected = play_out(build_battle(BattleManager, seed=3, rng=random.Random(8)))
+
+        assert build_battle(SimBattle, seed=3, rng=random.Random(8)).run() == expected
+
+    def test_snapshot_carries_sim_rng_state(self):
+        battle = build_battle(SimBattle, seed=5, rng=SimRNG(3))
+        state = snapshot(battle)
+
+        first = play_out(battle)
+        restore(battle, state)
+
+        assert play_out(battle) == first
@@ -0,0 +1,42 @@
+import pytest
+import json
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from data.api_client.save_utils import save_json
+
+
+class TestSaveJson:
+
+    def test_writes_valid_json_array(self, tmp_path):
+        """Output parses back to the records that went in"""
+        records = [{"id": i, "name": f"move-{i}"} for i in range(5)]
+
+        count = save_json("moves.json", records, directory=str(tmp_path))
+
+        assert count == 5
+        with open(tmp_path / "moves.json") as f:
+            assert json.load(f) == records
+
+    def test_empty_input(self, tmp_path):
+        """No records still produces a valid (empty) array"""
+        save_json("moves.json", iter(()), directory=str(tmp_path))
+
+        with open(tmp_path / "moves.json") as f:
+            assert json.load(f) == []
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """A crash mid-stream leaves the old file intact and no temp file behind"""
+        save_json("moves.json", [{"id": 1}], directory=str(tmp_path))
+
+        def broken():
+            yield {"id": 2}
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            save_json("moves.json", broken(), directory=str(tmp_path))
+
+        with open(tmp_path / "moves.json") as f:
+            assert json.load(f) == [{"id": 1}]
+        assert not os.path.exists(tmp_path / "moves.json.tmp")
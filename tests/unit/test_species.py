@@ -0,0 +1,74 @@
+"""Unit tests for the species index"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from data import loaders
+from data.loaders import get_species, load_pokemon, get_move_lookup
+from models.types import Type
+
+
+def record(dex_id, name, types, learnset=()):
+    return {
+        "id": dex_id,
+        "name": name,
+        "types": types,
+        "stats": {"hp": 35, "attack": 55, "defense": 40, "special-attack": 50, "special-defense": 50, "speed": 90},
+        "sprites": {"front_default": None, "back_default": None},
+        "abilities": ["static"],
+        "learnset": list(learnset),
+    }
+
+
+@pytest.fixture(autouse=True)
+def pokemon_data(monkeypatch):
+    monkeypatch.setitem(loaders._loaded, "pokemon", [
+        record(25, "pikachu", ["electric"], [
+            ("thunder-shock", "level-up", "heartgold-soulsilver", 1),
+            ("growl", "level-up", "heartgold-soulsilver", 1),
+        ]),
+        record(122, "mr-mime", ["psychic", "fairy"]),
+    ])
+    monkeypatch.delitem(loaders._loaded, "species_index", raising=False)
+    yield
+    loaders._loaded.pop("species_index", None)
+
+
+class TestSpecies:
+
+    def test_lookup_by_name_and_id(self):
+        pikachu = get_species("pikachu")
+
+        assert get_species("Pikachu") is pikachu
+        assert get_species(25) is pikachu
+        assert get_species("25") is pikachu
+        assert get_species("Mr Mime").id == 122
+
+    def test_record_is_parsed_and_immutable(self):
+        species = get_species("mr-mime")
+
+        assert species.types == (Type.PSYCHIC, Type.FAIRY)
+        assert species.base_stats.sp_attack == 50
+        with pytest.raises(AttributeError):
+            species.name = "missingno"
+
+    def test_unknown_species(self):
+        with pytest.raises(ValueError):
+            get_species("missingno")
+        with pytest.raises(ValueError):
+            get_species(999)
+
+    def test_index_built_once(self):
+        get_species("pikachu")
+        index = loaders._loaded["species_index"]
+        get_species(122)
+
+        assert loaders._loaded["species_index"] is index
+
+    def test_load_pokemon_uses_species(self):
+        pikachu = load_pokemon("PIKACHU", get_move_lookup())
+
+        assert pikachu.name == "pikachu"
+        assert pikachu.types == [Type.ELECTRIC]
+        assert [m.name for m in pikachu.moves] == ["thunder-shock", "growl"]
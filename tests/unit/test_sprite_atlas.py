@@ -0,0 +1,116 @@
+"""Unit tests for the sprite atlas"""
+import pytest
+import io
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from graphics import sprite_atlas
+from graphics.sprite_atlas import build_atlas, sprite_urls, SpriteAtlas
+
+COLOURS = {
+    "http://sprites/1.png": (255, 0, 0, 255),
+    "http://sprites/back/1.png": (0, 255, 0, 255),
+    "http://sprites/4.png": (0, 0, 255, 255),
+}
+
+
+def png(colour, size=(8, 6)):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(colour)
+    buf = io.BytesIO()
+    pygame.image.save(surface, buf, "sprite.png")
+    return buf.getvalue()
+
+
+class FakeSpriteCache:
+    def get(self, url):
+        return png(COLOURS[url]) if url in COLOURS else None
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    screen = pygame.display.set_mode((40, 40))
+    yield screen
+    pygame.display.quit()
+
+
+class TestSpriteAtlas:
+
+    def test_sprite_urls(self):
+        pokemon_data = [
+            {"sprites": {"front_default": "http://sprites/1.png", "back_default": "http://sprites/back/1.png"}},
+            {"sprites": {"front_default": "http://sprites/4.png", "back_default": None}},
+        ]
+        assert sprite_urls(pokemon_data) == list(COLOURS)
+
+    def test_build_packs_pages(self, tmp_path):
+        urls = list(COLOURS) + ["http://sprites/missing.png"]
+        index = build_atlas(urls, output_dir=str(tmp_path), sprite_cache=FakeSpriteCache(), page_size=16)
+
+        # 16px pages fit two 8x6 sprites per shelf, so three sprites still fit on one page
+        assert index["pages"] == ["atlas_0.png"]
+        assert set(index["sprites"]) == set(COLOURS)
+        assert (tmp_path / "index.json").exists()
+
+    def test_spills_onto_more_pages(self, tmp_path):
+        index = build_atlas(list(COLOURS), output_dir=str(tmp_path), sprite_cache=FakeSpriteCache(), page_size=8)
+
+        assert len(index["pages"]) == 3
+
+    def test_load_and_blit(self, tmp_path, display):
+        build_atlas(list(COLOURS), output_dir=str(tmp_path), sprite_cache=FakeSpriteCache(), page_size=16)
+        atlas = SpriteAtlas.load(str(tmp_path))
+
+        assert len(atlas) == 3
+        assert "http://sprites/4.png" in atlas
+        assert tuple(atlas.get("http://sprites/4.png").get_at((0, 0))) == COLOURS["http://sprites/4.png"]
+        assert atlas.get("http://sprites/4.png").get_size() == (8, 6)
+
+        display.fill((0, 0, 0))
+        assert atlas.blit(display, "http://sprites/back/1.png", (20, 20))
+        assert tuple(display.get_at((20, 20)))[:3] == (0, 255, 0)
+        assert not atlas.blit(display, "http://sprites/missing.png", (20, 20))
+
+    def test_standalone_surfaces_are_bounded(self, tmp_path, display, monkeypatch):
+        """get() keeps only the most recently used Surfaces"""
+        monkeypatch.setattr(sprite_atlas, "SURFACE_CACHE_SIZE", 2)
+        build_atlas(list(COLOURS), output_dir=str(tmp_path), sprite_cache=FakeSpriteCache())
+        atlas = SpriteAtlas.load(str(tmp_path))
+        first, second, third = COLOURS
+
+        atlas.get(first)
+        atlas.get(second)
+        atlas.get(first)
+        atlas.get(third)
+
+        assert list(atlas._surfaces) == [first, third]
+
+    def test_transparent_border_is_cropped(self, tmp_path, display):
+        class BorderedSprite:
+            def get(self, url):
+                surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+                surface.fill((255, 0, 0, 255), pygame.Rect(12, 2, 4, 5))
+                buf = io.BytesIO()
+                pygame.image.save(surface, buf, "sprite.png")
+                return buf.getvalue()
+
+        index = build_atlas(["http://sprites/25.png"], output_dir=str(tmp_path), sprite_cache=BorderedSprite())
+        atlas = SpriteAtlas.load(str(tmp_path))
+
+        assert index["sprites"]["http://sprites/25.png"] == [0, 0, 0, 4, 5, 12, 2, 20, 20]
+        assert atlas.pages[0].get_size() == (4, 5)
+
+        # Drawn exactly where the uncropped 20x20 sprite would have been
+        display.fill((0, 0, 0))
+        atlas.blit(display, "http://sprites/25.png", (20, 20))
+        assert tuple(display.get_at((10 + 12, 10 + 2)))[:3] == (255, 0, 0)
+        assert tuple(display.get_at((10 + 11, 10 + 2)))[:3] == (0, 0, 0)
+        assert atlas.get("http://sprites/25.png").get_size() == (20, 20)
+        assert tuple(atlas.get("http://sprites/25.png").get_at((12, 2))) == (255, 0, 0, 255)
+
+    def test_load_missing_atlas(self, tmp_path):
+        assert SpriteAtlas.load(str(tmp_path)) is None
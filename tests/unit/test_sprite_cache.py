@@ -0,0 +1,83 @@
+"""Unit tests for the on-disk sprite cache"""
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from data.sprite_cache import SpriteCache
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        return FakeResponse(url.encode() * 10)
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def cache(tmp_path, session):
+    return SpriteCache(cache_dir=str(tmp_path), max_bytes=10_000, offline=False, session=session)
+
+
+class TestSpriteCache:
+
+    def test_downloads_once_then_reads_from_disk(self, cache, session, tmp_path):
+        first = cache.get("http://sprites/25.png")
+        fresh = SpriteCache(cache_dir=str(tmp_path), offline=True)
+
+        assert cache.get("http://sprites/25.png") == first
+        assert fresh.get("http://sprites/25.png") == first
+        assert session.requested == ["http://sprites/25.png"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_offline_miss_returns_none(self, tmp_path, session):
+        cache = SpriteCache(cache_dir=str(tmp_path), offline=True, session=session)
+
+        assert cache.get("http://sprites/1.png") is None
+        assert session.requested == []
+
+    def test_no_url(self, cache, session):
+        assert cache.get(None) is None
+        assert session.requested == []
+
+    def test_evicts_least_recently_used(self, tmp_path, session):
+        url_size = len(b"http://sprites/1.png") * 10
+        cache = SpriteCache(cache_dir=str(tmp_path), max_bytes=url_size * 2, offline=False, session=session)
+
+        cache.get("http://sprites/1.png")
+        cache.get("http://sprites/2.png")
+        os.utime(cache.path_for("http://sprites/1.png"), ns=(1, 1))
+        os.utime(cache.path_for("http://sprites/2.png"), ns=(2, 2))
+        cache.get("http://sprites/1.png")  # hit: now the most recently used
+        cache.get("http://sprites/3.png")
+
+        assert os.path.exists(cache.path_for("http://sprites/1.png"))
+        assert not os.path.exists(cache.path_for("http://sprites/2.png"))
+        assert os.path.exists(cache.path_for("http://sprites/3.png"))
+
+    def test_clear(self, cache):
+        cache.get("http://sprites/1.png")
+        cache.clear()
+
+        assert not os.path.exists(cache.path_for("http://sprites/1.png"))
+
+    def test_contains(self, cache):
+        assert not cache.contains("http://sprites/1.png")
+        cache.get("http://sprites/1.png")
+        assert cache.contains("http://sprites/1.png")
+        assert not cache.contains(None)
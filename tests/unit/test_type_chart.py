@@ -4,7 +4,12 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from models.type_chart import get_type_multiplier
+import numpy as np
+
+from models.type_chart import (
+    get_type_multiplier, type_effectiveness, effectiveness_matrix, defender_key,
+    TYPE_EFFECTIVENESS, TYPE_MATRIX, TYPE_INDEX, DUAL_TYPE_MATRIX,
+)
 from models.types import Type
 
 
@@ -152,4 +157,54 @@ class TestTypeChart:
             for defend_type in expected_types:
                 multiplier = get_type_multiplier(attack_type, defend_type)
                 assert isinstance(multiplier, (int, float))
-                assert multiplier >= 0.0
\ No newline at end of file
+                assert multiplier >= 0.0
+
+
+class TestTypeMatrix:
+
+    def test_matrix_matches_chart(self):
+        """Every cell of the dense matrix agrees with the dict chart"""
+        for attacking in Type:
+            for defending in Type:
+                expected = TYPE_EFFECTIVENESS.get(attacking, {}).get(defending, 1.0)
+                assert TYPE_MATRIX[TYPE_INDEX[attacking], TYPE_INDEX[defending]] == expected
+
+    def test_dual_type_is_product(self):
+        """Dual-type defenders multiply both matchups"""
+        # Electric vs Water/Flying (Gyarados) is 4x, Ground vs Fire/Flying is immune
+        assert type_effectiveness(Type.ELECTRIC, [Type.WATER, Type.FLYING]) == 4.0
+        assert type_effectiveness(Type.GROUND, [Type.FIRE, Type.FLYING]) == 0.0
+        assert type_effectiveness(Type.FIRE, [Type.WATER, Type.GRASS]) == 1.0
+
+    def test_single_type_not_squared(self):
+        """Single-typed defenders use the diagonal of the dual table"""
+        assert defender_key([Type.WATER]) == (TYPE_INDEX[Type.WATER], TYPE_INDEX[Type.WATER])
+        assert type_effectiveness(Type.ELECTRIC, [Type.WATER]) == 2.0
+        assert type_effectiveness(Type.FIRE, [Type.WATER]) == 0.5
+
+    def test_effectiveness_matrix(self):
+        """Many moves against many defenders in one call matches the scalar lookups"""
+        moves = [Type.WATER, Type.ELECTRIC, Type.GROUND]
+        defenders = [[Type.FIRE], [Type.WATER, Type.FLYING], [Type.ROCK, Type.GROUND], [Type.GHOST]]
+
+        result = effectiveness_matrix(moves, defenders)
+
+        assert result.shape == (3, 4)
+        for i, move_type in enumerate(moves):
+            for j, types in enumerate(defenders):
+                assert result[i, j] == type_effectiveness(move_type, types)
+
+    def test_effectiveness_matrix_accepts_ordinals(self):
+        """Precomputed defender keys and type ordinals work without conversion"""
+        keys = np.array([defender_key([Type.WATER, Type.FLYING]), defender_key([Type.FIRE])])
+
+        result = effectiveness_matrix([TYPE_INDEX[Type.ELECTRIC]], keys)
+
+        assert result.tolist() == [[4.0, 1.0]]
+
+    def test_tables_are_read_only(self):
+        """The shared tables can't be modified by accident"""
+        with pytest.raises(ValueError):
+            TYPE_MATRIX[0, 0] = 3.0
+        with pytest.raises(ValueError):
+            DUAL_TYPE_MATRIX[0, 0, 0] = 3.0